@@ -0,0 +1,48 @@
+import tarfile
+import zipfile
+
+import pytest
+
+from translator.artifacts import ArtifactWriter
+from translator.core import EnglishToCodeTranslator
+from translator.planners.heuristic import HeuristicPlanner
+
+
+def test_artifact_writer_directory_mode_flushes_on_close(tmp_path) -> None:
+    writer = ArtifactWriter(root=str(tmp_path / "out"), fsync_batch_size=1)
+    location = writer.write_text("000_item/output.python.txt", "print('hi')\n")
+    writer.close()
+    assert (tmp_path / "out" / "000_item" / "output.python.txt").read_text(encoding="utf-8") == "print('hi')\n"
+    assert location.endswith("output.python.txt")
+    assert writer.written == 1
+
+
+def test_artifact_writer_rejects_unknown_bundle_suffix(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        ArtifactWriter(bundle=str(tmp_path / "out.rar"))
+
+
+@pytest.mark.parametrize("bundle_name", ["bundle.zip", "bundle.tar"])
+def test_translate_batch_streams_artifacts_into_bundle(tmp_path, bundle_name) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    bundle = tmp_path / bundle_name
+    batch = [
+        {"prompt": "Create a player that can jump", "target": "python"},
+        {"prompt": "Spawn enemy when timer reaches zero", "target": "cpp"},
+    ]
+    results = translator.translate_batch(
+        batch,
+        default_target="python",
+        include_explain=True,
+        artifact_bundle=str(bundle),
+        swarm_workers=2,
+    )
+    assert all(item["artifact_bundle"] == str(bundle) for item in results)
+    if bundle_name.endswith(".zip"):
+        with zipfile.ZipFile(bundle) as zf:
+            names = set(zf.namelist())
+    else:
+        with tarfile.open(bundle) as tf:
+            names = set(tf.getnames())
+    assert {item["artifact_output_file"] for item in results} <= names
+    assert {item["artifact_plan_file"] for item in results} <= names
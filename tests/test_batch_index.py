@@ -0,0 +1,50 @@
+import gzip
+import json
+
+from translator.batch_index import JsonlIndex, load_jsonl_items
+from translator.cli import _load_batch_items
+
+
+def _write_batch(path, count):
+    lines = [json.dumps({"prompt": f"Create jump {i}", "target": "python"}) for i in range(count)]
+    lines.insert(2, "   ")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_jsonl_index_random_access_and_saved_index(tmp_path) -> None:
+    batch = tmp_path / "batch.jsonl"
+    _write_batch(batch, 5)
+    index = JsonlIndex.load_or_build(str(batch))
+    assert len(index) == 5
+    assert index.read(3)["prompt"] == "Create jump 3"
+    assert [item["prompt"] for item in index.read_many([4, 0])] == ["Create jump 4", "Create jump 0"]
+    assert (tmp_path / "batch.jsonl.idx").exists()
+
+    reloaded = JsonlIndex.load(str(batch))
+    assert reloaded is not None
+    assert list(reloaded.offsets) == list(index.offsets)
+
+
+def test_jsonl_index_is_rebuilt_when_file_changes(tmp_path) -> None:
+    batch = tmp_path / "batch.jsonl"
+    _write_batch(batch, 2)
+    JsonlIndex.load_or_build(str(batch))
+    _write_batch(batch, 4)
+    assert JsonlIndex.load(str(batch)) is None
+    assert len(JsonlIndex.load_or_build(str(batch))) == 4
+
+
+def test_parallel_parse_matches_sequential_order(tmp_path) -> None:
+    batch = tmp_path / "batch.jsonl"
+    _write_batch(batch, 9)
+    sequential = load_jsonl_items(str(batch), workers=1)
+    parallel = load_jsonl_items(str(batch), workers=3)
+    assert parallel == sequential
+    assert [item["prompt"] for item in parallel] == [f"Create jump {i}" for i in range(9)]
+
+
+def test_load_batch_items_streams_gzip_jsonl(tmp_path) -> None:
+    batch = tmp_path / "batch.jsonl.gz"
+    with gzip.open(batch, "wt", encoding="utf-8") as handle:
+        handle.write(json.dumps({"prompt": "Create jump"}) + "\n\n" + json.dumps({"prompt": "Spawn enemy"}) + "\n")
+    assert [item["prompt"] for item in _load_batch_items(str(batch))] == ["Create jump", "Spawn enemy"]
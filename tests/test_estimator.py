@@ -0,0 +1,71 @@
+import json
+
+from translator.cli import main
+from translator.core import EnglishToCodeTranslator
+from translator.estimator import BatchCostModel, predict_wall_ms
+from translator.planners.heuristic import HeuristicPlanner
+
+
+def _history_result(target: str, serial_ms: float, build_ms: float = 0.0) -> dict:
+    stages = {"plan": serial_ms / 2, "render": serial_ms / 2}
+    result = {"ok": True, "target": target, "mode": "gameplay", "elapsed_ms": serial_ms, "stage_timings_ms": stages}
+    if build_ms:
+        stages["build"] = build_ms
+        result["verify_build_ok"] = True
+    return result
+
+
+def test_threads_cannot_overlap_gil_bound_time() -> None:
+    assert predict_wall_ms(serial_ms=100.0, parallel_ms=0.0, longest_item_ms=1.0, workers=4, backend="threads") == 100.0
+    assert predict_wall_ms(serial_ms=100.0, parallel_ms=0.0, longest_item_ms=1.0, workers=4, backend="processes") == 25.0
+    assert predict_wall_ms(0.0, 800.0, 10.0, workers=8, backend="threads", provider_ms={"ollama": 800.0}, provider_concurrency={"ollama": 1}) == 800.0
+
+
+def test_cost_model_falls_back_to_similar_classes() -> None:
+    model = BatchCostModel()
+    model.add_results([_history_result("cpp", 4.0), {"ok": False, "target": "cpp"}])
+    assert model.cost(("cpp", "gameplay", False, False, "template")) == ((2.0 + 2.0, 0.0), "exact")
+    assert model.cost(("cpp", "automation", False, False, "template"))[1] == "target+flags+provider"
+    assert model.cost(("cpp", "gameplay", False, False, "openai")) == (None, "unknown")
+
+
+def test_estimate_uses_history_and_flags_dominant_classes(tmp_path) -> None:
+    history = [_history_result("python", 2.0) for _ in range(5)]
+    history += [_history_result("python", 2.0, build_ms=1.0) for _ in range(5)]
+    history += [_history_result("cpp", 2.0, build_ms=500.0) for _ in range(5)]
+    report = tmp_path / "report.json"
+    report.write_text(json.dumps({"results": history}), encoding="utf-8")
+    items = [{"prompt": f"item {i}", "target": "python"} for i in range(90)] + [{"prompt": f"c {i}", "target": "cpp"} for i in range(10)]
+
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    python_only = translator.estimate_batch_runtime(items[:90], default_target="python", history_reports=[str(report)])
+    assert python_only["calibrated_items"] == 0
+    assert python_only["serial_ms"] == 180.0
+    assert python_only["best_workers"] == 1
+
+    estimate = translator.estimate_batch_runtime(items, default_target="python", verify_build=True, history_reports=[str(report)])
+    assert estimate["dominant_classes"][0]["target"] == "cpp"
+    assert estimate["dominant_classes"][0]["share"] > 0.9
+    by_workers = {p["workers"]: p["wall_ms"] for p in estimate["predictions"] if p["backend"] == "threads"}
+    assert by_workers[8] < by_workers[1]
+    assert estimate["suggested_swarm_workers"] == estimate["best_workers"] > 1
+
+
+def test_estimate_calibrates_classes_missing_from_history() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    items = [{"prompt": "Create a player"}, {"prompt": "Spawn enemy", "target": "gdscript"}, {"prompt": "Jump"}]
+    estimate = translator.estimate_batch_runtime(items, default_target="python", calibration_per_class=1)
+    assert estimate["calibrated_items"] == 2
+    assert estimate["unknown_items"] == 0
+    assert {row["cost_source"] for row in estimate["classes"]} == {"exact"}
+
+
+def test_cli_batch_estimate_prints_json_without_running_batch(tmp_path, capsys) -> None:
+    batch = tmp_path / "batch.jsonl"
+    batch.write_text('{"prompt": "Create a player"}\n{"prompt": "Spawn enemy"}\n', encoding="utf-8")
+    output = tmp_path / "estimate.json"
+    main(["--target", "python", "--planner-provider", "heuristic", "--batch-input", str(batch), "--batch-estimate", "--batch-estimate-output", str(output)])
+    assert "[batch-estimate]" in capsys.readouterr().out
+    estimate = json.loads(output.read_text(encoding="utf-8"))
+    assert estimate["items"] == 2
+    assert estimate["calibrated_items"] == 2
@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+
+import translator.core as core_module
+from translator.core import EnglishToCodeTranslator
+from translator.memory import deep_sizeof
+from translator.planners.heuristic import HeuristicPlanner
+
+
+def test_deep_sizeof_follows_containers_and_counts_shared_objects_once() -> None:
+    payload = "x" * 10_000
+    assert deep_sizeof({"a": [payload]}) > 10_000
+    assert deep_sizeof([payload, payload]) < deep_sizeof([payload, "y" * 10_000])
+
+
+def test_memory_report_counts_cache_entries() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    translator.translate("Create a player", target="python", use_rag_cache=True)
+    translator.translate("Spawn an enemy", target="python", use_rag_cache=True)
+
+    report = translator.memory_report([{"index": 0, "explain": {"steps": ["a"]}}])
+    assert report["plan_cache"]["entries"] == 2
+    assert report["plan_cache"]["bytes"] > 0
+    assert report["rag_lattice"]["entries"] == 2
+    assert report["batch_results"]["explain_bytes"] > 0
+
+
+def test_track_memory_records_stage_memory_in_items_and_report(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner(), track_memory=True)
+    results = translator.translate_batch(
+        [{"prompt": "Create a player"}, {"prompt": "Spawn an enemy"}],
+        default_target="python",
+    )
+    assert {"plan", "render"} <= set(results[0]["stage_memory_kb"])
+    assert results[0]["stage_memory_kb"]["render"]["peak"] >= 0
+
+    report = json.loads(Path(translator.write_batch_report(results, str(tmp_path / "report.json"))).read_text(encoding="utf-8"))
+    assert report["stage_memory_kb"]["render"]["count"] == 2
+    assert report["memory"]["plan_cache"]["entries"] == 2
+    assert "stage_memory_kb" in translator.RUN_SPECIFIC_FIELDS
+
+
+def test_memory_budget_sheds_oldest_plan_cache_entries_first(monkeypatch) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner(), max_memory_mb=100)
+    for prompt in ("first prompt", "second prompt", "third prompt"):
+        translator.build_generation_plan(prompt)
+    budget = 100 * 1024 * 1024
+
+    monkeypatch.setattr(core_module, "current_rss_bytes", lambda: int(budget * 0.5))
+    assert translator.enforce_memory_budget() is None
+
+    translator.MEMORY_SHED_TARGET = translator.MEMORY_SHED_THRESHOLD
+    monkeypatch.setattr(core_module, "current_rss_bytes", lambda: int(budget * translator.MEMORY_SHED_THRESHOLD) + 1)
+    shed = translator.enforce_memory_budget()
+
+    assert shed == {"plan_cache_entries": 1, "rag_entries": 0}
+    assert [prompt for prompt, _ in translator._plan_cache] == ["second prompt", "third prompt"]
+    assert translator.memory_report()["sheds"]["events"] == 1
+
+
+def test_memory_budget_is_silent_once_caches_are_empty(monkeypatch, caplog) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner(), max_memory_mb=100)
+    translator.build_generation_plan("only prompt")
+    budget = 100 * 1024 * 1024
+    over = int(budget * translator.MEMORY_SHED_THRESHOLD) + 1
+    monkeypatch.setattr(core_module, "current_rss_bytes", lambda: over)
+
+    with caplog.at_level("WARNING", logger=core_module.logger.name):
+        assert translator.enforce_memory_budget() == {"plan_cache_entries": 1, "rag_entries": 0}
+        for _ in range(5):
+            assert translator.enforce_memory_budget() is None
+        translator.build_generation_plan("another prompt")
+        assert translator.enforce_memory_budget() == {"plan_cache_entries": 1, "rag_entries": 0}
+    assert translator.memory_report()["sheds"]["events"] == 2
+    assert len(caplog.records) == 1
+
+    # Dropping under the threshold re-arms the warning for the next crossing.
+    monkeypatch.setattr(core_module, "current_rss_bytes", lambda: int(budget * 0.5))
+    assert translator.enforce_memory_budget() is None
+    monkeypatch.setattr(core_module, "current_rss_bytes", lambda: over)
+    translator.build_generation_plan("third prompt")
+    with caplog.at_level("WARNING", logger=core_module.logger.name):
+        translator.enforce_memory_budget()
+    assert len(caplog.records) == 2
+
+
+def test_memory_budget_waits_for_caches_to_regrow_while_rss_stays_high(monkeypatch) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner(), max_memory_mb=100)
+    for index in range(4):
+        translator.build_generation_plan(f"prompt {index}")
+    budget = 100 * 1024 * 1024
+    # RSS does not fall after a shed, as when the allocator keeps freed pages.
+    monkeypatch.setattr(core_module, "current_rss_bytes", lambda: budget)
+
+    assert translator.enforce_memory_budget() == {"plan_cache_entries": 4, "rag_entries": 0}
+    for index in range(3):
+        translator.build_generation_plan(f"regrown {index}")
+        assert translator.enforce_memory_budget() is None
+    assert len(translator._plan_cache) == 3
+
+    translator.build_generation_plan("regrown 3")
+    assert translator.enforce_memory_budget() == {"plan_cache_entries": 4, "rag_entries": 0}
+    assert translator.memory_report()["sheds"]["events"] == 2
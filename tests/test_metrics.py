@@ -0,0 +1,73 @@
+import urllib.request
+
+from translator import metrics
+from translator.core import EnglishToCodeTranslator
+from translator.metrics import MetricsRegistry, exporting, serve_metrics
+from translator.planners.heuristic import HeuristicPlanner
+from translator.spans import NULL_SPAN, span
+from translator.tracing import TraceCollector
+
+
+def test_registry_renders_openmetrics_text() -> None:
+    registry = MetricsRegistry(buckets=(0.01, 0.1))
+    registry.inc("nevora_safety_blocks", pattern='rm -rf "/"')
+    registry.observe("nevora_stage_seconds", 0.05, stage="render")
+    text = registry.render()
+
+    assert "# TYPE nevora_safety_blocks counter" in text
+    assert 'nevora_safety_blocks_total{pattern="rm -rf \\"/\\""} 1' in text
+    assert 'nevora_stage_seconds_bucket{stage="render",le="0.01"} 0' in text
+    assert 'nevora_stage_seconds_bucket{stage="render",le="0.1"} 1' in text
+    assert 'nevora_stage_seconds_bucket{stage="render",le="+Inf"} 1' in text
+    assert text.endswith("# EOF\n")
+
+
+def test_metrics_are_noops_until_enabled() -> None:
+    assert metrics.active_registry() is None
+    metrics.inc("nevora_translate_calls")
+    assert span("render") is NULL_SPAN
+
+
+def test_batch_run_records_translator_metrics(tmp_path) -> None:
+    metrics_file = tmp_path / "metrics.prom"
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    with exporting(str(metrics_file), interval_s=60) as registry:
+        translator.translate_batch(
+            [{"prompt": "Create a player"}, {"prompt": "Create a player"}],
+            default_target="python",
+            verify_generated=True,
+        )
+        assert registry.counter_value("nevora_translate_calls", target="python", mode="gameplay", provider="custom") == 2
+        assert registry.counter_value("nevora_plan_cache_requests", result="miss") == 2
+        assert registry.counter_value("nevora_verify_results", target="python", result="pass") == 2
+    assert metrics.active_registry() is None
+
+    text = metrics_file.read_text(encoding="utf-8")
+    assert 'nevora_rag_lookups_total{result="hit"} 1' in text
+    assert 'nevora_stage_seconds_count{stage="render"} 2' in text
+
+
+
+def test_explain_does_not_count_a_second_plan_lookup(tmp_path) -> None:
+    trace = TraceCollector()
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner(), trace=trace)
+    with exporting(str(tmp_path / "metrics.prom"), interval_s=60) as registry:
+        translator.translate_batch([{"prompt": "Spawn an enemy"}], default_target="python", include_explain=True)
+        assert registry.counter_value("nevora_plan_cache_requests", result="miss") == 1
+        assert registry.counter_value("nevora_plan_cache_requests", result="hit") == 0
+    items = [event for event in trace.to_dict()["traceEvents"] if event["ph"] == "X" and event["cat"] == "item"]
+    assert items[0]["args"]["plan_cache_hit"] is False
+
+def test_http_endpoint_serves_metrics() -> None:
+    registry = MetricsRegistry()
+    registry.inc("nevora_planner_fallbacks", planner="openai")
+    server = serve_metrics(registry, port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode("utf-8")
+            assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert 'nevora_planner_fallbacks_total{planner="openai"} 1' in body
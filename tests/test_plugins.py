@@ -0,0 +1,72 @@
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from translator.core import EnglishToCodeTranslator
+from translator.planners.heuristic import HeuristicPlanner
+from translator.planners import registry as planner_registry
+from translator.targets import registry as renderer_registry
+
+
+class RustRenderer:
+    name = "rust"
+
+    def render(self, prompt, intent, mode="gameplay", plan=None) -> str:
+        return f"// {prompt}\nfn main() {{}}\n"
+
+
+class ShoutingPlanner(HeuristicPlanner):
+    def plan(self, prompt: str, mode: str = "gameplay"):
+        return super().plan(prompt.upper(), mode=mode)
+
+
+def _entry_points(**plugins):
+    loads: list[str] = []
+
+    def entry_point(name, obj):
+        return SimpleNamespace(name=name, load=lambda: loads.append(name) or obj)
+
+    return {name: entry_point(name, obj) for name, obj in plugins.items()}, loads
+
+
+def test_import_translator_and_single_target_render_stay_lazy() -> None:
+    script = (
+        "import sys, translator\n"
+        "assert 'translator.core' not in sys.modules\n"
+        "from translator.core import EnglishToCodeTranslator\n"
+        "t = EnglishToCodeTranslator(planner_provider='heuristic')\n"
+        "t.translate('Create a player', 'cpp')\n"
+        "loaded = sorted(m for m in sys.modules if m.startswith(('translator.targets.', 'translator.planners.')) and m.endswith(('_target', '_planner')))\n"
+        "print(loaded, t.renderers.loaded())\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parents[1]).stdout
+    assert out.strip() == "['translator.targets.cpp_target'] ['cpp']"
+
+
+def test_renderer_plugins_load_only_when_requested(monkeypatch) -> None:
+    plugins, loads = _entry_points(rust=RustRenderer, zig=RustRenderer)
+    monkeypatch.setattr(renderer_registry, "discover_entry_points", lambda group: plugins)
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+
+    assert {"python", "rust", "zig"} <= translator.supported_targets
+    assert translator.translate("Create a player", "python")
+    assert loads == []
+    assert translator.translate("Create a player", "rust") == "// Create a player\nfn main() {}\n"
+    assert loads == ["rust"]
+    with pytest.raises(ValueError, match="Unsupported target 'go'"):
+        translator.translate("Create a player", "go")
+
+
+def test_planner_plugins_resolve_by_name(monkeypatch) -> None:
+    plugins, _ = _entry_points(shouting=ShoutingPlanner)
+    monkeypatch.setattr(planner_registry, "discover_entry_points", lambda group: plugins)
+
+    assert planner_registry.available_planners() == ["heuristic", "openai", "huggingface", "shouting"]
+    translator = EnglishToCodeTranslator(planner_provider="shouting")
+    translator.translate("Create a player", "python")
+    assert translator.last_resolved_provider == "shouting"
+    with pytest.raises(ValueError, match="Unsupported planner_provider 'missing'"):
+        EnglishToCodeTranslator(planner_provider="missing")
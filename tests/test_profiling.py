@@ -0,0 +1,49 @@
+import pstats
+import threading
+import time
+
+import pytest
+
+from translator.cli import main
+from translator.profiling import StackSampler, profiling
+
+
+def test_cpu_profile_of_cli_run_writes_pstats_and_summary(tmp_path, capsys) -> None:
+    prefix = tmp_path / "profiles" / "run"
+    main(["--target", "python", "--planner-provider", "heuristic", "--prompt", "Create a player", "--profile", "cpu", "--profile-output", str(prefix)])
+
+    assert "[profile:cpu] written:" in capsys.readouterr().out
+    stats = pstats.Stats(str(tmp_path / "profiles" / "run.pstats"))
+    assert stats.total_calls > 0
+    assert "cumulative" in (tmp_path / "profiles" / "run.txt").read_text(encoding="utf-8")
+
+
+def test_alloc_profile_reports_top_lines(tmp_path) -> None:
+    with profiling("alloc", str(tmp_path / "run")) as written:
+        blob = [bytearray(1024) for _ in range(200)]
+    report = (tmp_path / "run.alloc.txt").read_text(encoding="utf-8")
+    assert written == [str(tmp_path / "run.alloc.txt")]
+    assert "test_profiling.py" in report
+    del blob
+
+
+def test_stack_sampler_covers_worker_threads() -> None:
+    def busy_worker() -> None:
+        deadline = time.perf_counter() + 0.2
+        while time.perf_counter() < deadline:
+            pass
+
+    sampler = StackSampler(interval_s=0.002).start()
+    worker = threading.Thread(target=busy_worker, name="swarm-worker")
+    worker.start()
+    worker.join()
+    sampler.stop()
+
+    assert sampler.samples > 0
+    assert any(line.startswith("swarm-worker;") and "busy_worker" in line for line in sampler.collapsed().splitlines())
+
+
+def test_unknown_profile_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        with profiling("heap"):
+            pass
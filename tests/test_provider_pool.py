@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+
+from translator.core import EnglishToCodeTranslator
+from translator.generators.anthropic_codegen import ProviderSetupError
+from translator.generators.provider_pool import ProviderLimits, ProviderPool
+from translator.planners.heuristic import HeuristicPlanner
+
+
+def test_provider_pool_retries_then_succeeds() -> None:
+    calls = []
+
+    def flaky(provider, **kwargs):
+        calls.append(provider)
+        if len(calls) == 1:
+            raise RuntimeError("Ollama generation failed: connection reset")
+        return "print('ok')"
+
+    pool = ProviderPool(limits={"ollama": ProviderLimits(retries=2, backoff_s=0.0)}, generate=flaky)
+    output, stats = pool.generate("ollama", "Create jump", "python")
+    assert output == "print('ok')"
+    assert stats["provider_attempts"] == 2
+    assert stats["provider_latency_ms"] >= 0
+
+
+def test_provider_pool_does_not_retry_missing_key_and_times_out() -> None:
+    calls = []
+
+    def missing_key(provider, **kwargs):
+        calls.append(provider)
+        raise ProviderSetupError("OPENAI_API_KEY is not set")
+
+    pool = ProviderPool(limits={"openai": ProviderLimits(retries=3, backoff_s=0.0)}, generate=missing_key)
+    with pytest.raises(ProviderSetupError):
+        pool.generate("openai", "Create jump", "python")
+    assert calls == ["openai"]
+
+    def slow(provider, **kwargs):
+        time.sleep(0.5)
+        return "late"
+
+    pool = ProviderPool(limits={"gemini": ProviderLimits(timeout_s=0.05, retries=0)}, generate=slow)
+    with pytest.raises(TimeoutError):
+        pool.generate("gemini", "Create jump", "python")
+
+
+def test_provider_pool_timeout_bounds_the_wait_for_a_held_slot() -> None:
+    release = threading.Event()
+
+    def hung(provider, **kwargs):
+        release.wait(5)
+        return "late"
+
+    pool = ProviderPool(limits={"ollama": ProviderLimits(concurrency=1, timeout_s=0.1, retries=1, backoff_s=0.0)}, generate=hung)
+    started = time.perf_counter()
+    try:
+        with pytest.raises(TimeoutError, match="free slot"):
+            pool.generate("ollama", "Create jump", "python")
+        # First attempt abandons the hung call; the retry cannot get its slot and gives up on time.
+        assert time.perf_counter() - started < 2
+    finally:
+        release.set()
+
+
+def test_translate_batch_with_provider_records_latency() -> None:
+    def fake(provider, prompt, target, mode, source_language, model):
+        return f"# {provider}:{model}:{target}\nprint({prompt!r})\n"
+
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    results = translator.translate_batch(
+        [{"prompt": "Create jump", "target": "python"}, {"prompt": "Spawn enemy", "target": "python", "model": "m2"}],
+        default_target="python",
+        verify_generated=True,
+        provider="claude",
+        model="m1",
+        provider_pool=ProviderPool(generate=fake),
+        swarm_workers=2,
+    )
+    assert [item["resolved_provider"] for item in results] == ["claude", "claude"]
+    assert results[0]["output"].startswith("# claude:m1:python")
+    assert results[1]["model"] == "m2"
+    assert all("provider_latency_ms" in item and item["verify_output_ok"] for item in results)
@@ -0,0 +1,186 @@
+import os
+import shutil
+import subprocess
+import sys
+import types
+
+import pytest
+
+from translator.core import EnglishToCodeTranslator
+from translator.planners.heuristic import HeuristicPlanner
+from translator.targets.base import intent_flags
+
+PERFORMANCE_TARGETS = ("python", "csharp", "cpp", "gdscript")
+
+
+def test_intent_flags_cover_tokens_and_singular_forms() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    intent = translator.plan_intent("Spawn enemies every timer tick")
+    flags = intent_flags("Spawn enemies every timer tick", intent)
+    assert flags["has_spawn"] and flags["has_timer"] and flags["has_enemies"]
+    assert "has_shoot" not in flags
+
+
+@pytest.mark.parametrize("target", PERFORMANCE_TARGETS)
+def test_performance_gameplay_templates_differ_from_default(target: str) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    prompt = "Spawn enemies and shoot projectiles every timer tick"
+    default = translator.translate(prompt, target)
+    performance = translator.translate(prompt, target, render_profile="performance")
+    assert performance != default
+    assert "Profile: performance" in performance
+    assert "{{" not in performance
+    assert default == translator.translate(prompt, target, render_profile="default")
+
+
+def test_performance_python_sections_follow_prompt_and_run() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    everything = translator.translate("Spawn enemies and shoot projectiles every timer tick", "python", render_profile="performance")
+    jump_only = translator.translate("Create a player that jumps", "python", render_profile="performance")
+    for name in ("ENEMY_POOL_SIZE", "def fire", "def on_timer", "FIXED_DT"):
+        assert name in everything
+    assert "FIXED_DT" in jump_only and "def fire" not in jump_only and "ENEMY_POOL_SIZE" not in jump_only
+    for source in (everything, jump_only):
+        assert translator.verify_output(source, "python")[0]
+        subprocess.run([sys.executable, "-c", source], check=True, timeout=30)
+
+
+def test_modes_without_profile_templates_fall_back_to_default() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    prompt = "Create a player that jumps"
+    assert translator.translate(prompt, "blueprint", render_profile="performance") == translator.translate(prompt, "blueprint")
+    assert translator.translate(prompt, "javascript", render_profile="performance") == translator.translate(prompt, "javascript")
+    assert translator.translate(prompt, "cpp", mode="web-backend", render_profile="performance") == translator.translate(prompt, "cpp", mode="web-backend")
+    with pytest.raises(ValueError, match="Unsupported render_profile"):
+        translator.translate(prompt, "python", render_profile="turbo")
+
+
+def test_batch_render_profile_enters_fingerprint_and_payload() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    items = [{"prompt": "Player can shoot", "target": "python"}, {"prompt": "Player can shoot", "target": "python", "render_profile": "default"}]
+    default_run = translator.translate_batch(items, default_target="python")
+    performance_run = translator.translate_batch(items, default_target="python", render_profile="performance")
+    assert "render_profile" not in default_run[0]
+    assert performance_run[0]["render_profile"] == "performance"
+    assert performance_run[0]["input_hash"] != default_run[0]["input_hash"]
+    # Items that set their own profile keep it.
+    assert "render_profile" not in performance_run[1]
+
+
+def test_performance_web_backend_templates_follow_intent_and_verify() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    prompt = "Authenticate the user, validate and save the request, then load the session"
+    python_source = translator.translate(prompt, "python", mode="web-backend", render_profile="performance")
+    for name in ("async def dispatch", "class ConnectionPool", "class ResponseCache", "def validate_batch", "class LoadBatcher", "save_many", "def authenticate"):
+        assert name in python_source
+    minimal = translator.translate("Respond with json", "python", mode="web-backend", render_profile="performance")
+    assert "class ConnectionPool" in minimal and "validate_batch" not in minimal and "LoadBatcher" not in minimal
+    for source in (python_source, minimal):
+        assert translator.verify_output(source, "python")[0]
+        completed = subprocess.run([sys.executable, "-c", source], check=True, capture_output=True, text=True, timeout=30)
+        assert "'status': 200" in completed.stdout
+
+    javascript_source = translator.translate(prompt, "javascript", mode="web-backend", render_profile="performance")
+    assert "validateBatch" in javascript_source and "keepAlive: true" in javascript_source
+    if shutil.which("node"):
+        assert translator.verify_output(javascript_source, "javascript")[0]
+
+
+def test_performance_video_templates_stream_bounded_chunks() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    prompt = "Trim the video and overlay subtitles per frame then encode"
+    python_source = translator.translate(prompt, "python", mode="video-processing", render_profile="performance")
+    for name in ("def read_chunks", "queue.Queue(maxsize=QUEUE_DEPTH)", "def trim_frames", "def apply_overlay", "class OpenCVSink", "means = chunk.mean"):
+        assert name in python_source
+    minimal = translator.translate("Render a preview", "python", mode="video-processing", render_profile="performance")
+    assert "def run_pipeline" in minimal and "trim_frames" not in minimal and "apply_overlay" not in minimal
+    for source in (python_source, minimal):
+        assert translator.verify_output(source, "python")[0]
+
+    cpp_source = translator.translate(prompt, "cpp", mode="video-processing", render_profile="performance")
+    assert "class BoundedQueue" in cpp_source and "kTrimEndFrame" in cpp_source and "Overlay()" in cpp_source
+    if shutil.which("g++"):
+        subprocess.run(["g++", "-std=c++17", "-fsyntax-only", "-x", "c++", "-"], input=cpp_source, text=True, check=True, timeout=60)
+
+
+def test_performance_video_trim_keeps_frames_start_to_end_from_opencv(monkeypatch) -> None:
+    np = pytest.importorskip("numpy")
+
+    class FakeCapture:
+        """Stands in for cv2.VideoCapture: ten frames whose pixels hold their index."""
+
+        def __init__(self, path: str) -> None:
+            self.position = 0
+
+        def set(self, prop: int, value: int) -> None:
+            self.position = value
+
+        def read(self):
+            if self.position >= 10:
+                return False, None
+            self.position += 1
+            return True, np.full((2, 2, 3), self.position - 1, dtype=np.uint8)
+
+        def release(self) -> None:
+            return None
+
+    monkeypatch.setitem(sys.modules, "cv2", types.SimpleNamespace(VideoCapture=FakeCapture, CAP_PROP_POS_FRAMES=1))
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    source = translator.translate("Trim the video", "python", mode="video-processing", render_profile="performance")
+    source = source.replace("TRIM_START_FRAME = 0", "TRIM_START_FRAME = 3").replace("TRIM_END_FRAME: Optional[int] = None", "TRIM_END_FRAME: Optional[int] = 7")
+    namespace: dict = {"__name__": "generated_video"}
+    exec(compile(source, "generated_video.py", "exec"), namespace)
+    sink = namespace["run_pipeline"](namespace["opencv_frames"]("clip.mp4"), namespace["ChunkSink"]())
+    assert (sink.frames, sink.checksum) == (4, 3 + 4 + 5 + 6)
+
+
+def test_performance_automation_sync_is_incremental(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    script = tmp_path / "sync.py"
+    script.write_text(translator.translate("Sync assets from source folder to build folder", "python", mode="automation", render_profile="performance"), encoding="utf-8")
+    source = tmp_path / "assets"
+    (source / "textures").mkdir(parents=True)
+    for index in range(3):
+        (source / "textures" / f"t{index}.png").write_bytes(b"x" * index)
+
+    def sync() -> str:
+        return subprocess.run([sys.executable, str(script), str(source), str(tmp_path / "build")], check=True, capture_output=True, text=True, timeout=60).stdout
+
+    assert "'copied': 3" in sync()
+    assert "'copied': 0, 'unchanged': 3" in sync()
+    (source / "textures" / "t0.png").write_bytes(b"changed")
+    assert "'copied': 1" in sync()
+    assert (tmp_path / "build" / "textures" / "t0.png").read_bytes() == b"changed"
+
+    for destination in ([], [str(source)], [str(source / "build")]):
+        failed = subprocess.run([sys.executable, str(script), str(source), *destination], capture_output=True, text=True, timeout=60)
+        assert failed.returncode != 0
+        assert "DESTINATION" in failed.stderr or "must be outside source" in failed.stderr
+    assert not (source / "build").exists() and not (source / ".nevora-sync-manifest.json").exists()
+
+
+def test_performance_automation_sections_follow_prompt_words() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    rename = translator.translate("Rename files in folder by date prefix", "python", mode="automation", render_profile="performance")
+    csv_rows = translator.translate("Validate CSV rows and save a report", "python", mode="automation", render_profile="performance")
+    assert "os.scandir" in rename and "def rename_by_date" in rename and "def sync_folder" not in rename
+    assert "def iter_csv_chunks" in csv_rows and "def validate_csv" in csv_rows and "rename_by_date" not in csv_rows
+    for source in (rename, csv_rows):
+        assert translator.verify_output(source, "python")[0]
+        subprocess.run([sys.executable, "-c", source], check=True, capture_output=True, timeout=60)
+
+
+def test_performance_automation_csv_validation_is_stable_across_runs(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    script = tmp_path / "validate.py"
+    script.write_text(translator.translate("Validate CSV rows and save a report", "python", mode="automation", render_profile="performance"), encoding="utf-8")
+    source = tmp_path / "data"
+    for folder, rows in (("a", "1,a@example.com\nx,broken\n"), ("b", "y,broken\n")):
+        (source / folder).mkdir(parents=True)
+        (source / folder / "rows.csv").write_text("id,email\n" + rows, encoding="utf-8")
+
+    for _ in range(3):
+        report = subprocess.run([sys.executable, str(script), str(source)], check=True, capture_output=True, text=True, timeout=60).stdout
+    assert f"'{os.path.join('a', 'rows.csv')}': {{'rows': 2, 'rejected': 1}}" in report
+    assert f"'{os.path.join('b', 'rows.csv')}': {{'rows': 1, 'rejected': 1}}" in report
+    assert sorted(path.name for path in source.rglob("*.csv")) == ["rows.csv", "rows.csv", "rows.csv.rejects.csv", "rows.csv.rejects.csv"]
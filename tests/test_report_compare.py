@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from translator.cli import main
+from translator.report_compare import ReportGates, compare_batch_reports, evaluate_report_gates, mann_whitney_u
+from translator.services import BatchReportService
+
+
+def _results(elapsed: list[float], target: str = "python") -> list[dict]:
+    return [{"index": i, "ok": True, "target": target, "elapsed_ms": value} for i, value in enumerate(elapsed)]
+
+
+def _write_report(path, results: list[dict]) -> str:
+    summary = BatchReportService((12, 12, 12, 12)).build_summary(results)
+    path.write_text(json.dumps(summary), encoding="utf-8")
+    return str(path)
+
+
+def test_mann_whitney_detects_shift_and_ignores_identical_samples() -> None:
+    baseline = [float(v) for v in range(10, 40)]
+    shifted = mann_whitney_u(baseline, [v + 25 for v in baseline])
+    same = mann_whitney_u(baseline, list(baseline))
+    assert shifted is not None and shifted["p_value"] < 0.001
+    assert same is not None and same["p_value"] == pytest.approx(1.0)
+    assert mann_whitney_u([1.0], [2.0, 3.0]) is None
+
+
+def test_gates_flag_p95_regression_per_target_and_rate_drop() -> None:
+    baseline = _results([10.0] * 20) + _results([20.0] * 20, target="cpp")
+    candidate = _results([10.0] * 20) + _results([40.0] * 19, target="cpp") + [{"index": 99, "ok": False, "target": "cpp"}]
+    service = BatchReportService((12, 12, 12, 12))
+    comparison = compare_batch_reports(
+        service.build_summary(baseline), service.build_summary(candidate), baseline_results=baseline, candidate_results=candidate
+    )
+
+    assert comparison["targets"]["python"]["p95_elapsed_ms"]["pct_change"] == 0.0
+    assert comparison["targets"]["cpp"]["mann_whitney"]["significant"] is True
+    failures = evaluate_report_gates(comparison, ReportGates(max_p95_regression_pct=10.0, max_success_rate_drop=0.01))
+    assert any(message.startswith("target cpp p95_elapsed_ms regressed 100.00%") for message in failures)
+    assert any(message.startswith("success_rate dropped") for message in failures)
+    assert not any(message.startswith("target python") for message in failures)
+
+
+def test_require_significance_skips_noise(tmp_path) -> None:
+    baseline = _results([10.0, 11.0, 12.0, 13.0, 30.0])
+    candidate = _results([10.0, 11.0, 12.0, 13.0, 36.0])
+    service = BatchReportService((12, 12, 12, 12))
+    comparison = compare_batch_reports(
+        service.build_summary(baseline), service.build_summary(candidate), baseline_results=baseline, candidate_results=candidate
+    )
+    assert evaluate_report_gates(comparison, ReportGates(max_p95_regression_pct=10.0))
+    assert evaluate_report_gates(comparison, ReportGates(max_p95_regression_pct=10.0, require_significance=True)) == []
+
+
+def test_compare_reports_cli_exits_non_zero_on_regression(tmp_path, capsys) -> None:
+    baseline = _write_report(tmp_path / "baseline.json", _results([10.0] * 30))
+    candidate = _write_report(tmp_path / "candidate.json", _results([10.5] * 30))
+    slower = _write_report(tmp_path / "slower.json", _results([15.0] * 30))
+
+    main(["compare-reports", baseline, candidate, "--max-p95-regression", "10%", "--output", str(tmp_path / "cmp.json")])
+    assert "[compare-gate:ok]" in capsys.readouterr().out
+    assert json.loads((tmp_path / "cmp.json").read_text(encoding="utf-8"))["significance"]["significant"] is True
+
+    with pytest.raises(SystemExit, match="p95_elapsed_ms regressed"):
+        main(["compare-reports", baseline, slower, "--max-p95-regression", "10%"])
+
+
+def test_batch_report_records_throughput_when_wall_time_known(tmp_path) -> None:
+    from translator.core import EnglishToCodeTranslator
+
+    translator = EnglishToCodeTranslator()
+    results = translator.translate_batch([{"prompt": "Create a player"}], default_target="python")
+    report = translator.write_batch_report(results, str(tmp_path / "report.json"), wall_time_ms=250.0)
+    payload = json.loads(open(report, encoding="utf-8").read())
+    assert payload["wall_time_ms"] == 250.0
+    assert payload["throughput_items_per_s"] == 4.0
+
+
+def test_stage_regression_gate_fails_when_only_one_stage_slows(tmp_path) -> None:
+    def staged(verify_ms: float) -> list[dict]:
+        results = _results([20.0] * 30)
+        for item in results:
+            item["stage_timings_ms"] = {"plan": 2.0, "render": 1.0, "verify": verify_ms}
+        return results
+
+    baseline = _write_report(tmp_path / "baseline.json", staged(3.0))
+    candidate = _write_report(tmp_path / "candidate.json", staged(9.0))
+
+    main(["compare-reports", baseline, candidate, "--max-p95-regression", "10%"])
+    with pytest.raises(SystemExit, match="stage verify p90 regressed 200.00%") as excinfo:
+        main(["compare-reports", baseline, candidate, "--max-p95-regression", "10%", "--max-stage-regression", "25%"])
+    assert "stage plan" not in str(excinfo.value)
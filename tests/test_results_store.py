@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from translator import analytics
+from translator.analytics import grouped_latency, latency_stats, run_trend
+from translator.cli import main
+from translator.results_store import SQLiteResultsStore
+
+
+def _items(target: str, mode: str, elapsed: list[float]) -> list[dict]:
+    return [
+        {"index": i, "ok": True, "target": target, "mode": mode, "resolved_provider": "heuristic", "elapsed_ms": value}
+        for i, value in enumerate(elapsed)
+    ]
+
+
+def _record(store: SQLiteResultsStore, items: list[dict], label: str) -> int:
+    items = [{**item, "index": i} for i, item in enumerate(items)]
+    summary = {"total": len(items), "ok": sum(1 for item in items if item.get("ok"))}
+    return store.record_run(items, summary, label=label)
+
+
+def test_latency_stats_interpolates_like_numpy(monkeypatch) -> None:
+    monkeypatch.setattr(analytics, "np", None)
+    stats = latency_stats([1.0, 2.0, 3.0, 4.0, None])
+    assert stats == {"count": 4, "mean": 2.5, "max": 4.0, "p50": 2.5, "p90": 3.7, "p95": 3.85, "p99": 3.97}
+    assert latency_stats([]) == {"count": 0}
+
+
+def test_grouped_latency_filters_by_target_mode_and_recent_runs(tmp_path) -> None:
+    with SQLiteResultsStore(str(tmp_path / "results.db")) as store:
+        _record(store, _items("cpp", "web-backend", [100.0, 200.0]), "old")
+        _record(store, _items("cpp", "web-backend", [10.0, 20.0, 30.0]) + _items("python", "gameplay", [5.0]), "new")
+        failed = [{"index": 0, "ok": False, "target": "cpp", "mode": "web-backend", "error": "boom"}]
+        _record(store, failed, "newest")
+
+        rows = grouped_latency(store, ("target", "mode"), last_runs=2, target="cpp", mode="web-backend")
+        assert len(rows) == 1
+        assert rows[0]["items"] == 4
+        assert rows[0]["success_rate"] == 0.75
+        assert rows[0]["elapsed_ms"]["count"] == 3
+        assert rows[0]["elapsed_ms"]["max"] == 30.0
+
+        trend = run_trend(store, target="cpp")
+        assert [row["label"] for row in trend] == ["old", "new", "newest"]
+        assert trend[0]["elapsed_ms"]["p50"] == 150.0
+
+        with pytest.raises(ValueError):
+            store.fetch_columns(["prompt"])
+
+
+def test_batch_run_appends_to_results_db_and_stats_answers(tmp_path, capsys) -> None:
+    batch = tmp_path / "batch.json"
+    batch.write_text(json.dumps([{"prompt": "Create a player"}, {"prompt": "Spawn enemy", "target": "cpp"}]), encoding="utf-8")
+    db = tmp_path / "results.db"
+    for _ in range(2):
+        main(["--target", "python", "--planner-provider", "heuristic", "--batch-input", str(batch), "--results-db", str(db), "--results-label", "ci"])
+
+    with SQLiteResultsStore(str(db)) as store:
+        runs = store.runs()
+        assert [run["label"] for run in runs] == ["ci", "ci"]
+        assert runs[0]["wall_time_ms"] > 0
+        assert store.fetch_columns(["target"], last_runs=1)["target"] == ["python", "cpp"]
+
+    capsys.readouterr()
+    main(["stats", "--results-db", str(db), "--target", "cpp", "--last-runs", "30"])
+    out = capsys.readouterr().out
+    rows = json.loads(out.split("\n[stats]")[0])
+    assert rows == [{"target": "cpp", "items": 2, "success_rate": 1.0, "elapsed_ms": rows[0]["elapsed_ms"]}]
+    assert rows[0]["elapsed_ms"]["count"] == 2
@@ -1,4 +1,7 @@
-from translator.services import BatchReportService, validate_ordered_results
+import json
+from pathlib import Path
+
+from translator.services import BatchReportAggregator, BatchReportService, QuantileSketch, validate_ordered_results
 
 
 def test_validate_ordered_results_passes() -> None:
@@ -18,3 +21,41 @@ def test_batch_report_service_summary_contains_counts() -> None:
     assert summary["ok"] == 1
     assert summary["failed"] == 1
     assert summary["target_counts"]["python"] == 1
+
+
+def test_quantile_sketch_stays_within_relative_accuracy() -> None:
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    values = [float(v) for v in range(1, 1001)]
+    for value in values:
+        sketch.add(value)
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert abs(sketch.quantile(q) - exact) <= exact * 0.01
+
+
+def test_aggregators_merge_like_a_single_pass() -> None:
+    service = BatchReportService((12, 12, 12, 12))
+    items = [{"index": i, "ok": True, "target": "python", "elapsed_ms": float(i + 1)} for i in range(40)]
+    left, right = service.aggregator(), service.aggregator()
+    for item in items[:25]:
+        left.add(item)
+    for item in items[25:]:
+        right.add(item)
+    restored = BatchReportAggregator.from_state((12, 12, 12, 12), right.summary()["aggregate_state"])
+    merged = left.merge(restored).summary()
+    single = service.build_summary(items)
+    for key in ("total", "ok", "target_counts", "p50_elapsed_ms", "p95_elapsed_ms", "p99_elapsed_ms"):
+        assert merged[key] == single[key]
+
+
+def test_build_summary_streams_results_to_sidecar(tmp_path) -> None:
+    from translator.core import EnglishToCodeTranslator
+
+    translator = EnglishToCodeTranslator()
+    results = translator.translate_batch([{"prompt": "Create a player"}, {"prompt": "Spawn enemy"}], default_target="python")
+    report = translator.write_batch_report(results, str(tmp_path / "report.json"), results_sidecar=str(tmp_path / "results.jsonl"))
+
+    payload = json.loads(Path(report).read_text(encoding="utf-8"))
+    assert "results" not in payload
+    assert payload["total"] == 2
+    assert translator.load_batch_report_results(report) == results
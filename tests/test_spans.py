@@ -0,0 +1,34 @@
+from translator.core import EnglishToCodeTranslator
+from translator.planners.heuristic import HeuristicPlanner
+from translator.spans import NULL_SPAN, collect_spans, span
+
+
+def test_span_is_noop_without_collector() -> None:
+    assert span("plan") is NULL_SPAN
+
+
+def test_nested_spans_only_count_outermost_stage() -> None:
+    with collect_spans() as recorder:
+        with span("explain"):
+            with span("plan"):
+                pass
+    assert set(recorder.timings_ms) == {"explain"}
+    assert [event[0] for event in recorder.events] == ["plan", "explain"]
+
+
+def test_batch_payloads_include_stage_timings_and_report_histograms(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    results = translator.translate_batch(
+        [{"prompt": "Create a player that can jump", "target": "python"}],
+        default_target="python",
+        verify_generated=True,
+    )
+    stages = results[0]["stage_timings_ms"]
+    assert {"normalize", "plan", "render", "rag", "verify"} <= set(stages)
+    assert all(value >= 0 for value in stages.values())
+
+    summary = translator._batch_report_service.build_summary(results)
+    assert set(summary["stage_latency_ms"]["render"]) == {"count", "p50", "p90", "p99"}
+
+    disabled = EnglishToCodeTranslator(planner=HeuristicPlanner(), stage_timings=False)
+    assert "stage_timings_ms" not in disabled.translate_batch([{"prompt": "Create jump"}], default_target="python")[0]
@@ -0,0 +1,74 @@
+import io
+import zipfile
+
+import pytest
+
+from translator.artifacts import write_chunks
+from translator.cli import main
+from translator.core import EnglishToCodeTranslator
+from translator.generators.project_packager import package_single_file_project
+from translator.planners.heuristic import HeuristicPlanner
+from translator.safety import SafetyScanner
+from translator.spans import collect_spans
+
+
+def test_translate_iter_chunks_join_to_translate_output() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    for target in sorted(translator.supported_targets):
+        chunks = list(translator.translate_iter("Create a player that jumps", target, mode="automation", strict_safety=True))
+        assert len(chunks) > 1
+        assert "".join(chunks) == translator.translate("Create a player that jumps", target, mode="automation")
+
+
+
+def test_translate_iter_records_render_safety_and_rag_spans() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    with collect_spans() as recorder:
+        chunks = list(translator.translate_iter("Create a player that jumps", "python", strict_safety=True, use_rag_cache=True))
+    assert {"plan", "render", "safety", "rag"} <= set(recorder.timings_ms)
+    assert sum(1 for name, *_ in recorder.events if name == "render") == len(chunks) + 1
+
+def test_safety_scanner_catches_patterns_across_chunk_boundaries() -> None:
+    scanner = SafetyScanner(["drop database"])
+    scanner.feed("please DROP DATA")
+    assert len(scanner._tail) == len("drop database") - 1
+    with pytest.raises(ValueError, match="drop database"):
+        scanner.feed("BASE now")
+    assert list(SafetyScanner(["rm -rf /"]).scan(["safe ", "text"])) == ["safe ", "text"]
+
+
+def test_write_chunks_leaves_destination_untouched_on_error(tmp_path) -> None:
+    destination = tmp_path / "out.txt"
+    destination.write_text("previous", encoding="utf-8")
+    with pytest.raises(ValueError):
+        write_chunks(destination, SafetyScanner(["shutdown"]).scan(["ok\n", "shut", "down"]))
+    assert destination.read_text(encoding="utf-8") == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+
+    write_chunks(destination, ["a", "b\n"])
+    assert destination.read_text(encoding="utf-8") == "ab\n"
+
+
+def test_streamed_zip_and_scaffold_match_string_output(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    code = translator.translate("Spawn enemy", "cpp")
+
+    streamed = package_single_file_project(translator.translate_iter("Spawn enemy", "cpp"), "Spawn enemy", target="cpp")
+    with zipfile.ZipFile(io.BytesIO(streamed)) as archive:
+        assert archive.read("main.cpp").decode("utf-8") == code
+
+    root = translator.scaffold_project("Spawn enemy", "cpp", str(tmp_path / "scaffold"))
+    assert (tmp_path / "scaffold" / "main.cpp").read_text(encoding="utf-8") == code
+    assert root == str(tmp_path / "scaffold")
+
+
+def test_cli_strict_safety_prints_nothing_when_output_is_blocked(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(EnglishToCodeTranslator, "BLOCKED_PATTERNS", ['"space"'])
+    with pytest.raises(ValueError, match="space"):
+        main(["--target", "python", "--planner-provider", "heuristic", "--strict-safety", "--prompt", "Create a player that jumps"])
+    assert capsys.readouterr().out == ""
+
+    monkeypatch.setattr(EnglishToCodeTranslator, "BLOCKED_PATTERNS", ["rm -rf /"])
+    main(["--target", "python", "--planner-provider", "heuristic", "--strict-safety", "--prompt", "Create a player that jumps"])
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    assert capsys.readouterr().out.startswith(translator.translate("Create a player that jumps", "python") + "\n")
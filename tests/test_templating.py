@@ -0,0 +1,53 @@
+import pytest
+
+from translator.core import EnglishToCodeTranslator
+from translator.planners.heuristic import HeuristicPlanner
+from translator.targets import TemplateLoader
+
+
+def test_templates_compile_once_and_inline_partials(tmp_path) -> None:
+    (tmp_path / "_head.tmpl").write_text("// {{ title }} --\n", encoding="utf-8")
+    (tmp_path / "demo.tmpl").write_text("{{> _head }}\nbody {{ value }} and {{value}}!\n", encoding="utf-8")
+    loader = TemplateLoader(str(tmp_path))
+
+    template = loader.get("demo")
+    assert loader.get("demo") is template
+    assert template.variables == ("title", "value")
+    assert template.render({"title": "T", "value": 1}) == "// T --\nbody 1 and 1!\n"
+    assert template._parts == ["// ", "", " --\nbody ", "", " and ", "", "!\n"]
+    with pytest.raises(KeyError, match="needs variable 'value'"):
+        template.render({"title": "T"})
+
+
+def test_include_cycles_are_rejected(tmp_path) -> None:
+    (tmp_path / "a.tmpl").write_text("{{> b }}", encoding="utf-8")
+    (tmp_path / "b.tmpl").write_text("{{> a }}", encoding="utf-8")
+    with pytest.raises(ValueError, match="a -> b -> a"):
+        TemplateLoader(str(tmp_path)).get("a")
+
+
+def test_user_template_overrides_builtin_and_changes_generator_version(tmp_path) -> None:
+    builtin = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    (tmp_path / "cpp.tmpl").write_text("// custom {{ prompt }} -> {{ actions }}\n", encoding="utf-8")
+    custom = EnglishToCodeTranslator(planner=HeuristicPlanner(), template_dir=str(tmp_path))
+
+    assert custom.translate("Create a player", "cpp").startswith("// custom Create a player -> ")
+    assert custom.translate("Create a player", "python") == builtin.translate("Create a player", "python")
+    assert custom.templates.content_hash() != builtin.templates.content_hash()
+    assert custom.generator_version != builtin.generator_version
+
+
+def test_sections_render_on_flags_and_drop_standalone_tag_lines(tmp_path) -> None:
+    (tmp_path / "demo.tmpl").write_text(
+        "start\n{{# has_a }}\na {{ value }}\n{{^ has_b }}\nno b\n{{/ has_b }}\n{{/ has_a }}\nend\n", encoding="utf-8"
+    )
+    template = TemplateLoader(str(tmp_path)).get("demo")
+    assert template.variables == ("value",)
+    assert template.render({"value": 1}) == "start\nend\n"
+    assert template.render({"value": 1, "has_a": True}) == "start\na 1\nno b\nend\n"
+    values = {"value": 1, "has_a": True, "has_b": True}
+    assert template.render(values) == "".join(template.render_iter(values)) == "start\na 1\nend\n"
+
+    (tmp_path / "open.tmpl").write_text("{{# has_a }}x", encoding="utf-8")
+    with pytest.raises(ValueError, match="leaves section 'has_a' open"):
+        TemplateLoader(str(tmp_path)).get("open")
@@ -0,0 +1,59 @@
+import json
+
+from translator.cli import main
+from translator.core import EnglishToCodeTranslator
+from translator.planners.heuristic import HeuristicPlanner
+from translator.tracing import TraceCollector
+
+
+def _events(trace: TraceCollector, phase: str = "X") -> list[dict]:
+    return [event for event in trace.to_dict()["traceEvents"] if event["ph"] == phase]
+
+
+def test_swarm_items_and_stages_land_on_worker_lanes() -> None:
+    trace = TraceCollector()
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner(), trace=trace)
+    translator.translate_batch(
+        [{"prompt": "Create a player"}, {"prompt": "Spawn an enemy"}, {"prompt": "Create a player"}],
+        default_target="python",
+        verify_generated=True,
+        swarm_workers=2,
+    )
+
+    items = {event["args"]["index"]: event for event in _events(trace) if event["cat"] == "item"}
+    assert sorted(items) == [0, 1, 2]
+    assert items[0]["args"]["target"] == "python"
+    assert "plan_cache_hit" in items[0]["args"] and "rag_hit" in items[0]["args"]
+
+    for item in items.values():
+        stages = [
+            event for event in _events(trace)
+            if event["cat"] == "stage" and event["tid"] == item["tid"] and item["ts"] <= event["ts"] <= item["ts"] + item["dur"]
+        ]
+        assert {"plan", "render", "verify"} <= {event["name"] for event in stages}
+
+    lanes = {event["args"]["name"] for event in _events(trace, "M") if event["name"] == "thread_name"}
+    assert lanes and all(name.startswith("nevora-swarm") for name in lanes)
+
+
+def test_reused_items_are_traced_without_stages(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    first = translator.translate_batch([{"prompt": "Create a player"}], default_target="python")
+    report = translator.write_batch_report(first, str(tmp_path / "report.json"))
+
+    translator.trace = TraceCollector()
+    translator.translate_batch([{"prompt": "Create a player"}], default_target="python", baseline_report=report)
+    events = _events(translator.trace)
+    assert [event["cat"] for event in events] == ["item"]
+    assert events[0]["args"]["reused"] is True
+
+
+def test_cli_trace_file_is_chrome_trace_json(tmp_path) -> None:
+    batch = tmp_path / "batch.json"
+    batch.write_text(json.dumps([{"prompt": "Create a player"}]), encoding="utf-8")
+    trace_file = tmp_path / "trace.json"
+    main(["--target", "python", "--planner-provider", "heuristic", "--batch-input", str(batch), "--trace-file", str(trace_file)])
+
+    payload = json.loads(trace_file.read_text(encoding="utf-8"))
+    assert payload["displayTimeUnit"] == "ms"
+    assert any(event.get("cat") == "item" and event["dur"] >= 0 for event in payload["traceEvents"])
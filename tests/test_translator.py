@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -465,6 +466,18 @@ def test_benchmark_swarm_configs_returns_best() -> None:
     assert bench["best_workers"] in {1, 2}
 
 
+def test_benchmark_swarm_configs_repeats_scenarios_and_restores_caches() -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    translator.build_generation_plan("Keep me cached", mode="gameplay")
+    batch = [{"prompt": "Create jump", "target": "python"}]
+    bench = translator.benchmark_swarm_configs(batch, default_target="python", worker_candidates=[1, 2], repeats=2, warmup=1)
+    assert {(t["scenario"], t["workers"]) for t in bench["timings"]} == {("cold", 1), ("cold", 2), ("warm", 1), ("warm", 2)}
+    assert all(len(t["runs_ms"]) == 2 and "p95_ms" in t and "stdev_ms" in t for t in bench["timings"])
+    assert bench["host"]["cpu_count"] == os.cpu_count()
+    assert list(translator._plan_cache) == [("Keep me cached", "gameplay")]
+    assert translator.suggest_swarm_workers(10, benchmark=bench) == bench["best_workers"]
+
+
 def test_generate_assistant_runbook_includes_checklist() -> None:
     translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
     runbook = translator.generate_assistant_runbook(
@@ -661,3 +674,110 @@ def test_python_renderer_uses_list_literals_for_entities_outputs() -> None:
     out = translator.translate("Create a player that can jump", target="python")
     assert "self.entities = [" in out
     assert "self.outputs = [" in out
+
+
+class RecordingPlanner(HeuristicPlanner):
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    def plan(self, prompt: str, mode: str = "gameplay") -> ParsedIntent:
+        self.prompts.append(prompt)
+        return super().plan(prompt, mode=mode)
+
+
+def test_translate_batch_runs_high_priority_first_but_keeps_input_order() -> None:
+    planner = RecordingPlanner()
+    translator = EnglishToCodeTranslator(planner=planner)
+    batch = [
+        {"prompt": "Create jump", "target": "python"},
+        {"prompt": "Spawn enemy", "target": "python", "priority": 5},
+        {"prompt": "Play sound", "target": "python", "priority": 5, "deadline_ms": 60000},
+    ]
+    results = translator.translate_batch(batch, default_target="python")
+    assert planner.prompts == ["Play sound", "Spawn enemy", "Create jump"]
+    assert [item["index"] for item in results] == [0, 1, 2]
+    assert results[2]["deadline_missed"] is False
+
+
+def test_translate_batch_expired_deadline_downgrades_or_skips(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=RecordingPlanner())
+    batch = [{"prompt": "Create jump", "target": "python", "deadline_ms": -1}]
+
+    downgraded = translator.translate_batch(batch, default_target="python")
+    assert downgraded[0]["ok"] is True
+    assert downgraded[0]["deadline_action"] == "downgraded"
+    assert downgraded[0]["resolved_provider"] == "heuristic"
+
+    skipped = translator.translate_batch(batch, default_target="python", deadline_policy="skip")
+    assert skipped[0]["ok"] is False
+    assert skipped[0]["deadline_action"] == "skipped"
+
+    payload = json.loads(Path(translator.write_batch_report(downgraded, str(tmp_path / "r.json"))).read_text(encoding="utf-8"))
+    assert payload["deadline_counts"]["downgraded"] == 1
+    assert payload["priority_latency_ms"]["0"]["count"] == 1
+
+
+def test_translate_batch_reuses_unchanged_items_from_baseline(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    batch = [
+        {"prompt": "Create a player that can jump", "target": "python"},
+        {"prompt": "Spawn enemy when timer reaches zero", "target": "cpp"},
+    ]
+    first = translator.translate_batch(batch, default_target="python", verify_generated=True)
+    baseline = translator.write_batch_report(first, str(tmp_path / "baseline.json"))
+
+    changed = [batch[0], {"prompt": "Spawn enemy when timer reaches one", "target": "cpp"}]
+    planner = RecordingPlanner()
+    rerun = EnglishToCodeTranslator(planner=planner).translate_batch(
+        changed, default_target="python", verify_generated=True, baseline_report=baseline
+    )
+    assert [item["reused"] for item in rerun] == [True, False]
+    assert rerun[0]["output"] == first[0]["output"]
+    assert rerun[0]["verify_output_ok"] == first[0]["verify_output_ok"]
+    assert planner.prompts == ["Spawn enemy when timer reaches one"]
+
+    report = json.loads(Path(translator.write_batch_report(rerun, str(tmp_path / "rerun.json"))).read_text(encoding="utf-8"))
+    assert report["incremental"] == {"reused": 1, "recomputed": 1}
+
+
+def test_translate_multi_plans_once_and_matches_single_target_output() -> None:
+    planner = RecordingPlanner()
+    translator = EnglishToCodeTranslator(planner=planner)
+    outputs = translator.translate_multi("Create a player that can jump", ["python", "CPP", "gdscript", "python"], mode="automation")
+
+    assert list(outputs) == ["python", "cpp", "gdscript"]
+    assert planner.prompts == ["Create a player that can jump"]
+    single = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    for target, output in outputs.items():
+        assert output == single.translate("Create a player that can jump", target, mode="automation")
+
+    verified = translator.verify_outputs({"python": outputs["python"], "blueprint": "graph"})
+    assert verified["python"] == (True, "python compile ok")
+    assert set(verified) == {"python", "blueprint"}
+    with pytest.raises(ValueError, match="Unsupported target"):
+        translator.translate_multi("Create a player", ["python", "rust"])
+
+
+def test_translate_multi_retrieves_rag_hints_per_target() -> None:
+    prompt = "Create a player that can jump"
+
+    def seeded() -> EnglishToCodeTranslator:
+        translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+        translator._rag_store(prompt, "shoot dash", "python", "gameplay", "english")
+        return translator
+
+    outputs = seeded().translate_multi(prompt, ["python", "cpp"], use_rag_cache=True)
+    single = seeded()
+    for target in ["python", "cpp"]:
+        assert outputs[target] == single.translate(prompt, target, use_rag_cache=True)
+    assert "shoot" in outputs["python"].lower()
+    assert "shoot" not in outputs["cpp"].lower()
+
+
+def test_cli_comma_separated_target_prints_each_output(capsys) -> None:
+    from translator.cli import main
+
+    main(["--target", "python,csharp", "--planner-provider", "heuristic", "--prompt", "Create a player", "--verify"])
+    out = capsys.readouterr().out
+    assert "[target:python]" in out and "[target:csharp]" in out
+    assert "[verify:python:ok] python compile ok" in out
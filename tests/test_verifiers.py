@@ -0,0 +1,88 @@
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from translator.core import EnglishToCodeTranslator
+from translator.planners.heuristic import HeuristicPlanner
+from translator.verifiers import VerifierPool
+
+needs_node = pytest.mark.skipif(shutil.which("node") is None, reason="node unavailable")
+
+SNIPPETS = [
+    "const a = 1;\nconsole.log(a);\n",
+    "function f( {\n  return 1;\n}\n",
+    "return 5;\n",
+    "#!/usr/bin/env node\nconsole.log(1)\n",
+    "'use strict';\nlet a; let a;\n",
+    "await foo();\n",
+    "const b = 2 // trailing comment",
+    "})\n(function(){",
+    "}); (function () {",
+]
+
+
+@needs_node
+def test_node_worker_matches_node_check_and_starts_lazily() -> None:
+    pool = VerifierPool(node_workers=1)
+    assert pool.stats()["node_workers"] == 0
+    try:
+        for code in SNIPPETS:
+            expected = subprocess.run(["node", "--check", "-"], input=code, text=True, capture_output=True).returncode == 0
+            assert pool.check_javascript(code)[0] is expected
+        ok, message = pool.check_javascript("function f( {\n  return 1;\n}\n", "feature.js")
+        assert not ok and message.startswith("feature.js:2") and "SyntaxError" in message
+        assert pool.stats() == {"node_workers": 1, "node_checks": len(SNIPPETS) + 1, "node_restarts": 0}
+    finally:
+        pool.close()
+
+
+@needs_node
+@pytest.mark.parametrize("code", ["})\n(function(){", "}); (function () {"])
+def test_node_worker_rejects_snippets_that_close_the_module_wrapper(code: str) -> None:
+    pool = VerifierPool(node_workers=1)
+    try:
+        ok, message = pool.check_javascript(code)
+        assert not ok and "SyntaxError" in message
+    finally:
+        pool.close()
+
+
+@needs_node
+def test_node_worker_restarts_after_crash() -> None:
+    pool = VerifierPool(node_workers=1)
+    try:
+        assert pool.check_javascript("let a = 1;")[0]
+        worker = pool._workers[0]
+        worker._process.kill()
+        worker._process.wait()
+        assert pool.check_javascript("let b = 2;") == (True, "node check ok")
+        assert pool.stats()["node_restarts"] == 1
+    finally:
+        pool.close()
+
+
+@needs_node
+def test_concurrent_checks_share_a_bounded_number_of_workers() -> None:
+    pool = VerifierPool(node_workers=2)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(pool.check_javascript, [f"const v{i} = {i};" for i in range(40)]))
+        assert all(ok for ok, _ in results)
+        assert 1 <= pool.stats()["node_workers"] <= 2
+        assert pool.stats()["node_checks"] == 40
+    finally:
+        pool.close()
+
+
+def test_translators_share_the_default_pool_and_python_compiles_in_process(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    assert EnglishToCodeTranslator(planner=HeuristicPlanner()).verifiers is translator.verifiers
+    assert translator.verify_output("x = (", "python")[0] is False
+    assert translator.verify_output("x = 1\n", "python") == (True, "python compile ok")
+
+    if shutil.which("pytest"):
+        (tmp_path / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+        ok, message = translator.verify_scaffold_build(str(tmp_path), "python")
+        assert not ok and message.startswith("python compile failed") and "broken.py" in message
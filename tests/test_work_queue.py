@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+
+from translator.cli import main
+from translator.core import EnglishToCodeTranslator
+from translator.planners.heuristic import HeuristicPlanner
+from translator.work_queue import SQLiteWorkQueue, drain_work_queue
+
+
+def test_queue_lease_expires_and_is_retried(tmp_path) -> None:
+    with SQLiteWorkQueue(str(tmp_path / "q.db"), visibility_timeout_s=0.0) as queue:
+        queue.push([{"prompt": "Create jump"}])
+        first = queue.lease("worker-a")
+        second = queue.lease("worker-b")
+        assert [idx for idx, _ in first] == [0]
+        assert [idx for idx, _ in second] == [0]
+        assert queue.ack(0, "worker-a", {"index": 0, "ok": True}) is False
+        assert queue.ack(0, "worker-b", {"index": 0, "ok": True}) is True
+        assert queue.stats()["done"] == 1
+
+
+def test_drain_work_queue_produces_ordered_results(tmp_path) -> None:
+    translator = EnglishToCodeTranslator(planner=HeuristicPlanner())
+    with SQLiteWorkQueue(str(tmp_path / "q.db")) as queue:
+        queue.push([
+            {"prompt": "Create a player that can jump", "target": "python"},
+            {"prompt": "Spawn enemy when timer reaches zero", "target": "cpp"},
+        ])
+        summary = drain_work_queue(translator, queue, default_target="python", poll_interval_s=0.0)
+        assert summary["processed"] == 2
+        results = queue.results()
+    assert [r["index"] for r in results] == [0, 1]
+    assert all(r["ok"] for r in results)
+
+
+def test_queue_cli_push_work_report(tmp_path, capsys) -> None:
+    batch = tmp_path / "batch.jsonl"
+    batch.write_text(json.dumps({"prompt": "Create jump", "target": "python"}) + "\n", encoding="utf-8")
+    db = str(tmp_path / "q.db")
+    report = tmp_path / "report.json"
+
+    main(["queue", "push", str(batch), "--queue-db", db])
+    main(["queue", "work", "--queue-db", db, "--target", "python", "--planner-provider", "heuristic", "--poll-interval", "0"])
+    main(["queue", "report", "--queue-db", db, "--batch-report", str(report)])
+
+    payload = json.loads(Path(report).read_text(encoding="utf-8"))
+    assert payload["total"] == 1
+    assert payload["ok"] == 1
+    assert "[queue-push]" in capsys.readouterr().out
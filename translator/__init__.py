@@ -1,6 +1,16 @@
 """English-to-code translator package."""
 
+from typing import Any
+
 from ._version import __version__
-from .core import EnglishToCodeTranslator
 
 __all__ = ["EnglishToCodeTranslator", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing `translator` alone stays cheap; core loads on first use.
+    if name == "EnglishToCodeTranslator":
+        from .core import EnglishToCodeTranslator
+
+        return EnglishToCodeTranslator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
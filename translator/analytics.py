@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable, Optional, Sequence
+
+from translator.results_store import SQLiteResultsStore
+
+try:  # NumPy is optional; the pure-Python path gives identical numbers, only slower.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None  # type: ignore[assignment]
+
+QUANTILES = {"p50": 0.50, "p90": 0.90, "p95": 0.95, "p99": 0.99}
+
+
+def _quantile(sorted_values: list[float], q: float) -> float:
+    # Linear interpolation between closest ranks, matching numpy's default method.
+    position = (len(sorted_values) - 1) * q
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def latency_stats(values: Sequence[Optional[float]]) -> dict[str, Any]:
+    """Count, mean, max and p50/p90/p95/p99 of the non-null values."""
+    if np is not None:
+        array = values if isinstance(values, np.ndarray) else np.asarray([v for v in values if v is not None], dtype=float)
+        if not array.size:
+            return {"count": 0}
+        percentiles = np.percentile(array, [q * 100 for q in QUANTILES.values()])
+        stats = {"count": int(array.size), "mean": float(array.mean()), "max": float(array.max())}
+        stats.update({name: float(value) for name, value in zip(QUANTILES, percentiles)})
+    else:
+        ordered = sorted(float(v) for v in values if v is not None)
+        if not ordered:
+            return {"count": 0}
+        stats = {"count": len(ordered), "mean": sum(ordered) / len(ordered), "max": ordered[-1]}
+        stats.update({name: _quantile(ordered, q) for name, q in QUANTILES.items()})
+    return {key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()}
+
+
+def _group_indices(keys: Iterable[tuple[Any, ...]]) -> dict[tuple[Any, ...], list[int]]:
+    groups: dict[tuple[Any, ...], list[int]] = {}
+    for position, key in enumerate(keys):
+        groups.setdefault(key, []).append(position)
+    return groups
+
+
+def grouped_latency(
+    store: SQLiteResultsStore,
+    group_by: Sequence[str] = ("target",),
+    last_runs: Optional[int] = None,
+    since_ts: Optional[float] = None,
+    ok_only: bool = True,
+    **filters: Optional[str],
+) -> list[dict[str, Any]]:
+    """Latency stats and success rate for each `group_by` combination.
+
+    Answers questions like "p95 for cpp targets in web-backend mode over the
+    last 30 runs" with `grouped_latency(store, ("target", "mode"), last_runs=30,
+    target="cpp", mode="web-backend")`.
+    """
+    columns = store.fetch_columns(
+        list(dict.fromkeys([*group_by, "ok", "elapsed_ms"])), last_runs=last_runs, since_ts=since_ts, **filters
+    )
+    ok_flags = columns["ok"]
+    elapsed = columns["elapsed_ms"]
+    keys = zip(*(columns[name] for name in group_by)) if group_by else ((),) * len(ok_flags)
+    if np is not None:
+        ok_column = np.asarray(ok_flags, dtype=bool)
+        elapsed_column = np.asarray([np.nan if v is None else v for v in elapsed], dtype=float)
+    rows: list[dict[str, Any]] = []
+    groups = _group_indices(keys)
+    for key in sorted(groups, key=lambda parts: tuple((part is None, "" if part is None else part) for part in parts)):
+        positions = groups[key]
+        if np is not None:
+            index = np.asarray(positions)
+            ok_array = ok_column[index]
+            latency_values = elapsed_column[index]
+            if ok_only:
+                latency_values = latency_values[ok_array]
+            selected = latency_values[~np.isnan(latency_values)]
+            ok_count = int(ok_array.sum())
+        else:
+            selected = [elapsed[i] for i in positions if (ok_flags[i] or not ok_only) and elapsed[i] is not None]
+            ok_count = sum(1 for i in positions if ok_flags[i])
+        row: dict[str, Any] = dict(zip(group_by, key))
+        row["items"] = len(positions)
+        row["success_rate"] = round(ok_count / len(positions), 4)
+        row["elapsed_ms"] = latency_stats(selected)
+        rows.append(row)
+    return rows
+
+
+def run_trend(
+    store: SQLiteResultsStore,
+    last_runs: Optional[int] = None,
+    since_ts: Optional[float] = None,
+    **filters: Optional[str],
+) -> list[dict[str, Any]]:
+    """Per-run latency stats (oldest run first) for spotting drift across runs."""
+    runs = {run["run_id"]: run for run in store.runs(limit=last_runs)}
+    trend = grouped_latency(store, ("run_id",), last_runs=last_runs, since_ts=since_ts, **filters)
+    for row in trend:
+        run = runs.get(row["run_id"], {})
+        row["created_at"] = run.get("created_at")
+        row["label"] = run.get("label")
+    return trend
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import io
+import os
+import queue
+import tarfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+BUNDLE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz")
+
+
+def write_chunks(path: str | Path, chunks: Iterable[str], encoding: str = "utf-8") -> Path:
+    """Stream text chunks into `path` via a temp file renamed into place.
+
+    The full text is never built in memory, and if the chunk iterator raises
+    (e.g. a safety block mid-render) the destination is left untouched.
+    """
+    destination = Path(path)
+    tmp = destination.with_name(destination.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding=encoding, newline="") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+        os.replace(tmp, destination)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return destination
+
+
+def write_zip_chunks(archive: zipfile.ZipFile, name: str, chunks: Iterable[str], encoding: str = "utf-8") -> None:
+    """Stream text chunks into a new zip member without joining them first."""
+    with archive.open(name, "w") as member:
+        for chunk in chunks:
+            member.write(chunk.encode(encoding))
+
+
+class ArtifactWriter:
+    """Write batch artifacts from a dedicated thread.
+
+    Worker threads enqueue `(relative_path, bytes)` and move on; the writer
+    thread either creates files under `root` (fsyncing them in batches) or
+    streams every artifact into a single `.zip`/`.tar`/`.tar.gz` bundle.
+    Call `close()` to flush; it re-raises the first write error, if any.
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        bundle: Optional[str] = None,
+        fsync_batch_size: int = 64,
+        max_pending: int = 1024,
+    ) -> None:
+        if (root is None) == (bundle is None):
+            raise ValueError("ArtifactWriter needs exactly one of root or bundle")
+        self.root = Path(root) if root else None
+        self.bundle = Path(bundle) if bundle else None
+        if self.bundle is not None and not self.bundle.name.lower().endswith(BUNDLE_SUFFIXES):
+            raise ValueError(f"Unsupported artifact bundle '{bundle}'. Supported: {', '.join(BUNDLE_SUFFIXES)}")
+        self.fsync_batch_size = max(0, fsync_batch_size)
+        self.written = 0
+        self._queue: queue.Queue[tuple[str, bytes] | None] = queue.Queue(maxsize=max(1, max_pending))
+        self._error: BaseException | None = None
+        self._pending_fsync: list[Path] = []
+        self._closed = False
+        self._archive: zipfile.ZipFile | tarfile.TarFile | None = None
+        if self.root is not None:
+            self.root.mkdir(parents=True, exist_ok=True)
+        else:
+            assert self.bundle is not None
+            self.bundle.parent.mkdir(parents=True, exist_ok=True)
+            self._archive = self._open_archive(self.bundle)
+        self._thread = threading.Thread(target=self._run, name="nevora-artifact-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "ArtifactWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def location(self, relative_path: str) -> str:
+        """Where `relative_path` ends up: a file path, or the member name inside the bundle."""
+        if self.root is not None:
+            return str(self.root / relative_path)
+        return relative_path
+
+    def write_text(self, relative_path: str, text: str) -> str:
+        return self.write_bytes(relative_path, text.encode("utf-8"))
+
+    def write_bytes(self, relative_path: str, data: bytes) -> str:
+        if self._closed:
+            raise RuntimeError("ArtifactWriter is closed")
+        if self._error is not None:
+            raise RuntimeError(f"artifact writer failed: {self._error}") from self._error
+        self._queue.put((relative_path.replace(os.sep, "/"), data))
+        return self.location(relative_path)
+
+    def add_tree(self, relative_dir: str, source_dir: str) -> None:
+        """Enqueue every file under `source_dir` below `relative_dir` (read synchronously)."""
+        source = Path(source_dir)
+        for path in sorted(p for p in source.rglob("*") if p.is_file()):
+            self.write_bytes(f"{relative_dir}/{path.relative_to(source).as_posix()}", path.read_bytes())
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise RuntimeError(f"artifact writer failed: {self._error}") from self._error
+
+    def _open_archive(self, bundle: Path) -> zipfile.ZipFile | tarfile.TarFile:
+        name = bundle.name.lower()
+        if name.endswith(".zip"):
+            return zipfile.ZipFile(bundle, "w", compression=zipfile.ZIP_DEFLATED)
+        if name.endswith((".tar.gz", ".tgz")):
+            return tarfile.open(bundle, "w:gz")
+        return tarfile.open(bundle, "w")
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            if self._error is not None:
+                continue
+            try:
+                self._write(*entry)
+                self.written += 1
+            except BaseException as exc:  # surfaced from close()
+                self._error = exc
+        try:
+            self._flush()
+        except BaseException as exc:
+            self._error = self._error or exc
+
+    def _write(self, relative_path: str, data: bytes) -> None:
+        if isinstance(self._archive, zipfile.ZipFile):
+            self._archive.writestr(relative_path, data)
+            return
+        if isinstance(self._archive, tarfile.TarFile):
+            info = tarfile.TarInfo(relative_path)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self._archive.addfile(info, io.BytesIO(data))
+            return
+
+        assert self.root is not None
+        destination = self.root / relative_path
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(data)
+        if self.fsync_batch_size:
+            self._pending_fsync.append(destination)
+            if len(self._pending_fsync) >= self.fsync_batch_size:
+                self._fsync_pending()
+
+    def _fsync_pending(self) -> None:
+        for path in self._pending_fsync:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        self._pending_fsync.clear()
+
+    def _flush(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+        else:
+            self._fsync_pending()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import gzip
+import json
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"NEVORA-JSONL-IDX1\n"
+_HEADER = struct.Struct("<QQQ")
+_WHITESPACE = b" \t\r\n"
+PARALLEL_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+
+class JsonlIndex:
+    """Line-offset index over a JSONL batch file.
+
+    Built in one pass over an mmap of the file and saved next to it as
+    `<file>.idx`, so later runs (resumes, shards, retries) can read individual
+    items without re-scanning. The index is rebuilt when the file's size or
+    mtime no longer match.
+    """
+
+    def __init__(self, path: str, offsets: array, size: int, mtime_ns: int) -> None:
+        self.path = Path(path)
+        self.offsets = offsets
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_name(self.path.name + INDEX_SUFFIX)
+
+    @classmethod
+    def build(cls, path: str) -> "JsonlIndex":
+        source = Path(path)
+        stat = source.stat()
+        offsets = array("Q")
+        if stat.st_size:
+            with source.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                start = 0
+                while start < size:
+                    end = mm.find(b"\n", start)
+                    if end == -1:
+                        end = size
+                    # Only whitespace-led lines need the (copying) blank-line check.
+                    if end > start and (mm[start] not in _WHITESPACE or mm[start:end].strip()):
+                        offsets.append(start)
+                    start = end + 1
+        return cls(str(source), offsets, stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["JsonlIndex"]:
+        """Load a saved index if it is still fresh for `path`."""
+        source = Path(path)
+        index_path = source.with_name(source.name + INDEX_SUFFIX)
+        try:
+            raw = index_path.read_bytes()
+            stat = source.stat()
+        except OSError:
+            return None
+        if not raw.startswith(INDEX_MAGIC):
+            return None
+        size, mtime_ns, count = _HEADER.unpack_from(raw, len(INDEX_MAGIC))
+        if size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+            return None
+        offsets = array("Q")
+        offsets.frombytes(raw[len(INDEX_MAGIC) + _HEADER.size:])
+        if len(offsets) != count:
+            return None
+        return cls(str(source), offsets, size, mtime_ns)
+
+    @classmethod
+    def load_or_build(cls, path: str, save: bool = True) -> "JsonlIndex":
+        index = cls.load(path)
+        if index is None:
+            index = cls.build(path)
+            if save:
+                index.save()
+        return index
+
+    def save(self) -> Optional[Path]:
+        """Write the index next to the batch file; read-only locations are skipped."""
+        try:
+            with self.index_path.open("wb") as handle:
+                handle.write(INDEX_MAGIC)
+                handle.write(_HEADER.pack(self.size, self.mtime_ns, len(self.offsets)))
+                self.offsets.tofile(handle)
+        except OSError:
+            return None
+        return self.index_path
+
+    def read(self, position: int) -> dict[str, Any]:
+        """Parse the item at `position` (0-based, blank lines excluded)."""
+        return self.read_many([position])[0]
+
+    def read_many(self, positions: Iterable[int]) -> list[dict[str, Any]]:
+        items: list[dict[str, Any]] = []
+        with self.path.open("rb") as handle:
+            for position in positions:
+                handle.seek(self.offsets[position])
+                items.append(json.loads(handle.readline()))
+        return items
+
+    def byte_ranges(self, chunks: int) -> list[tuple[int, int]]:
+        """Split the indexed lines into up to `chunks` contiguous byte ranges."""
+        count = len(self.offsets)
+        if not count:
+            return []
+        chunks = max(1, min(chunks, count))
+        step = -(-count // chunks)
+        ranges: list[tuple[int, int]] = []
+        for first in range(0, count, step):
+            last = first + step
+            end = self.offsets[last] if last < count else self.size
+            ranges.append((self.offsets[first], end))
+        return ranges
+
+
+def _parse_byte_range(path: str, start: int, end: int) -> list[dict[str, Any]]:
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        chunk = handle.read(end - start)
+    return [json.loads(line) for line in chunk.splitlines() if line.strip()]
+
+
+def iter_gzip_jsonl(path: str) -> Iterator[dict[str, Any]]:
+    """Stream items from a `.jsonl.gz` file without decompressing it to disk."""
+    with gzip.open(path, "rb") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_jsonl_items(path: str, workers: int = 0, save_index: bool = True) -> list[dict[str, Any]]:
+    """Load a JSONL (or `.jsonl.gz`) batch file, parsing large files in parallel.
+
+    `workers=0` picks the CPU count for files above PARALLEL_PARSE_MIN_BYTES
+    and parses smaller files in-process.
+    """
+    if path.lower().endswith(".gz"):
+        return list(iter_gzip_jsonl(path))
+
+    index = JsonlIndex.load_or_build(path, save=save_index)
+    if workers <= 0:
+        workers = (os.cpu_count() or 1) if index.size >= PARALLEL_PARSE_MIN_BYTES else 1
+    ranges = index.byte_ranges(workers)
+    if workers <= 1 or len(ranges) <= 1:
+        return [item for start, end in ranges for item in _parse_byte_range(path, start, end)]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    items: list[dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        for chunk in executor.map(_parse_byte_range, [path] * len(ranges), *zip(*ranges)):
+            items.extend(chunk)
+    return items
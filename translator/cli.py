@@ -2,19 +2,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from dataclasses import replace
 from pathlib import Path
+from time import perf_counter
+from typing import Optional
 
+from .batch_index import load_jsonl_items
 from .core import EnglishToCodeTranslator
+from .generators.provider_pool import DEFAULT_PROVIDER_LIMITS, ProviderPool
+from .metrics import exporting as metrics_exporting
+from .profiling import PROFILE_MODES, profiling
+from .targets.base import RENDER_PROFILES
+from .tracing import TraceCollector
 
 
-def _load_batch_items(path: str) -> list[dict]:
+def _load_batch_items(path: str, parse_workers: int = 0) -> list[dict]:
     source = Path(path)
+    if source.name.lower().endswith((".jsonl", ".jsonl.gz")):
+        return load_jsonl_items(path, workers=parse_workers)
+
     text = source.read_text(encoding="utf-8").strip()
     if not text:
         return []
-    if source.suffix.lower() == ".jsonl":
-        return [json.loads(line) for line in text.splitlines() if line.strip()]
-
     payload = json.loads(text)
     if not isinstance(payload, list):
         raise ValueError("Batch input JSON must be a list of objects")
@@ -23,7 +33,7 @@ def _load_batch_items(path: str) -> list[dict]:
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="English-to-code translator")
-    parser.add_argument("--target", required=True)
+    parser.add_argument("--target", required=True, help="Target language, or a comma-separated list (python,cpp) to plan once and render each")
     parser.add_argument("--prompt", required=False, help="Prompt in your selected source language")
     parser.add_argument(
         "--mode",
@@ -36,6 +46,12 @@ def build_parser() -> argparse.ArgumentParser:
         choices=["english", "spanish", "french", "german", "portuguese"],
         help="Input prompt language",
     )
+    parser.add_argument(
+        "--render-profile",
+        default="default",
+        choices=RENDER_PROFILES,
+        help="Template set to render with; 'performance' emits pooled, fixed-step code where a profile template exists",
+    )
     parser.add_argument("--audio-input", help="Audio input path (or .txt transcript file)")
     parser.add_argument("--audio-output", help="Audio output path (best effort TTS; .txt fallback if unavailable)")
     parser.add_argument("--enable-rag-cache", action="store_true", help="Enable 12x12x12x12 lattice RAG cache during translation")
@@ -51,6 +67,18 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--assistant-runbook-file", help="Write assistant runbook JSON to this file")
     parser.add_argument("--benchmark-swarm", action="store_true", help="Benchmark worker candidates on current batch input")
     parser.add_argument("--benchmark-workers", default="1,2,4", help="Comma-separated worker candidates for --benchmark-swarm")
+    parser.add_argument("--benchmark-repeats", type=int, default=3, help="Measured runs per worker candidate and scenario")
+    parser.add_argument("--benchmark-warmup", type=int, default=1, help="Unmeasured warm-up runs per worker candidate")
+    parser.add_argument(
+        "--benchmark-scenarios",
+        default="cold,warm",
+        help="Comma-separated cache scenarios to benchmark (cold, warm)",
+    )
+    parser.add_argument("--benchmark-output", help="Write machine-readable --benchmark-swarm JSON to this file")
+    parser.add_argument(
+        "--benchmark-input",
+        help="Previous --benchmark-output JSON used to pick workers when --swarm-workers is 0",
+    )
     parser.add_argument(
         "--audio-output-language",
         default="english",
@@ -78,16 +106,49 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--blueprint-name", default="BP_GeneratedFeature")
     parser.add_argument("--explain-plan", action="store_true", help="Print planner/IR explanation as JSON")
     parser.add_argument("--explain-plan-file", help="Optional file path to write explain-plan JSON")
-    parser.add_argument("--batch-input", help="Path to JSON/JSONL batch prompts")
+    parser.add_argument("--batch-input", help="Path to JSON/JSONL (or .jsonl.gz) batch prompts")
+    parser.add_argument(
+        "--batch-parse-workers",
+        type=int,
+        default=0,
+        help="Processes used to parse large JSONL batch files (0 = auto)",
+    )
     parser.add_argument("--batch-report", help="Path to write batch run report JSON")
+    parser.add_argument(
+        "--batch-report-sidecar",
+        help="Stream per-item results to this JSONL file instead of embedding them in --batch-report",
+    )
     parser.add_argument("--batch-fail-fast", action="store_true", help="Stop batch processing on first failed item")
+    parser.add_argument(
+        "--batch-baseline",
+        help="Previous batch report JSON; unchanged items reuse its outputs and verification results",
+    )
     parser.add_argument("--swarm-workers", type=int, default=1, help="Parallel workers for batch translation swarm mode")
+    parser.add_argument(
+        "--provider",
+        choices=["claude", "openai", "grok", "gemini", "ollama"],
+        help="Generate --batch-input items with this LLM provider instead of the template engine",
+    )
+    parser.add_argument("--model", help="Provider model name for --provider (provider default if omitted)")
+    parser.add_argument("--provider-concurrency", type=int, help="Max in-flight requests for --provider")
+    parser.add_argument("--provider-timeout", type=float, help="Seconds per provider attempt, including the wait for a free slot, before it is abandoned")
+    parser.add_argument("--provider-retries", type=int, help="Retries after a failed or timed-out provider request")
+    parser.add_argument(
+        "--batch-deadline-policy",
+        default="downgrade",
+        choices=["downgrade", "skip"],
+        help="What to do with batch items whose deadline_ms passed before they started",
+    )
     parser.add_argument(
         "--batch-min-success-rate",
         type=float,
         help="Optional required minimum batch success rate (0.0-1.0); exits non-zero if unmet",
     )
     parser.add_argument("--batch-artifact-dir", help="Folder to store per-item batch output artifacts")
+    parser.add_argument(
+        "--batch-artifact-bundle",
+        help="Stream all per-item batch artifacts into one .zip/.tar/.tar.gz archive instead of a folder",
+    )
     parser.add_argument("--batch-include-explain", action="store_true", help="Include explain payload for each batch item")
     parser.add_argument("--batch-verify-output", action="store_true", help="Run verify_output for each successful batch item")
     parser.add_argument("--batch-verify-build", action="store_true", help="Run scaffold build verification for each successful batch item")
@@ -101,14 +162,310 @@ def build_parser() -> argparse.ArgumentParser:
         type=float,
         help="Optional minimum verify_build pass rate (0.0-1.0)",
     )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        help="Record tracemalloc delta/peak per batch stage and cache sizes in the batch report",
+    )
+    parser.add_argument("--max-memory-mb", type=float, help="Shed plan cache entries (oldest first), then RAG buckets, as RSS nears this budget")
+    parser.add_argument("--trace-file", help="Write a Chrome Trace Event JSON timeline of batch items and stages")
+    parser.add_argument("--template-dir", help="Override target templates with <target>.tmpl files from this directory (default: $NEVORA_TEMPLATE_DIR)")
+    parser.add_argument(
+        "--batch-estimate",
+        action="store_true",
+        help="Predict batch wall time per worker count and backend instead of running the batch",
+    )
+    parser.add_argument("--batch-estimate-history", nargs="+", help="Previous batch reports used for per-class item timings")
+    parser.add_argument(
+        "--batch-estimate-sample",
+        type=int,
+        default=2,
+        help="Items per class to translate for calibration when history lacks that class (0 disables)",
+    )
+    parser.add_argument("--batch-estimate-workers", default="1,2,4,8,16", help="Comma-separated worker counts to predict")
+    parser.add_argument("--batch-estimate-output", help="Write --batch-estimate JSON to this file (usable as --benchmark-input)")
+    parser.add_argument("--results-db", help="Append this batch run and its items to a SQLite results database")
+    parser.add_argument("--results-label", help="Label stored with the run in --results-db (e.g. a git sha)")
+    _add_metrics_arguments(parser)
+    parser.add_argument("--profile", choices=PROFILE_MODES, help="Profile the whole invocation (cpu, alloc or sample)")
+    parser.add_argument("--profile-output", default="nevora-profile", help="Output path prefix for --profile files")
+    parser.add_argument("--profile-interval-ms", type=float, default=5.0, help="Sampling interval for --profile sample")
+    return parser
+
+
+def _add_metrics_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--metrics-file", help="Periodically write OpenMetrics text to this file during the run")
+    parser.add_argument("--metrics-interval", type=float, default=5.0, help="Seconds between --metrics-file updates")
+    parser.add_argument("--metrics-port", type=int, help="Serve OpenMetrics text on http://127.0.0.1:<port>/metrics during the run")
+
+
+def build_queue_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="nevora-translator queue", description="SQLite work queue for batch workers")
+    commands = parser.add_subparsers(dest="queue_command", required=True)
+
+    push = commands.add_parser("push", help="Load JSON/JSONL batch items into the queue")
+    push.add_argument("batch_input", help="Path to JSON/JSONL batch prompts")
+    push.add_argument("--queue-db", default="nevora_queue.db", help="SQLite queue database path")
+    push.add_argument("--render-profile", choices=RENDER_PROFILES, help="Stamp this render profile on items that do not set one")
+
+    work = commands.add_parser("work", help="Lease, translate and ack queued items until drained")
+    work.add_argument("--queue-db", default="nevora_queue.db", help="SQLite queue database path")
+    work.add_argument("--target", required=True)
+    work.add_argument("--mode", default="gameplay", choices=["gameplay", "automation", "video-processing", "web-backend"])
+    work.add_argument("--source-language", default="english", choices=["english", "spanish", "french", "german", "portuguese"])
+    work.add_argument("--planner-provider", default="auto", choices=["auto", "heuristic", "openai", "huggingface"])
+    work.add_argument("--strict-safety", action="store_true", help="Block unsafe content patterns")
+    work.add_argument("--batch-artifact-dir", help="Folder to store per-item batch output artifacts")
+    work.add_argument("--batch-include-explain", action="store_true", help="Include explain payload for each batch item")
+    work.add_argument("--batch-verify-output", action="store_true", help="Run verify_output for each successful batch item")
+    work.add_argument("--batch-verify-build", action="store_true", help="Run scaffold build verification for each successful batch item")
+    work.add_argument("--lease-seconds", type=float, default=300.0, help="Visibility timeout before a leased item is retried")
+    work.add_argument("--max-items", type=int, help="Stop after processing this many items")
+    work.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to wait while other workers hold leases")
+    work.add_argument("--worker-id", help="Worker identity recorded on leases (default: host:pid)")
+    work.add_argument("--trace-file", help="Write a Chrome Trace Event JSON timeline of this worker's items")
+    work.add_argument("--template-dir", help="Override target templates with <target>.tmpl files from this directory (default: $NEVORA_TEMPLATE_DIR)")
+    _add_metrics_arguments(work)
+
+    report = commands.add_parser("report", help="Build the batch report from acked queue results")
+    report.add_argument("--queue-db", default="nevora_queue.db", help="SQLite queue database path")
+    report.add_argument("--batch-report", required=True, help="Path to write batch run report JSON")
+    return parser
+
+
+def _run_queue_command(argv: list[str]) -> None:
+    from .work_queue import SQLiteWorkQueue, drain_work_queue
+
+    args = build_queue_parser().parse_args(argv)
+    lease_seconds = getattr(args, "lease_seconds", 300.0)
+    with SQLiteWorkQueue(args.queue_db, visibility_timeout_s=lease_seconds) as queue:
+        if args.queue_command == "push":
+            items = _load_batch_items(args.batch_input)
+            if args.render_profile:
+                items = [item if "render_profile" in item else {**item, "render_profile": args.render_profile} for item in items]
+            pushed = queue.push(items)
+            print(f"[queue-push] {json.dumps({'pushed': pushed, 'queue': queue.stats()})}")
+            return
+
+        if args.queue_command == "work":
+            trace = TraceCollector() if args.trace_file else None
+            translator = EnglishToCodeTranslator(planner_provider=args.planner_provider, trace=trace, template_dir=args.template_dir)
+            with metrics_exporting(args.metrics_file, args.metrics_port, args.metrics_interval):
+                summary = drain_work_queue(
+                    translator,
+                    queue,
+                    default_target=args.target,
+                    default_mode=args.mode,
+                    strict_safety=args.strict_safety,
+                    verify_generated=args.batch_verify_output,
+                    verify_build=args.batch_verify_build,
+                    default_source_language=args.source_language,
+                    include_explain=args.batch_include_explain,
+                    artifact_dir=args.batch_artifact_dir,
+                    worker_id=args.worker_id,
+                    max_items=args.max_items,
+                    poll_interval_s=max(0.0, args.poll_interval),
+                )
+            print(f"[queue-work] {json.dumps(summary)}")
+            if trace is not None:
+                print(f"[trace] written: {trace.write(args.trace_file)}")
+            return
+
+        stats = queue.stats()
+        translator = EnglishToCodeTranslator(planner_provider="heuristic")
+        destination = translator.write_batch_report(queue.results(), args.batch_report)
+        print(f"[queue-report] written: {destination} {json.dumps(stats)}")
+
+
+MULTI_TARGET_UNSUPPORTED = (
+    "engine",
+    "asset_library",
+    "assistant_guide",
+    "audio_output",
+    "explain_plan",
+    "explain_plan_file",
+    "scaffold_dir",
+    "verify_scaffold",
+    "verify_scaffold_build",
+    "export_engine_manifest",
+    "export_uasset_json",
+)
+
+
+def _run_multi_target(translator: EnglishToCodeTranslator, args: argparse.Namespace, prompt: str, targets: list[str], context: Optional[str]) -> None:
+    unsupported = [f"--{name.replace('_', '-')}" for name in MULTI_TARGET_UNSUPPORTED if getattr(args, name)]
+    if unsupported:
+        raise ValueError(f"{', '.join(unsupported)} cannot be combined with a comma-separated --target")
+    outputs = translator.translate_multi(
+        prompt,
+        targets,
+        mode=args.mode,
+        context=context,
+        refine=args.refine,
+        strict_safety=args.strict_safety,
+        source_language=args.source_language,
+        use_rag_cache=args.enable_rag_cache,
+        render_profile=args.render_profile,
+    )
+    for target, output in outputs.items():
+        print(f"[target:{target}]")
+        print(output)
+    if args.verify:
+        for target, (ok, message) in translator.verify_outputs(outputs).items():
+            status = "ok" if ok else "warn"
+            print(f"\n[verify:{target}:{status}] {message}")
+
+
+def _parse_percent(value: str) -> float:
+    """Parse `10%` or `10` as a percentage."""
+    try:
+        return float(value.strip().rstrip("%"))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected a percentage like 10% (got {value!r})") from exc
+
+
+def build_compare_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="nevora-translator compare-reports",
+        description="Compare two batch reports and gate on performance regressions",
+    )
+    parser.add_argument("baseline", help="Baseline batch report JSON")
+    parser.add_argument("candidate", help="Candidate batch report JSON")
+    parser.add_argument("--max-p95-regression", type=_parse_percent, help="Fail if p95 latency (overall or per target) grows more than this, e.g. 10%%")
+    parser.add_argument("--max-p50-regression", type=_parse_percent, help="Fail if p50 latency grows more than this, e.g. 10%%")
+    parser.add_argument(
+        "--max-stage-regression",
+        type=_parse_percent,
+        help="Fail if any stage's p90 or p99 latency (plan, render, verify, ...) grows more than this, e.g. 25%%",
+    )
+    parser.add_argument("--max-throughput-drop", type=_parse_percent, help="Fail if items/s drops more than this, e.g. 10%%")
+    parser.add_argument("--max-success-rate-drop", type=float, help="Fail if success rate drops more than this (0.0-1.0)")
+    parser.add_argument("--max-verify-rate-drop", type=float, help="Fail if verify output/build rates drop more than this (0.0-1.0)")
+    parser.add_argument(
+        "--require-significance",
+        action="store_true",
+        help="Only fail latency gates when a Mann-Whitney U test on per-item timings is significant",
+    )
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level for the Mann-Whitney U test")
+    parser.add_argument("--output", help="Write the comparison JSON to this file")
     return parser
 
 
-def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
+def _run_compare_command(argv: list[str]) -> None:
+    from .report_compare import ReportGates, compare_batch_reports, evaluate_report_gates
+
+    args = build_compare_parser().parse_args(argv)
+    for name in ("max_success_rate_drop", "max_verify_rate_drop"):
+        value = getattr(args, name)
+        if value is not None and not (0.0 <= value <= 1.0):
+            raise ValueError(f"--{name.replace('_', '-')} must be between 0.0 and 1.0")
+
+    translator = EnglishToCodeTranslator(planner_provider="heuristic")
+    reports = [json.loads(Path(path).read_text(encoding="utf-8")) for path in (args.baseline, args.candidate)]
+    results = [translator.load_batch_report_results(path) for path in (args.baseline, args.candidate)]
+    comparison = compare_batch_reports(
+        reports[0],
+        reports[1],
+        baseline_results=results[0] if results[0] else None,
+        candidate_results=results[1] if results[1] else None,
+        alpha=args.alpha,
+    )
+    print(json.dumps(comparison, indent=2))
+    if args.output:
+        destination = Path(args.output)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_text(json.dumps(comparison, indent=2), encoding="utf-8")
+        print(f"\n[compare-reports] written: {destination}")
+
+    failures = evaluate_report_gates(
+        comparison,
+        ReportGates(
+            max_p95_regression_pct=args.max_p95_regression,
+            max_p50_regression_pct=args.max_p50_regression,
+            max_stage_regression_pct=args.max_stage_regression,
+            max_throughput_drop_pct=args.max_throughput_drop,
+            max_success_rate_drop=args.max_success_rate_drop,
+            max_verify_rate_drop=args.max_verify_rate_drop,
+            require_significance=args.require_significance,
+        ),
+    )
+    if failures:
+        raise SystemExit("Report comparison gate failed: " + "; ".join(failures))
+    print("\n[compare-gate:ok]")
+
+
+def build_stats_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="nevora-translator stats", description="Query batch history in a --results-db")
+    parser.add_argument("--results-db", default="nevora_results.db", help="SQLite results database path")
+    parser.add_argument("--target", help="Only items for this target")
+    parser.add_argument("--mode", help="Only items for this mode")
+    parser.add_argument("--provider", help="Only items resolved by this provider")
+    parser.add_argument("--source-language", help="Only items in this source language")
+    parser.add_argument("--last-runs", type=int, help="Only the most recent N runs")
+    parser.add_argument("--since-days", type=float, help="Only items recorded in the last N days")
+    parser.add_argument("--group-by", default="target", help="Comma-separated item columns to group by (target, mode, provider, source_language)")
+    parser.add_argument("--per-run", action="store_true", help="Show per-run latency trend instead of groups")
+    parser.add_argument("--runs", action="store_true", help="List recorded runs")
+    return parser
+
+
+def _run_stats_command(argv: list[str]) -> None:
+    import time
+
+    from .analytics import grouped_latency, run_trend
+    from .results_store import FILTER_COLUMNS, SQLiteResultsStore
+
+    args = build_stats_parser().parse_args(argv)
+    if not Path(args.results_db).exists():
+        raise SystemExit(f"Results database not found: {args.results_db}")
+    filters = {name: getattr(args, name) for name in FILTER_COLUMNS}
+    since_ts = time.time() - args.since_days * 86400 if args.since_days is not None else None
+    group_by = [name.strip() for name in args.group_by.split(",") if name.strip()]
+    unknown = set(group_by) - set(FILTER_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unsupported --group-by column(s): {', '.join(sorted(unknown))}. Supported: {', '.join(FILTER_COLUMNS)}")
+
+    started = perf_counter()
+    with SQLiteResultsStore(args.results_db) as store:
+        if args.runs:
+            payload: object = store.runs(limit=args.last_runs)
+        elif args.per_run:
+            payload = run_trend(store, last_runs=args.last_runs, since_ts=since_ts, **filters)
+        else:
+            payload = grouped_latency(store, group_by, last_runs=args.last_runs, since_ts=since_ts, **filters)
+    print(json.dumps(payload, indent=2))
+    print(f"\n[stats] query_ms={(perf_counter() - started) * 1000:.2f}")
+
+
+SUBCOMMANDS = {
+    "queue": _run_queue_command,
+    "compare-reports": _run_compare_command,
+    "stats": _run_stats_command,
+}
 
-    translator = EnglishToCodeTranslator(planner_provider=args.planner_provider)
+
+def main(argv: Optional[list[str]] = None) -> None:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] in SUBCOMMANDS:
+        SUBCOMMANDS[argv[0]](argv[1:])
+        return
+
+    args = build_parser().parse_args(argv)
+    with profiling(args.profile, args.profile_output, sample_interval_s=args.profile_interval_ms / 1000) as profile_files:
+        with metrics_exporting(args.metrics_file, args.metrics_port, args.metrics_interval):
+            _run_translate(args)
+    for path in profile_files:
+        print(f"\n[profile:{args.profile}] written: {path}")
+
+
+def _run_translate(args: argparse.Namespace) -> None:
+    translator = EnglishToCodeTranslator(
+        planner_provider=args.planner_provider,
+        track_memory=args.track_memory,
+        max_memory_mb=args.max_memory_mb,
+        trace=TraceCollector() if args.trace_file else None,
+        template_dir=args.template_dir,
+    )
 
     if args.warm_cache_file:
         prompts = [line.strip() for line in Path(args.warm_cache_file).read_text(encoding="utf-8").splitlines() if line.strip()]
@@ -120,24 +477,82 @@ def main() -> None:
         status = "ok" if ok else "warn"
         print(f"[sandbox:{status}] {message}")
 
+    targets = [target.strip() for target in args.target.split(",") if target.strip()]
+    if len(targets) > 1 and args.batch_input:
+        raise ValueError("A comma-separated --target only applies to single prompts; give batch items their own `target`")
+
     if args.batch_input:
-        items = _load_batch_items(args.batch_input)
-        resolved_workers = translator.suggest_swarm_workers(len(items)) if args.swarm_workers <= 0 else max(1, args.swarm_workers)
+        items = _load_batch_items(args.batch_input, parse_workers=args.batch_parse_workers)
+        if args.batch_estimate:
+            estimate = translator.estimate_batch_runtime(
+                items,
+                default_target=args.target,
+                default_mode=args.mode,
+                verify_generated=args.batch_verify_output,
+                verify_build=args.batch_verify_build,
+                default_source_language=args.source_language,
+                provider=args.provider,
+                history_reports=args.batch_estimate_history,
+                calibration_per_class=max(0, args.batch_estimate_sample),
+                worker_candidates=[int(x.strip()) for x in args.batch_estimate_workers.split(",") if x.strip()],
+            )
+            print("[batch-estimate]")
+            print(json.dumps(estimate, indent=2))
+            if args.batch_estimate_output:
+                destination = Path(args.batch_estimate_output)
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                destination.write_text(json.dumps(estimate, indent=2), encoding="utf-8")
+                print(f"\n[batch-estimate] written: {destination}")
+            return
+        benchmark_payload = None
+        if args.benchmark_input:
+            benchmark_payload = json.loads(Path(args.benchmark_input).read_text(encoding="utf-8"))
+        resolved_workers = (
+            translator.suggest_swarm_workers(len(items), benchmark=benchmark_payload)
+            if args.swarm_workers <= 0
+            else max(1, args.swarm_workers)
+        )
         print(f"[swarm-workers] using: {resolved_workers}")
+        provider_pool = None
+        if args.provider:
+            limits = replace(DEFAULT_PROVIDER_LIMITS[args.provider])
+            if args.provider_concurrency is not None:
+                limits.concurrency = max(1, args.provider_concurrency)
+            if args.provider_timeout is not None:
+                limits.timeout_s = max(0.1, args.provider_timeout)
+            if args.provider_retries is not None:
+                limits.retries = max(0, args.provider_retries)
+            provider_pool = ProviderPool(limits={args.provider: limits})
+        batch_started = perf_counter()
         results = translator.translate_batch(
             items,
             default_target=args.target,
             default_mode=args.mode,
             strict_safety=args.strict_safety,
             artifact_dir=args.batch_artifact_dir,
+            artifact_bundle=args.batch_artifact_bundle,
             include_explain=args.batch_include_explain,
             fail_fast=args.batch_fail_fast,
             verify_generated=args.batch_verify_output,
             verify_build=args.batch_verify_build,
             default_source_language=args.source_language,
             swarm_workers=resolved_workers,
+            deadline_policy=args.batch_deadline_policy,
+            baseline_report=args.batch_baseline,
+            provider=args.provider,
+            model=args.model,
+            provider_pool=provider_pool,
+            render_profile=args.render_profile,
         )
+        batch_wall_time_ms = (perf_counter() - batch_started) * 1000
         print(json.dumps(results, indent=2))
+        if translator.trace is not None:
+            print(f"\n[trace] written: {translator.trace.write(args.trace_file)}")
+            # Keep benchmark runs out of the timeline.
+            translator.trace = None
+        if args.track_memory:
+            print("\n[memory]")
+            print(json.dumps(translator.memory_report(results), indent=2))
         if args.benchmark_swarm:
             candidates = [int(x.strip()) for x in args.benchmark_workers.split(",") if x.strip()]
             bench = translator.benchmark_swarm_configs(
@@ -146,12 +561,29 @@ def main() -> None:
                 default_mode=args.mode,
                 worker_candidates=candidates,
                 default_source_language=args.source_language,
+                repeats=args.benchmark_repeats,
+                warmup=args.benchmark_warmup,
+                scenarios=[x.strip() for x in args.benchmark_scenarios.split(",") if x.strip()],
             )
             print("\n[swarm-benchmark]")
             print(json.dumps(bench, indent=2))
+            if args.benchmark_output:
+                destination = Path(args.benchmark_output)
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                destination.write_text(json.dumps(bench, indent=2), encoding="utf-8")
+                print(f"\n[swarm-benchmark] written: {destination}")
+
+        if args.results_db:
+            run_id = translator.record_batch_run(results, args.results_db, label=args.results_label, wall_time_ms=batch_wall_time_ms)
+            print(f"\n[results-db] recorded run {run_id} in: {args.results_db}")
 
         if args.batch_report:
-            destination = translator.write_batch_report(results, args.batch_report)
+            destination = translator.write_batch_report(
+                results,
+                args.batch_report,
+                results_sidecar=args.batch_report_sidecar,
+                wall_time_ms=batch_wall_time_ms,
+            )
             print(f"\n[batch-report] written: {destination}")
 
         if args.batch_min_success_rate is not None:
@@ -203,6 +635,10 @@ def main() -> None:
     if not prompt:
         raise ValueError("--prompt is required unless --batch-input or --audio-input is provided")
 
+    if len(targets) > 1:
+        _run_multi_target(translator, args, prompt, targets, context)
+        return
+
     asset_result = None
     if args.engine and args.asset_library:
         asset_result = translator.translate_with_asset_library(
@@ -216,8 +652,13 @@ def main() -> None:
             use_rag_cache=args.enable_rag_cache,
         )
         output = asset_result["output"]
+        print(output)
     else:
-        output = translator.translate(
+        # Stream chunks to stdout as they render; later steps (verify, audio, ...) reuse the joined text.
+        # With --strict-safety a blocked pattern can surface in a later chunk, after earlier ones
+        # would already be on screen, so hold the output until every chunk has been scanned.
+        chunks: list[str] = []
+        for chunk in translator.translate_iter(
             prompt=prompt,
             target=args.target,
             mode=args.mode,
@@ -226,8 +667,15 @@ def main() -> None:
             strict_safety=args.strict_safety,
             source_language=args.source_language,
             use_rag_cache=args.enable_rag_cache,
-        )
-    print(output)
+            render_profile=args.render_profile,
+        ):
+            if not args.strict_safety:
+                sys.stdout.write(chunk)
+            chunks.append(chunk)
+        output = "".join(chunks)
+        if args.strict_safety:
+            sys.stdout.write(output)
+        sys.stdout.write("\n")
     if asset_result is not None:
         print("\n[asset-selection]")
         print(json.dumps(asset_result["selected_assets"], indent=2))
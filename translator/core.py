@@ -3,19 +3,30 @@ from __future__ import annotations
 import json
 import logging
 import os
+import platform
 import re
 import shlex
 import shutil
+import statistics
 import subprocess
+import threading
+import tracemalloc
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from hashlib import sha256
 from time import perf_counter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 
 logger = logging.getLogger(__name__)
 
+from translator import metrics
+from translator._version import __version__
+from translator.artifacts import ArtifactWriter, write_chunks
+from translator.estimator import ESTIMATE_BACKENDS, BatchCostModel, ItemClass, item_class_fields, predict_wall_ms
+from translator.generators.provider_pool import ProviderPool
+from translator.memory import current_rss_bytes, deep_sizeof
 from translator.models import (
     EventSpec,
     GenerationIR,
@@ -26,10 +37,16 @@ from translator.models import (
     StateTransition,
 )
 from translator.planners.heuristic import HeuristicPlanner
-from translator.planners.openai_planner import OpenAISemanticPlanner
-from translator.planners.huggingface_planner import HuggingFaceSemanticPlanner
-from translator.services import BatchReportService, validate_ordered_results
+from translator.planners.registry import available_planners, create_planner
+from translator.results_store import SQLiteResultsStore
+from translator.safety import SafetyScanner
+from translator.services import BatchReportService, percentile, validate_ordered_results
+from translator.spans import annotate, collect_spans, span
+from translator.targets.base import RENDER_PROFILES, render_chunks
 from translator.targets.registry import build_registry
+from translator.targets.templating import TemplateLoader
+from translator.tracing import TraceCollector
+from translator.verifiers import VerifierPool, default_verifier_pool
 
 
 class EnglishToCodeTranslator:
@@ -38,6 +55,22 @@ class EnglishToCodeTranslator:
     SOURCE_LANGUAGES = {"english", "spanish", "french", "german", "portuguese"}
     AUDIO_LANGUAGES = SOURCE_LANGUAGES
     ASSET_ENGINES = {"unreal", "unity"}
+    DEADLINE_POLICIES = {"downgrade", "skip"}
+    SCHEDULING_FIELDS = ("priority", "deadline_ms")
+    RUN_SPECIFIC_FIELDS = {
+        "artifact_output_file",
+        "artifact_plan_file",
+        "artifact_bundle",
+        "deadline_action",
+        "deadline_missed",
+        "queue_worker",
+        "stage_timings_ms",
+        "stage_memory_kb",
+    }
+    BENCHMARK_SCENARIOS = {"cold", "warm"}
+    # Shed caches once RSS reaches this share of max_memory_mb, down to the target share.
+    MEMORY_SHED_THRESHOLD = 0.9
+    MEMORY_SHED_TARGET = 0.75
     BLOCKED_PATTERNS = [
         "rm -rf /",
         "shutdown",
@@ -122,21 +155,41 @@ class EnglishToCodeTranslator:
         self,
         planner: Optional[object] = None,
         planner_provider: str = "auto",
+        stage_timings: bool = True,
+        track_memory: bool = False,
+        max_memory_mb: Optional[float] = None,
+        trace: Optional[TraceCollector] = None,
+        template_dir: Optional[str] = None,
+        verifiers: Optional[VerifierPool] = None,
     ) -> None:
-        if planner_provider not in self.PLANNER_PROVIDERS:
+        if planner_provider not in self.PLANNER_PROVIDERS and planner_provider not in available_planners():
             raise ValueError(
                 f"Unsupported planner_provider '{planner_provider}'. "
-                f"Supported: {', '.join(sorted(self.PLANNER_PROVIDERS))}"
+                f"Supported: {', '.join(sorted(self.PLANNER_PROVIDERS | set(available_planners())))}"
             )
         self._heuristic = HeuristicPlanner()
         self.planner = planner
         self.planner_provider = planner_provider
         self._last_resolved_provider = "custom" if planner is not None else planner_provider
-        self.renderers = build_registry()
+        self.templates = TemplateLoader(template_dir)
+        self.renderers = build_registry(self.templates)
+        # Long-lived syntax checkers; no worker process starts until the first verification.
+        self.verifiers = verifiers or default_verifier_pool()
         self._rag_lattice: dict[tuple[int, int, int, int], list[dict[str, str]]] = {}
         self._plan_cache: dict[tuple[str, str], GenerationPlan] = {}
         self.lattice_shape = (12, 12, 12, 12)
         self._batch_report_service = BatchReportService(self.lattice_shape)
+        self.stage_timings = stage_timings
+        self.track_memory = track_memory
+        self.max_memory_mb = max_memory_mb
+        self._memory_lock = threading.Lock()
+        self._memory_sheds = {"events": 0, "plan_cache_entries": 0, "rag_entries": 0}
+        # True from the first shed above the threshold until RSS drops back under it.
+        self._memory_over_budget = False
+        # Cache entry count at the last shed; RSS rarely falls after a shed, so the
+        # caches must grow back to this size before they are shed again.
+        self._memory_shed_resume_entries: Optional[int] = None
+        self.trace = trace
 
     @property
     def supported_targets(self) -> set[str]:
@@ -153,20 +206,17 @@ class EnglishToCodeTranslator:
         if self.planner_provider == "heuristic":
             self._last_resolved_provider = "heuristic"
             return self._heuristic
-        if self.planner_provider == "openai":
-            self._last_resolved_provider = "openai"
-            return OpenAISemanticPlanner()
-        if self.planner_provider == "huggingface":
-            self._last_resolved_provider = "huggingface"
-            return HuggingFaceSemanticPlanner()
+        if self.planner_provider != "auto":
+            self._last_resolved_provider = self.planner_provider
+            return create_planner(self.planner_provider)
 
         try:
             self._last_resolved_provider = "huggingface"
-            return HuggingFaceSemanticPlanner()
+            return create_planner("huggingface")
         except Exception:
             try:
                 self._last_resolved_provider = "openai"
-                return OpenAISemanticPlanner()
+                return create_planner("openai")
             except Exception:
                 self._last_resolved_provider = "heuristic"
                 return self._heuristic
@@ -188,10 +238,7 @@ class EnglishToCodeTranslator:
     def _enforce_safety(self, text: str, strict_safety: bool = False) -> None:
         if not strict_safety:
             return
-        lowered = text.lower()
-        for pattern in self.BLOCKED_PATTERNS:
-            if pattern in lowered:
-                raise ValueError(f"Safety policy blocked content containing pattern: {pattern}")
+        SafetyScanner(self.BLOCKED_PATTERNS).feed(text)
 
     def _normalize_prompt_language(self, prompt: str, source_language: str = "english") -> str:
         language = source_language.lower().strip()
@@ -270,12 +317,16 @@ class EnglishToCodeTranslator:
             fallback.write_text(text, encoding="utf-8")
             return str(fallback)
 
-    def plan_intent(self, prompt: str, mode: str = "gameplay") -> ParsedIntent:
+    def plan_intent(self, prompt: str, mode: str = "gameplay", fast_path: bool = False) -> ParsedIntent:
+        if fast_path:
+            self._last_resolved_provider = "heuristic"
+            return self._canonicalize_intent(self._heuristic.plan(prompt, mode=mode))
         try:
             planner = self._get_planner()
             raw_intent = planner.plan(prompt, mode=mode)
         except Exception as exc:
             logger.warning("Planner failed; using heuristic fallback: %s", exc)
+            metrics.inc("nevora_planner_fallbacks", planner=self.planner_provider)
             self._last_resolved_provider = "heuristic-fallback"
             raw_intent = self._heuristic.plan(prompt, mode=mode)
         return self._canonicalize_intent(raw_intent)
@@ -294,13 +345,13 @@ class EnglishToCodeTranslator:
             error_branches=error_branches,
         )
 
-    def build_generation_plan(self, prompt: str, mode: str = "gameplay") -> GenerationPlan:
+    def build_generation_plan(self, prompt: str, mode: str = "gameplay", fast_path: bool = False) -> GenerationPlan:
         cache_key = (prompt, mode)
         cached = self._plan_cache.get(cache_key)
         if cached is not None:
             return cached
 
-        intent = self.plan_intent(prompt, mode=mode)
+        intent = self.plan_intent(prompt, mode=mode, fast_path=fast_path)
         ir = self._build_ir(intent)
         steps = [
             PlanStep("intent-parse", f"entities={intent.entities}, actions={intent.actions}"),
@@ -311,6 +362,9 @@ class EnglishToCodeTranslator:
         ]
         state_model = {"active": "bool", "last_event": "string", "status": "string"}
         plan = GenerationPlan(intent=intent, ir=ir, steps=steps, state_model=state_model)
+        if fast_path:
+            # Fast-path plans skip the configured planner; keep them out of the shared cache.
+            return plan
         self._plan_cache[cache_key] = plan
         if len(self._plan_cache) > 256:
             oldest = next(iter(self._plan_cache))
@@ -365,6 +419,90 @@ class EnglishToCodeTranslator:
         bucket = self._lattice_bucket(prompt, target, mode, source_language)
         return list(self._rag_lattice.get(bucket, [])[-limit:])
 
+    def memory_report(self, batch_results: Optional[list[dict[str, Any]]] = None) -> dict[str, Any]:
+        """Estimated deep size and entry counts of the translator caches.
+
+        Pass `batch_results` to include in-flight results and their explain
+        payloads.
+        """
+        plan_cache = dict(self._plan_cache)
+        rag_lattice = {bucket: list(entries) for bucket, entries in self._rag_lattice.items()}
+        report: dict[str, Any] = {
+            "plan_cache": {"entries": len(plan_cache), "bytes": deep_sizeof(plan_cache)},
+            "rag_lattice": {
+                "buckets": len(rag_lattice),
+                "entries": sum(len(entries) for entries in rag_lattice.values()),
+                "bytes": deep_sizeof(rag_lattice),
+            },
+            "process_rss_bytes": current_rss_bytes(),
+            "max_memory_mb": self.max_memory_mb,
+            "sheds": dict(self._memory_sheds),
+        }
+        if batch_results is not None:
+            report["batch_results"] = {
+                "entries": len(batch_results),
+                "bytes": deep_sizeof(batch_results),
+                "explain_bytes": deep_sizeof([item["explain"] for item in batch_results if "explain" in item]),
+            }
+        return report
+
+    def enforce_memory_budget(self) -> Optional[dict[str, int]]:
+        """Shed cache entries when RSS nears `max_memory_mb`.
+
+        Plan cache entries go first, oldest first, since dropping them never
+        changes output; whole RAG lattice buckets (which feed hints into
+        prompts) follow in bucket creation order only if that was not enough.
+        Returns what was shed, or None when under budget or nothing is left
+        to shed. The warning is logged once per crossing of the threshold.
+
+        Freed objects rarely return pages to the OS, so RSS can stay above the
+        threshold after a shed. Shedding therefore pauses until the caches
+        hold as many entries as they did before the last shed.
+        """
+        if self.max_memory_mb is None:
+            return None
+        budget = self.max_memory_mb * 1024 * 1024
+        rss = current_rss_bytes()
+        if rss is None or rss < budget * self.MEMORY_SHED_THRESHOLD:
+            self._memory_over_budget = False
+            self._memory_shed_resume_entries = None
+            return None
+
+        needed = rss - budget * self.MEMORY_SHED_TARGET
+        freed = 0
+        shed = {"plan_cache_entries": 0, "rag_entries": 0}
+        with self._memory_lock:
+            entries_before = len(self._plan_cache) + sum(len(entries) for entries in self._rag_lattice.values())
+            if self._memory_shed_resume_entries is not None and entries_before < self._memory_shed_resume_entries:
+                return None
+            for key in list(self._plan_cache):
+                if freed >= needed:
+                    break
+                plan = self._plan_cache.pop(key, None)
+                if plan is not None:
+                    freed += deep_sizeof((key, plan))
+                    shed["plan_cache_entries"] += 1
+            for bucket in list(self._rag_lattice):
+                if freed >= needed:
+                    break
+                entries = self._rag_lattice.pop(bucket, None) or []
+                freed += deep_sizeof(entries)
+                shed["rag_entries"] += len(entries)
+            if not any(shed.values()):
+                # Caches are already empty; nothing to free, count or report.
+                return None
+            self._memory_sheds["events"] += 1
+            for key, count in shed.items():
+                self._memory_sheds[key] += count
+            self._memory_shed_resume_entries = entries_before
+            first_crossing = not self._memory_over_budget
+            self._memory_over_budget = True
+        metrics.inc("nevora_cache_evictions", shed["plan_cache_entries"], cache="plan")
+        metrics.inc("nevora_cache_evictions", shed["rag_entries"], cache="rag")
+        if first_crossing:
+            logger.warning("RSS %.1f MiB near --max-memory-mb %.1f; shed %s", rss / 1048576, self.max_memory_mb, shed)
+        return shed
+
     def run_in_vm_sandbox(self, command: list[str], timeout_s: int = 20) -> tuple[bool, str]:
         if not command:
             return False, "No command provided"
@@ -514,12 +652,145 @@ class EnglishToCodeTranslator:
         destination.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
         return str(destination)
 
-    def suggest_swarm_workers(self, batch_size: int, max_workers: int = 8) -> int:
+    def suggest_swarm_workers(
+        self,
+        batch_size: int,
+        max_workers: int = 8,
+        benchmark: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Suggest a worker count, preferring measured `benchmark_swarm_configs` output when given."""
         if batch_size <= 0:
             return 1
+        if benchmark and benchmark.get("best_workers"):
+            return max(1, min(batch_size, max_workers, int(benchmark["best_workers"])))
         cpu_count = os.cpu_count() or 2
         return max(1, min(batch_size, max_workers, cpu_count))
 
+    def estimate_batch_runtime(
+        self,
+        items: list[dict[str, Any]],
+        default_target: str,
+        default_mode: str = "gameplay",
+        verify_generated: bool = False,
+        verify_build: bool = False,
+        default_source_language: str = "english",
+        provider: Optional[str] = None,
+        history_reports: Optional[list[str]] = None,
+        calibration_per_class: int = 0,
+        worker_candidates: Optional[list[int]] = None,
+        backends: Optional[list[str]] = None,
+        provider_pool: Optional[ProviderPool] = None,
+    ) -> dict[str, Any]:
+        """Predict batch wall time for worker counts and backends without running the batch.
+
+        Items are classified by target, mode, verify/build flags and provider.
+        Per-class costs come from previous batch reports (`history_reports`),
+        and classes missing from history are calibrated by translating up to
+        `calibration_per_class` of their items. `best_workers` in the result
+        can be fed to `suggest_swarm_workers(benchmark=...)`.
+        """
+        selected_backends = list(dict.fromkeys(backends or ESTIMATE_BACKENDS))
+        unknown_backends = set(selected_backends) - set(ESTIMATE_BACKENDS)
+        if unknown_backends:
+            raise ValueError(
+                f"Unsupported estimate backend(s) {', '.join(sorted(unknown_backends))}. Supported: {', '.join(ESTIMATE_BACKENDS)}"
+            )
+        candidates = sorted({max(1, int(c)) for c in (worker_candidates or [1, 2, 4, 8, 16])})
+        pool = provider_pool or ProviderPool()
+
+        model = BatchCostModel()
+        history_items = sum(model.add_results(self.load_batch_report_results(path)) for path in history_reports or [])
+
+        classes: dict[ItemClass, list[int]] = {}
+        for idx, item in enumerate(items):
+            item_provider = item.get("provider", provider)
+            item_class = (
+                str(item.get("target", default_target)).strip(),
+                str(item.get("mode", default_mode)).strip(),
+                verify_generated,
+                verify_build,
+                str(item_provider) if item_provider else "template",
+            )
+            classes.setdefault(item_class, []).append(idx)
+
+        calibrated_items = 0
+        if calibration_per_class > 0:
+            sample = [items[idx] for key, indices in classes.items() if key not in model.classes for idx in indices[:calibration_per_class]]
+            if sample:
+                calibration = self.translate_batch(
+                    sample,
+                    default_target=default_target,
+                    default_mode=default_mode,
+                    verify_generated=verify_generated,
+                    verify_build=verify_build,
+                    default_source_language=default_source_language,
+                    provider=provider,
+                    provider_pool=pool,
+                )
+                calibrated_items = model.add_results(calibration)
+
+        class_rows: list[dict[str, Any]] = []
+        serial_total = parallel_total = longest = 0.0
+        provider_ms: dict[str, float] = {}
+        unknown_items = 0
+        for item_class, indices in classes.items():
+            cost, source = model.cost(item_class)
+            row = {**item_class_fields(item_class), "items": len(indices), "cost_source": source}
+            if cost is None:
+                unknown_items += len(indices)
+                class_rows.append({**row, "item_ms": None, "total_ms": None, "share": None})
+                continue
+            serial_ms, parallel_ms = cost
+            serial_total += serial_ms * len(indices)
+            parallel_total += parallel_ms * len(indices)
+            longest = max(longest, serial_ms + parallel_ms)
+            if item_class[4] != "template":
+                provider_ms[item_class[4]] = provider_ms.get(item_class[4], 0.0) + parallel_ms * len(indices)
+            class_rows.append({**row, "item_ms": round(serial_ms + parallel_ms, 3), "total_ms": (serial_ms + parallel_ms) * len(indices)})
+
+        grand_total = serial_total + parallel_total
+        for row in class_rows:
+            if row["total_ms"] is not None:
+                row["share"] = round(row["total_ms"] / grand_total, 4) if grand_total else 0.0
+                row["total_ms"] = round(row["total_ms"], 3)
+        class_rows.sort(key=lambda row: row["total_ms"] or 0.0, reverse=True)
+
+        dominant: list[dict[str, Any]] = []
+        covered = 0.0
+        for row in class_rows:
+            if row["share"] is None or (dominant and covered >= 0.8):
+                break
+            dominant.append(row)
+            covered += row["share"]
+
+        concurrency = {name: limits.concurrency for name, limits in pool.limits.items()}
+        predictions = [
+            {
+                "backend": backend,
+                "workers": workers,
+                "wall_ms": round(predict_wall_ms(serial_total, parallel_total, longest, workers, backend, provider_ms, concurrency), 3),
+            }
+            for backend in selected_backends
+            for workers in candidates
+        ]
+        # translate_batch runs a thread swarm; take the fewest workers within 5% of its best time.
+        thread_predictions = [p for p in predictions if p["backend"] == "threads"] or predictions
+        fastest = min(p["wall_ms"] for p in thread_predictions)
+        best_workers = min(p["workers"] for p in thread_predictions if p["wall_ms"] <= fastest * 1.05)
+        return {
+            "items": len(items),
+            "history_items": history_items,
+            "calibrated_items": calibrated_items,
+            "unknown_items": unknown_items,
+            "serial_ms": round(serial_total, 3),
+            "parallel_ms": round(parallel_total, 3),
+            "classes": class_rows,
+            "dominant_classes": dominant,
+            "predictions": predictions,
+            "best_workers": best_workers,
+            "suggested_swarm_workers": self.suggest_swarm_workers(len(items), max_workers=max(candidates), benchmark={"best_workers": best_workers}),
+        }
+
     def analyze_batch_report(self, report: dict[str, Any]) -> dict[str, Any]:
         success_rate = float(report.get("success_rate", 0.0))
         avg_elapsed_ms = float(report.get("avg_elapsed_ms", 0.0))
@@ -557,12 +828,32 @@ class EnglishToCodeTranslator:
         default_mode: str = "gameplay",
         worker_candidates: Optional[list[int]] = None,
         default_source_language: str = "english",
+        repeats: int = 3,
+        warmup: int = 1,
+        scenarios: Optional[list[str]] = None,
     ) -> dict[str, Any]:
+        """Benchmark worker candidates with warm-up runs and repeated measurements.
+
+        `cold` runs clear the plan cache and RAG lattice before every measured
+        run; `warm` runs measure after the caches were filled by the warm-up.
+        Each candidate starts from the same cache state, so the order of
+        candidates no longer biases the result. Caches are restored afterwards.
+        """
         candidates = worker_candidates or [1, 2, 4]
         cleaned = sorted({max(1, int(c)) for c in candidates})
-        timings: list[dict[str, Any]] = []
+        selected_scenarios = list(dict.fromkeys(scenarios or ["cold", "warm"]))
+        unknown = set(selected_scenarios) - self.BENCHMARK_SCENARIOS
+        if unknown:
+            raise ValueError(
+                f"Unsupported benchmark scenario(s) {', '.join(sorted(unknown))}. "
+                f"Supported: {', '.join(sorted(self.BENCHMARK_SCENARIOS))}"
+            )
+        repeats = max(1, int(repeats))
+        warmup = max(0, int(warmup))
+        saved_plan_cache = dict(self._plan_cache)
+        saved_rag_lattice = {bucket: list(entries) for bucket, entries in self._rag_lattice.items()}
 
-        for workers in cleaned:
+        def run_once(workers: int) -> float:
             started = perf_counter()
             self.translate_batch(
                 items,
@@ -576,15 +867,69 @@ class EnglishToCodeTranslator:
                 default_source_language=default_source_language,
                 swarm_workers=workers,
             )
-            elapsed_ms = round((perf_counter() - started) * 1000, 3)
-            timings.append({"workers": workers, "elapsed_ms": elapsed_ms})
+            return (perf_counter() - started) * 1000
 
-        best = min(timings, key=lambda t: t["elapsed_ms"]) if timings else {"workers": 1, "elapsed_ms": 0.0}
+        timings: list[dict[str, Any]] = []
+        try:
+            for scenario in selected_scenarios:
+                for workers in cleaned:
+                    self._plan_cache.clear()
+                    self._rag_lattice.clear()
+                    for _ in range(warmup):
+                        run_once(workers)
+                    runs: list[float] = []
+                    for _ in range(repeats):
+                        if scenario == "cold":
+                            self._plan_cache.clear()
+                            self._rag_lattice.clear()
+                        runs.append(run_once(workers))
+                    timings.append(self._summarize_benchmark_runs(workers, scenario, runs, len(items)))
+        finally:
+            self._plan_cache.clear()
+            self._plan_cache.update(saved_plan_cache)
+            self._rag_lattice.clear()
+            self._rag_lattice.update(saved_rag_lattice)
+
+        best_by_scenario: dict[str, dict[str, Any]] = {}
+        for scenario in selected_scenarios:
+            scenario_timings = [t for t in timings if t["scenario"] == scenario]
+            if scenario_timings:
+                best = min(scenario_timings, key=lambda t: t["median_ms"])
+                best_by_scenario[scenario] = {"workers": best["workers"], "median_ms": best["median_ms"]}
+
+        primary = best_by_scenario.get(selected_scenarios[0], {"workers": 1, "median_ms": 0.0})
         return {
             "batch_size": len(items),
+            "repeats": repeats,
+            "warmup": warmup,
+            "scenarios": selected_scenarios,
+            "host": {
+                "cpu_count": os.cpu_count(),
+                "python_version": platform.python_version(),
+                "python_implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "backend": "threads",
+                "planner_provider": self.planner_provider,
+            },
             "timings": timings,
-            "best_workers": best["workers"],
-            "best_elapsed_ms": best["elapsed_ms"],
+            "best_by_scenario": best_by_scenario,
+            "best_workers": primary["workers"],
+            "best_elapsed_ms": primary["median_ms"],
+        }
+
+    def _summarize_benchmark_runs(self, workers: int, scenario: str, runs: list[float], batch_size: int) -> dict[str, Any]:
+        ordered = sorted(runs)
+        median_ms = statistics.median(ordered)
+        return {
+            "workers": workers,
+            "scenario": scenario,
+            "runs_ms": [round(run, 3) for run in runs],
+            "median_ms": round(median_ms, 3),
+            "mean_ms": round(statistics.fmean(ordered), 3),
+            "p95_ms": round(percentile(ordered, 0.95), 3),
+            "stdev_ms": round(statistics.stdev(ordered), 3) if len(ordered) > 1 else 0.0,
+            "throughput_items_per_s": round(batch_size / (median_ms / 1000), 3) if median_ms > 0 else 0.0,
+            "elapsed_ms": round(median_ms, 3),
         }
 
     def generate_assistant_runbook(
@@ -715,48 +1060,240 @@ class EnglishToCodeTranslator:
             "suggested_command": suggested_command,
         }
 
-    def translate(
-        self,
-        prompt: str,
-        target: str,
-        mode: str = "gameplay",
-        context: Optional[str] = None,
-        refine: bool = False,
-        strict_safety: bool = False,
-        source_language: str = "english",
-        use_rag_cache: bool = False,
-    ) -> str:
-        if mode not in self.MODES:
-            raise ValueError(f"Unsupported mode '{mode}'. Supported: {', '.join(sorted(self.MODES))}")
+    def _normalize_render_profile(self, render_profile: str) -> str:
+        normalized = str(render_profile).strip().lower()
+        if normalized not in RENDER_PROFILES:
+            raise ValueError(f"Unsupported render_profile '{render_profile}'. Supported: {', '.join(RENDER_PROFILES)}")
+        return normalized
 
+    def _normalize_target(self, target: str) -> str:
         normalized_target = target.strip().lower()
-        if normalized_target not in self.supported_targets:
+        if normalized_target not in self.renderers:
             supported = ", ".join(sorted(self.supported_targets))
             raise ValueError(f"Unsupported target '{target}'. Supported: {supported}")
+        return normalized_target
 
-        normalized_prompt = self._normalize_prompt_language(prompt, source_language=source_language)
-        normalized_context = None
-        if context is not None:
-            normalized_context = self._normalize_prompt_language(context, source_language=source_language)
+    def _prepare_prompt(
+        self,
+        prompt: str,
+        context: Optional[str],
+        refine: bool,
+        strict_safety: bool,
+        source_language: str,
+    ) -> str:
+        """Normalize a prompt (plus refine context) and safety-check the result."""
+        with span("normalize"):
+            normalized_prompt = self._normalize_prompt_language(prompt, source_language=source_language)
+            normalized_context = None
+            if context is not None:
+                normalized_context = self._normalize_prompt_language(context, source_language=source_language)
 
         combined_prompt = normalized_prompt
         if refine and normalized_context:
             combined_prompt = f"{normalized_prompt}\n\nPrevious output context:\n{normalized_context}"
 
-        self._enforce_safety(combined_prompt, strict_safety=strict_safety)
+        with span("safety"):
+            self._enforce_safety(combined_prompt, strict_safety=strict_safety)
+        return combined_prompt
+
+    def _plan_for_target(
+        self,
+        combined_prompt: str,
+        target: str,
+        mode: str,
+        source_language: str,
+        use_rag_cache: bool,
+        fast_path: bool,
+    ) -> GenerationPlan:
+        """Plan a prepared prompt, with the target's RAG memory hints when enabled."""
         rag_context = ""
         if use_rag_cache:
-            neighbors = self.rag_retrieve(combined_prompt, normalized_target, mode=mode, source_language=source_language, limit=2)
+            with span("rag"):
+                neighbors = self.rag_retrieve(combined_prompt, target, mode=mode, source_language=source_language, limit=2)
+            metrics.inc("nevora_rag_lookups", result="hit" if neighbors else "miss")
+            annotate(rag_hit=bool(neighbors))
             if neighbors:
                 rag_context = "\n\nRAG memory hints:\n" + "\n".join(n["output"][:240] for n in neighbors)
-        plan = self.build_generation_plan(combined_prompt + rag_context, mode=mode)
-        renderer = self.renderers[normalized_target]
-        output = renderer.render(combined_prompt, plan.intent, mode=mode, plan=plan)
-        self._enforce_safety(output, strict_safety=strict_safety)
+        with span("plan"):
+            # Counted here rather than in build_generation_plan, so explain_plan and other
+            # read-only lookups of an item's plan do not add hits or overwrite its trace arg.
+            cache_hit = (combined_prompt + rag_context, mode) in self._plan_cache
+            metrics.inc("nevora_plan_cache_requests", result="hit" if cache_hit else "miss")
+            annotate(plan_cache_hit=cache_hit)
+            return self.build_generation_plan(combined_prompt + rag_context, mode=mode, fast_path=fast_path)
+
+    def _plan_prompt(
+        self,
+        prompt: str,
+        target: str,
+        mode: str,
+        context: Optional[str],
+        refine: bool,
+        strict_safety: bool,
+        source_language: str,
+        use_rag_cache: bool,
+        fast_path: bool,
+    ) -> tuple[str, GenerationPlan]:
+        """Normalize, safety-check and plan a prompt for one target."""
+        combined_prompt = self._prepare_prompt(prompt, context, refine, strict_safety, source_language)
+        return combined_prompt, self._plan_for_target(combined_prompt, target, mode, source_language, use_rag_cache, fast_path)
+
+    def _render_target(
+        self,
+        combined_prompt: str,
+        plan: GenerationPlan,
+        target: str,
+        mode: str,
+        strict_safety: bool,
+        source_language: str,
+        use_rag_cache: bool,
+        render_profile: str = "default",
+    ) -> str:
+        with span("render"):
+            renderer = self.renderers[target]
+            if render_profile == "default":
+                output = renderer.render(combined_prompt, plan.intent, mode=mode, plan=plan)
+            else:
+                output = renderer.render(combined_prompt, plan.intent, mode=mode, plan=plan, render_profile=render_profile)
+        with span("safety"):
+            self._enforce_safety(output, strict_safety=strict_safety)
         if use_rag_cache:
-            self._rag_store(combined_prompt, output, normalized_target, mode, source_language)
+            with span("rag"):
+                self._rag_store(combined_prompt, output, target, mode, source_language)
+        metrics.inc("nevora_translate_calls", target=target, mode=mode, provider=self._last_resolved_provider)
         return output
 
+    def translate(
+        self,
+        prompt: str,
+        target: str,
+        mode: str = "gameplay",
+        context: Optional[str] = None,
+        refine: bool = False,
+        strict_safety: bool = False,
+        source_language: str = "english",
+        use_rag_cache: bool = False,
+        fast_path: bool = False,
+        render_profile: str = "default",
+    ) -> str:
+        """Translate a prompt into starter code for one target.
+
+        `render_profile="performance"` selects the performance-oriented
+        templates for modes and targets that have them.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported mode '{mode}'. Supported: {', '.join(sorted(self.MODES))}")
+        normalized_target = self._normalize_target(target)
+        profile = self._normalize_render_profile(render_profile)
+        combined_prompt, plan = self._plan_prompt(
+            prompt, normalized_target, mode, context, refine, strict_safety, source_language, use_rag_cache, fast_path
+        )
+        return self._render_target(combined_prompt, plan, normalized_target, mode, strict_safety, source_language, use_rag_cache, profile)
+
+    def translate_iter(
+        self,
+        prompt: str,
+        target: str,
+        mode: str = "gameplay",
+        context: Optional[str] = None,
+        refine: bool = False,
+        strict_safety: bool = False,
+        source_language: str = "english",
+        use_rag_cache: bool = False,
+        fast_path: bool = False,
+        render_profile: str = "default",
+    ) -> Iterator[str]:
+        """Like `translate()`, but yield the output in chunks as the renderer produces them.
+
+        Planning happens on the first `next()`. With `strict_safety`, every
+        chunk is scanned before it is yielded; a pattern spanning a chunk
+        boundary raises ValueError on the chunk that completes it, so
+        consumers should discard partial output on error (`write_chunks`
+        does). The chunks joined equal `translate()`'s result. `render` and
+        `safety` spans are recorded per chunk, so stage timings sum as in
+        `translate()`.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported mode '{mode}'. Supported: {', '.join(sorted(self.MODES))}")
+        normalized_target = self._normalize_target(target)
+        profile = self._normalize_render_profile(render_profile)
+        combined_prompt, plan = self._plan_prompt(
+            prompt, normalized_target, mode, context, refine, strict_safety, source_language, use_rag_cache, fast_path
+        )
+        chunks = iter(render_chunks(self.renderers[normalized_target], combined_prompt, plan.intent, mode=mode, plan=plan, render_profile=profile))
+        scanner = SafetyScanner(self.BLOCKED_PATTERNS) if strict_safety else None
+        # RAG memory stores whole outputs, so only then are chunks retained.
+        retained: Optional[list[str]] = [] if use_rag_cache else None
+        while True:
+            # Spans close before each yield, so time spent by the consumer is not counted as a stage.
+            with span("render"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            if scanner is not None:
+                with span("safety"):
+                    scanner.feed(chunk)
+            if retained is not None:
+                retained.append(chunk)
+            yield chunk
+        if retained is not None:
+            with span("rag"):
+                self._rag_store(combined_prompt, "".join(retained), normalized_target, mode, source_language)
+        metrics.inc("nevora_translate_calls", target=normalized_target, mode=mode, provider=self._last_resolved_provider)
+
+    def translate_multi(
+        self,
+        prompt: str,
+        targets: list[str],
+        mode: str = "gameplay",
+        context: Optional[str] = None,
+        refine: bool = False,
+        strict_safety: bool = False,
+        source_language: str = "english",
+        use_rag_cache: bool = False,
+        fast_path: bool = False,
+        render_profile: str = "default",
+    ) -> dict[str, str]:
+        """Render one prompt for several targets, keyed by target in the given order.
+
+        Normalization and safety checks run once. Without RAG, planning also
+        runs once and every target renders from the shared `GenerationPlan`.
+        RAG memory is stored per target, so with `use_rag_cache` each target
+        retrieves its own hints and is planned separately (identical plans
+        still come from the plan cache). Either way each output matches a
+        separate `translate()` call.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported mode '{mode}'. Supported: {', '.join(sorted(self.MODES))}")
+        normalized_targets = list(dict.fromkeys(self._normalize_target(target) for target in targets))
+        profile = self._normalize_render_profile(render_profile)
+        if not normalized_targets:
+            raise ValueError("translate_multi requires at least one target")
+        combined_prompt = self._prepare_prompt(prompt, context, refine, strict_safety, source_language)
+        shared_plan = None
+        if not use_rag_cache:
+            shared_plan = self._plan_for_target(combined_prompt, normalized_targets[0], mode, source_language, False, fast_path)
+        # Template renders are microseconds of GIL-bound work, so they run in order;
+        # verification is where fan-out pays off (see `verify_outputs`).
+        outputs: dict[str, str] = {}
+        for target in normalized_targets:
+            plan = shared_plan or self._plan_for_target(combined_prompt, target, mode, source_language, True, fast_path)
+            outputs[target] = self._render_target(combined_prompt, plan, target, mode, strict_safety, source_language, use_rag_cache, profile)
+        return outputs
+
+    def verify_outputs(self, outputs: dict[str, str], max_workers: Optional[int] = None) -> dict[str, tuple[bool, str]]:
+        """Run `verify_output` for each target's code concurrently.
+
+        JavaScript checks run in the persistent node workers and C++ checks
+        shell out to clang++, so both overlap across threads.
+        """
+        if not outputs:
+            return {}
+        workers = max(1, min(max_workers or len(outputs), len(outputs)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nevora-verify") as pool:
+            futures = {target: pool.submit(self.verify_output, code, target) for target, code in outputs.items()}
+            return {target: future.result() for target, future in futures.items()}
+
     def _slug(self, text: str) -> str:
         cleaned = re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
         return cleaned[:48] or "item"
@@ -772,7 +1309,11 @@ class EnglishToCodeTranslator:
         verify_build: bool,
         default_source_language: str,
         include_explain: bool,
-        artifacts_root: Path | None,
+        artifacts: ArtifactWriter | None,
+        fast_path: bool = False,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        provider_pool: Optional[ProviderPool] = None,
     ) -> dict[str, Any]:
         prompt = str(item.get("prompt", "")).strip()
         target = str(item.get("target", default_target)).strip()
@@ -780,18 +1321,43 @@ class EnglishToCodeTranslator:
         context = item.get("context")
         refine = bool(item.get("refine", False))
         source_language = str(item.get("source_language", default_source_language)).strip().lower()
+        item_provider = item.get("provider", provider)
+        item_model = item.get("model", model)
+        render_profile = self._normalize_render_profile(item.get("render_profile", "default"))
 
+        provider_stats: dict[str, Any] = {}
         started_at = perf_counter()
-        output = self.translate(
-            prompt=prompt,
-            target=target,
-            mode=mode,
-            context=context,
-            refine=refine,
-            strict_safety=strict_safety,
-            source_language=source_language,
-            use_rag_cache=True,
-        )
+        if item_provider and not fast_path:
+            with span("safety"):
+                self._enforce_safety(prompt, strict_safety=strict_safety)
+            pool = provider_pool or ProviderPool()
+            with span("provider"):
+                output, provider_stats = pool.generate(
+                    str(item_provider),
+                    prompt,
+                    target,
+                    mode=mode,
+                    source_language=source_language,
+                    model=str(item_model) if item_model else None,
+                )
+            with span("safety"):
+                self._enforce_safety(output, strict_safety=strict_safety)
+            resolved_provider = provider_stats["provider"]
+            metrics.inc("nevora_translate_calls", target=target, mode=mode, provider=resolved_provider)
+        else:
+            output = self.translate(
+                prompt=prompt,
+                target=target,
+                mode=mode,
+                context=context,
+                refine=refine,
+                strict_safety=strict_safety,
+                source_language=source_language,
+                use_rag_cache=True,
+                fast_path=fast_path,
+                render_profile=render_profile,
+            )
+            resolved_provider = self._last_resolved_provider
         elapsed_ms = round((perf_counter() - started_at) * 1000, 3)
         payload: dict[str, Any] = {
             "index": idx,
@@ -799,49 +1365,227 @@ class EnglishToCodeTranslator:
             "target": target,
             "mode": mode,
             "source_language": source_language,
-            "resolved_provider": self._last_resolved_provider,
+            "resolved_provider": resolved_provider,
             "output": output,
             "lattice_bucket": list(self._lattice_bucket(prompt, target, mode, source_language)),
             "elapsed_ms": elapsed_ms,
+            **provider_stats,
         }
+        if render_profile != "default":
+            payload["render_profile"] = render_profile
 
         if verify_generated:
-            verify_ok, verify_message = self.verify_output(output, target)
+            with span("verify"):
+                verify_ok, verify_message = self.verify_output(output, target)
+            metrics.inc("nevora_verify_results", target=target, result="pass" if verify_ok else "fail")
             payload["verify_output_ok"] = verify_ok
             payload["verify_output_message"] = verify_message
 
         if include_explain:
-            payload["explain"] = self.explain_plan(prompt, target=target, mode=mode, source_language=source_language)
-
-        scaffold_root: Path | None = None
-        if artifacts_root:
-            item_dir = artifacts_root / f"{idx:03d}_{self._slug(prompt)}"
-            item_dir.mkdir(parents=True, exist_ok=True)
-            output_file = item_dir / f"output.{target}.txt"
-            output_file.write_text(output, encoding="utf-8")
-            payload["artifact_output_file"] = str(output_file)
-            scaffold_root = item_dir / "scaffold"
-
-            if include_explain:
-                explain_file = item_dir / "plan.json"
-                explain_file.write_text(json.dumps(payload["explain"], indent=2), encoding="utf-8")
-                payload["artifact_plan_file"] = str(explain_file)
-
-        if verify_build:
-            if scaffold_root is None:
+            with span("explain"):
+                payload["explain"] = self.explain_plan(prompt, target=target, mode=mode, source_language=source_language)
+
+        with span("artifacts"):
+            item_dir = self._write_item_artifacts(idx, prompt, target, payload, include_explain, artifacts)
+
+        if verify_build and not fast_path:
+            if artifacts is not None and artifacts.root is not None:
+                # Build tools need the scaffold on disk, so it is written synchronously.
+                scaffold_root = artifacts.root / item_dir / "scaffold"
+                with span("scaffold"):
+                    self.scaffold_project(prompt, target=target, output_dir=str(scaffold_root), mode=mode, code=output)
+                with span("build"):
+                    build_ok, build_message = self.verify_scaffold_build(str(scaffold_root), target)
+            else:
                 import tempfile
 
                 with tempfile.TemporaryDirectory(prefix="nevora-batch-scaffold-") as td:
-                    self.scaffold_project(prompt, target=target, output_dir=td, mode=mode)
-                    build_ok, build_message = self.verify_scaffold_build(td, target)
-            else:
-                self.scaffold_project(prompt, target=target, output_dir=str(scaffold_root), mode=mode)
-                build_ok, build_message = self.verify_scaffold_build(str(scaffold_root), target)
+                    with span("scaffold"):
+                        self.scaffold_project(prompt, target=target, output_dir=td, mode=mode, code=output)
+                    with span("build"):
+                        build_ok, build_message = self.verify_scaffold_build(td, target)
+                    if artifacts is not None:
+                        with span("artifacts"):
+                            artifacts.add_tree(f"{item_dir}/scaffold", td)
+            metrics.inc("nevora_build_results", target=target, result="pass" if build_ok else "fail")
             payload["verify_build_ok"] = build_ok
             payload["verify_build_message"] = build_message
 
         return payload
 
+    def _write_item_artifacts(
+        self,
+        idx: int,
+        prompt: str,
+        target: str,
+        payload: dict[str, Any],
+        include_explain: bool,
+        artifacts: ArtifactWriter | None,
+    ) -> str:
+        item_dir = f"{idx:03d}_{self._slug(prompt)}"
+        if artifacts is None:
+            return item_dir
+        payload["artifact_output_file"] = artifacts.write_text(f"{item_dir}/output.{target}.txt", payload["output"])
+        if artifacts.bundle is not None:
+            payload["artifact_bundle"] = str(artifacts.bundle)
+        if include_explain and "explain" in payload:
+            payload["artifact_plan_file"] = artifacts.write_text(f"{item_dir}/plan.json", json.dumps(payload["explain"], indent=2))
+        return item_dir
+
+    @property
+    def generator_version(self) -> str:
+        """Identifies everything besides the item itself that shapes batch output."""
+        planner = "custom" if self.planner is not None else self.planner_provider
+        return f"{__version__}|planner={planner}|templates={self.templates.content_hash()[:12]}"
+
+    def _batch_item_fingerprint(
+        self,
+        item: dict[str, Any],
+        default_target: str,
+        default_mode: str,
+        default_source_language: str,
+        strict_safety: bool,
+        verify_generated: bool,
+        verify_build: bool,
+        include_explain: bool,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> str:
+        material = {
+            "item": {key: value for key, value in item.items() if key not in self.SCHEDULING_FIELDS},
+            "defaults": [default_target, default_mode, default_source_language, provider, model],
+            "options": [strict_safety, verify_generated, verify_build, include_explain],
+        }
+        return sha256(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def load_batch_baseline(self, report_path: str) -> dict[str, dict[str, Any]]:
+        """Index reusable results of a previous batch report by input hash.
+
+        Only successful, non-downgraded results produced by the same
+        `generator_version` are eligible for reuse.
+        """
+        baseline: dict[str, dict[str, Any]] = {}
+        for result in self.load_batch_report_results(report_path):
+            if not isinstance(result, dict) or not result.get("ok") or not result.get("input_hash"):
+                continue
+            if result.get("generator_version") != self.generator_version or result.get("deadline_action") == "downgraded":
+                continue
+            baseline[str(result["input_hash"])] = result
+        return baseline
+
+    def _reuse_baseline_item(
+        self,
+        idx: int,
+        item: dict[str, Any],
+        stored: dict[str, Any],
+        include_explain: bool,
+        artifacts: ArtifactWriter | None,
+    ) -> dict[str, Any]:
+        payload = {key: value for key, value in stored.items() if key not in self.RUN_SPECIFIC_FIELDS}
+        payload["index"] = idx
+        self._write_item_artifacts(idx, str(item.get("prompt", "")).strip(), str(payload.get("target", "")), payload, include_explain, artifacts)
+        return payload
+
+    def _safe_translate_batch_item(
+        self,
+        idx: int,
+        item: dict[str, Any],
+        default_target: str,
+        default_mode: str,
+        strict_safety: bool,
+        verify_generated: bool,
+        verify_build: bool,
+        default_source_language: str,
+        include_explain: bool,
+        artifacts: ArtifactWriter | None,
+        fast_path: bool = False,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        provider_pool: Optional[ProviderPool] = None,
+    ) -> dict[str, Any]:
+        """Run `_translate_batch_item`, converting failures into an error payload.
+
+        With `stage_timings` enabled, the payload gains `stage_timings_ms`;
+        with `track_memory` (and tracemalloc running) it gains `stage_memory_kb`.
+        """
+        collecting = self.stage_timings or self.track_memory or self.trace is not None
+        item_started = perf_counter()
+        with collect_spans(track_memory=self.track_memory) if collecting else nullcontext() as recorder:
+            try:
+                payload = self._translate_batch_item(
+                    idx,
+                    item,
+                    default_target,
+                    default_mode,
+                    strict_safety,
+                    verify_generated,
+                    verify_build,
+                    default_source_language,
+                    include_explain,
+                    artifacts,
+                    fast_path=fast_path,
+                    provider=provider,
+                    model=model,
+                    provider_pool=provider_pool,
+                )
+            except Exception as exc:
+                target = str(item.get("target", default_target)).strip()
+                mode = str(item.get("mode", default_mode)).strip()
+                source_language = str(item.get("source_language", default_source_language)).strip().lower()
+                item_provider = item.get("provider", provider)
+                payload = {
+                    "index": idx,
+                    "ok": False,
+                    "target": target,
+                    "mode": mode,
+                    "source_language": source_language,
+                    "resolved_provider": str(item_provider) if item_provider and not fast_path else self._last_resolved_provider,
+                    "error": str(exc),
+                }
+        if recorder is not None and self.stage_timings:
+            payload["stage_timings_ms"] = recorder.rounded_timings()
+        if recorder is not None and recorder.memory_kb:
+            payload["stage_memory_kb"] = recorder.rounded_memory()
+        if self.trace is not None and recorder is not None:
+            self._trace_item(payload, item_started, perf_counter(), recorder.events, recorder.args)
+        return payload
+
+    def _trace_item(
+        self,
+        payload: dict[str, Any],
+        started: float,
+        ended: float,
+        stages: Iterable[tuple[str, float, float, int]] = (),
+        annotations: Optional[dict[str, Any]] = None,
+    ) -> None:
+        args = {key: payload.get(key) for key in ("index", "target", "mode", "ok", "resolved_provider")}
+        args.update(annotations or {})
+        for key in ("reused", "deadline_action"):
+            if key in payload:
+                args[key] = payload[key]
+        self.trace.add_item(f"item {payload['index']}", started, ended, args, stages)
+
+    def _item_schedule_fields(self, item: dict[str, Any]) -> tuple[int, float | None]:
+        try:
+            priority = int(item.get("priority", 0) or 0)
+        except (TypeError, ValueError):
+            priority = 0
+        deadline_ms: float | None
+        try:
+            deadline_ms = float(item["deadline_ms"]) if item.get("deadline_ms") is not None else None
+        except (TypeError, ValueError):
+            deadline_ms = None
+        return priority, deadline_ms
+
+    def _schedule_batch_order(self, items: list[dict[str, Any]]) -> list[int]:
+        """Indices ordered by priority (high first), then deadline (near first), then input order."""
+
+        def sort_key(idx: int) -> tuple[int, float, int]:
+            priority, deadline_ms = self._item_schedule_fields(items[idx])
+            return (-priority, deadline_ms if deadline_ms is not None else float("inf"), idx)
+
+        return sorted(range(len(items)), key=sort_key)
+
     def translate_batch(
         self,
         items: list[dict[str, Any]],
@@ -855,16 +1599,127 @@ class EnglishToCodeTranslator:
         verify_build: bool = False,
         default_source_language: str = "english",
         swarm_workers: int = 1,
+        deadline_policy: str = "downgrade",
+        artifact_bundle: str | None = None,
+        baseline_report: str | None = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        provider_pool: Optional[ProviderPool] = None,
+        render_profile: str = "default",
+    ) -> list[dict[str, Any]]:
+        """Translate items with optional swarm parallelism.
+
+        Items run highest `priority` first, then nearest `deadline_ms` (measured
+        from batch start); results are always returned in input order. Items
+        whose deadline passed before they started are downgraded to the
+        heuristic fast path or skipped, depending on `deadline_policy`.
+        Artifacts are written by a background `ArtifactWriter`, either under
+        `artifact_dir` or streamed into a single `artifact_bundle` archive.
+        With `baseline_report`, items whose input hash and generator version
+        match a previous successful result reuse it instead of recomputing.
+        With `provider` (or per-item `provider`/`model` fields), items are
+        generated by the LLM providers through a shared `ProviderPool` that
+        enforces per-provider concurrency, timeouts and retries.
+        With `track_memory`, tracemalloc runs for the batch so items record
+        per-stage memory; with `max_memory_mb`, caches are shed between items.
+        `render_profile` applies to items without their own `render_profile`
+        field and, like it, becomes part of each item's input hash.
+        """
+        if deadline_policy not in self.DEADLINE_POLICIES:
+            raise ValueError(
+                f"Unsupported deadline_policy '{deadline_policy}'. Supported: {', '.join(sorted(self.DEADLINE_POLICIES))}"
+            )
+        render_profile = self._normalize_render_profile(render_profile)
+        if render_profile != "default":
+            items = [item if "render_profile" in item else {**item, "render_profile": render_profile} for item in items]
+        baseline = self.load_batch_baseline(baseline_report) if baseline_report else None
+        artifacts = ArtifactWriter(bundle=artifact_bundle) if artifact_bundle else None
+        if artifacts is None and artifact_dir:
+            artifacts = ArtifactWriter(root=artifact_dir)
+        started_tracing = self.track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            return self._run_batch(
+                items,
+                default_target,
+                default_mode,
+                strict_safety,
+                artifacts,
+                include_explain,
+                fail_fast,
+                verify_generated,
+                verify_build,
+                default_source_language,
+                swarm_workers,
+                deadline_policy,
+                baseline,
+                provider,
+                model,
+                provider_pool or ProviderPool(),
+            )
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            if artifacts is not None:
+                artifacts.close()
+
+    def _run_batch(
+        self,
+        items: list[dict[str, Any]],
+        default_target: str,
+        default_mode: str,
+        strict_safety: bool,
+        artifacts: ArtifactWriter | None,
+        include_explain: bool,
+        fail_fast: bool,
+        verify_generated: bool,
+        verify_build: bool,
+        default_source_language: str,
+        swarm_workers: int,
+        deadline_policy: str,
+        baseline: Optional[dict[str, dict[str, Any]]] = None,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        provider_pool: Optional[ProviderPool] = None,
     ) -> list[dict[str, Any]]:
-        """Translate items in order with optional swarm parallelism."""
         results: list[dict[str, Any]] = []
-        artifacts_root = Path(artifact_dir) if artifact_dir else None
-        if artifacts_root:
-            artifacts_root.mkdir(parents=True, exist_ok=True)
+        batch_started = perf_counter()
 
         def _safe_item(idx: int, item: dict[str, Any]) -> dict[str, Any]:
-            try:
-                return self._translate_batch_item(
+            priority, deadline_ms = self._item_schedule_fields(item)
+            input_hash = self._batch_item_fingerprint(
+                item,
+                default_target,
+                default_mode,
+                default_source_language,
+                strict_safety,
+                verify_generated,
+                verify_build,
+                include_explain,
+                provider,
+                model,
+            )
+            stored = baseline.get(input_hash) if baseline is not None else None
+            deadline_action = "none"
+            if stored is None and deadline_ms is not None and (perf_counter() - batch_started) * 1000 > deadline_ms:
+                deadline_action = "skipped" if deadline_policy == "skip" else "downgraded"
+
+            item_started = perf_counter()
+            if stored is not None:
+                payload = self._reuse_baseline_item(idx, item, stored, include_explain, artifacts)
+            elif deadline_action == "skipped":
+                payload = {
+                    "index": idx,
+                    "ok": False,
+                    "target": str(item.get("target", default_target)).strip(),
+                    "mode": str(item.get("mode", default_mode)).strip(),
+                    "source_language": str(item.get("source_language", default_source_language)).strip().lower(),
+                    "resolved_provider": "skipped",
+                    "error": f"deadline of {deadline_ms}ms passed before item started",
+                }
+            else:
+                payload = self._safe_translate_batch_item(
                     idx,
                     item,
                     default_target,
@@ -874,32 +1729,40 @@ class EnglishToCodeTranslator:
                     verify_build,
                     default_source_language,
                     include_explain,
-                    artifacts_root,
+                    artifacts,
+                    fast_path=deadline_action == "downgraded",
+                    provider=provider,
+                    model=model,
+                    provider_pool=provider_pool,
                 )
-            except Exception as exc:
-                target = str(item.get("target", default_target)).strip()
-                mode = str(item.get("mode", default_mode)).strip()
-                source_language = str(item.get("source_language", default_source_language)).strip().lower()
-                return {
-                    "index": idx,
-                    "ok": False,
-                    "target": target,
-                    "mode": mode,
-                    "source_language": source_language,
-                    "resolved_provider": self._last_resolved_provider,
-                    "error": str(exc),
-                }
 
+            payload["input_hash"] = input_hash
+            payload["generator_version"] = self.generator_version
+            if baseline is not None:
+                payload["reused"] = stored is not None
+            payload["priority"] = priority
+            if deadline_ms is not None:
+                payload["deadline_ms"] = deadline_ms
+                payload["deadline_action"] = deadline_action
+                payload["deadline_missed"] = (perf_counter() - batch_started) * 1000 > deadline_ms
+            if self.trace is not None and (stored is not None or deadline_action == "skipped"):
+                # Translated items are traced with their stages in _safe_translate_batch_item.
+                self._trace_item(payload, item_started, perf_counter())
+            self.enforce_memory_budget()
+            return payload
+
+        schedule = self._schedule_batch_order(items)
         if swarm_workers <= 1 or fail_fast:
-            for idx, item in enumerate(items):
-                payload = _safe_item(idx, item)
+            for idx in schedule:
+                payload = _safe_item(idx, items[idx])
                 results.append(payload)
                 if fail_fast and not payload.get("ok"):
                     break
+            results.sort(key=lambda payload: payload["index"])
             return results
 
-        with ThreadPoolExecutor(max_workers=swarm_workers) as executor:
-            futures = {executor.submit(_safe_item, idx, item): idx for idx, item in enumerate(items)}
+        with ThreadPoolExecutor(max_workers=swarm_workers, thread_name_prefix="nevora-swarm") as executor:
+            futures = {executor.submit(_safe_item, idx, items[idx]): idx for idx in schedule}
             ordered: dict[int, dict[str, Any]] = {}
             for future in as_completed(futures):
                 payload = future.result()
@@ -911,60 +1774,123 @@ class EnglishToCodeTranslator:
         validate_ordered_results(results)
         return results
 
-    def write_batch_report(self, batch_results: list[dict[str, Any]], output_file: str) -> str:
-        """Write batch results and aggregate metrics to JSON."""
+    def write_batch_report(
+        self,
+        batch_results: Iterable[dict[str, Any]],
+        output_file: str,
+        results_sidecar: Optional[str] = None,
+        wall_time_ms: Optional[float] = None,
+    ) -> str:
+        """Write batch results and aggregate metrics to JSON.
+
+        With `results_sidecar`, per-item results are streamed to that JSONL
+        file and the report only references it via `results_file`. With the
+        batch `wall_time_ms`, the report also records throughput.
+        """
         destination = Path(output_file)
         destination.parent.mkdir(parents=True, exist_ok=True)
-        summary = self._batch_report_service.build_summary(batch_results)
+        if results_sidecar:
+            sidecar = Path(results_sidecar)
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            with sidecar.open("w", encoding="utf-8") as sink:
+                summary = self._batch_report_service.build_summary(batch_results, include_results=False, results_sink=sink)
+            summary["results_file"] = str(sidecar)
+        else:
+            summary = self._batch_report_service.build_summary(batch_results)
+        if self.track_memory:
+            summary["memory"] = self.memory_report()
+        self._add_wall_time(summary, wall_time_ms)
         destination.write_text(json.dumps(summary, indent=2), encoding="utf-8")
         return str(destination)
 
-    def scaffold_project(self, prompt: str, target: str, output_dir: str, mode: str = "gameplay") -> str:
+    def _add_wall_time(self, summary: dict[str, Any], wall_time_ms: Optional[float]) -> None:
+        if wall_time_ms is not None:
+            summary["wall_time_ms"] = round(wall_time_ms, 3)
+            summary["throughput_items_per_s"] = round(summary["total"] / (wall_time_ms / 1000), 3) if wall_time_ms > 0 else 0.0
+
+    def record_batch_run(
+        self,
+        batch_results: list[dict[str, Any]],
+        results_db: str,
+        label: Optional[str] = None,
+        wall_time_ms: Optional[float] = None,
+    ) -> int:
+        """Append a batch run (summary and items) to a SQLite results store; returns the run id."""
+        summary = self._batch_report_service.build_summary(batch_results, include_results=False)
+        self._add_wall_time(summary, wall_time_ms)
+        metadata = {
+            "generator_version": self.generator_version,
+            "planner_provider": self.planner_provider,
+            "host": platform.node(),
+        }
+        with SQLiteResultsStore(results_db) as store:
+            return store.record_run(batch_results, summary, label=label, metadata=metadata)
+
+    def load_batch_report_results(self, report_path: str) -> list[dict[str, Any]]:
+        """Per-item results of a report, whether embedded or in its `results_file` sidecar."""
+        source = Path(report_path)
+        payload = json.loads(source.read_text(encoding="utf-8"))
+        if isinstance(payload, list):
+            return payload
+        if "results" in payload:
+            return list(payload["results"])
+        if payload.get("results_file"):
+            sidecar = Path(payload["results_file"])
+            if not sidecar.is_absolute() and not sidecar.exists():
+                sidecar = source.parent / sidecar.name
+            with sidecar.open("r", encoding="utf-8") as handle:
+                return [json.loads(line) for line in handle if line.strip()]
+        return []
+
+    def scaffold_project(
+        self,
+        prompt: str,
+        target: str,
+        output_dir: str,
+        mode: str = "gameplay",
+        code: Optional[str] = None,
+    ) -> str:
         root = Path(output_dir)
         root.mkdir(parents=True, exist_ok=True)
-        code = self.translate(prompt, target=target, mode=mode)
+        # Without precomputed code, stream the render straight into the scaffold's source file.
+        code_chunks: Iterable[str] = [code] if code is not None else self.translate_iter(prompt, target=target, mode=mode)
 
         if target == "python":
             (root / "src").mkdir(exist_ok=True)
-            (root / "src" / "generated_feature.py").write_text(code, encoding="utf-8")
+            write_chunks(root / "src" / "generated_feature.py", code_chunks)
             (root / "tests").mkdir(exist_ok=True)
             (root / "tests" / "test_generated.py").write_text("def test_smoke():\n    assert True\n", encoding="utf-8")
         elif target == "javascript":
             (root / "src").mkdir(exist_ok=True)
-            (root / "src" / "generatedFeature.js").write_text(code, encoding="utf-8")
+            write_chunks(root / "src" / "generatedFeature.js", code_chunks)
             (root / "package.json").write_text('{"name":"generated-feature","version":"0.1.0"}\n', encoding="utf-8")
         elif target == "csharp":
-            (root / "GeneratedFeature.cs").write_text(code, encoding="utf-8")
+            write_chunks(root / "GeneratedFeature.cs", code_chunks)
             (root / "GeneratedFeature.csproj").write_text(
                 "<Project Sdk=\"Microsoft.NET.Sdk\"><PropertyGroup><TargetFramework>net8.0</TargetFramework></PropertyGroup></Project>",
                 encoding="utf-8",
             )
         elif target == "cpp":
-            (root / "main.cpp").write_text(code, encoding="utf-8")
+            write_chunks(root / "main.cpp", code_chunks)
             (root / "CMakeLists.txt").write_text(
                 "cmake_minimum_required(VERSION 3.16)\nproject(GeneratedFeature)\nadd_executable(app main.cpp)\n",
                 encoding="utf-8",
             )
         elif target == "gdscript":
-            (root / "GeneratedFeature.gd").write_text(code, encoding="utf-8")
+            write_chunks(root / "GeneratedFeature.gd", code_chunks)
             (root / "project.godot").write_text("; generated skeleton\n", encoding="utf-8")
         else:
-            (root / "README.txt").write_text(code, encoding="utf-8")
+            write_chunks(root / "README.txt", code_chunks)
 
         return str(root)
 
     def verify_output(self, code: str, target: str) -> tuple[bool, str]:
         if target == "python":
-            try:
-                compile(code, "<generated>", "exec")
-                return True, "python compile ok"
-            except Exception as exc:
-                return False, f"python compile failed: {exc}"
+            return self.verifiers.check_python(code)
 
         if target == "javascript":
-            if shutil.which("node"):
-                proc = subprocess.run(["node", "--check", "-"], input=code, text=True, capture_output=True)
-                return proc.returncode == 0, proc.stderr.strip() or "node check ok"
+            if self.verifiers.node_available():
+                return self.verifiers.check_javascript(code)
             return False, "node unavailable"
 
         if target == "cpp":
@@ -1028,17 +1954,21 @@ class EnglishToCodeTranslator:
         if target == "python":
             if not shutil.which("pytest"):
                 return False, "pytest unavailable"
+            # A syntax error fails here without paying for a pytest process.
+            for source in sorted(root.rglob("*.py")):
+                ok, message = self.verifiers.check_python(source.read_text(encoding="utf-8"), source.relative_to(root).as_posix())
+                if not ok:
+                    return False, message
             proc = subprocess.run(["pytest", "-q"], cwd=root, capture_output=True, text=True)
             return proc.returncode == 0, (proc.stdout.strip() or proc.stderr.strip() or "pytest finished")
 
         if target == "javascript":
-            if not shutil.which("node"):
+            if not self.verifiers.node_available():
                 return False, "node unavailable"
             src = root / "src" / "generatedFeature.js"
             if not src.exists():
                 return False, "missing src/generatedFeature.js"
-            proc = subprocess.run(["node", "--check", "src/generatedFeature.js"], cwd=root, capture_output=True, text=True)
-            return proc.returncode == 0, (proc.stdout.strip() or proc.stderr.strip() or "node check ok")
+            return self.verifiers.check_javascript(src.read_text(encoding="utf-8"), "src/generatedFeature.js")
 
         if target == "cpp":
             if not shutil.which("clang++"):
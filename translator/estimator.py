@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import statistics
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+ESTIMATE_BACKENDS = ("threads", "processes")
+# Stages that spend their time outside the interpreter (network, subprocesses,
+# file IO), so they overlap across swarm threads despite the GIL.
+OFF_GIL_STAGES = {"provider", "scaffold", "build"}
+
+ItemClass = tuple[str, str, bool, bool, str]
+
+
+def item_class_fields(item_class: ItemClass) -> dict[str, Any]:
+    target, mode, verify_output, verify_build, provider = item_class
+    return {"target": target, "mode": mode, "verify_output": verify_output, "verify_build": verify_build, "provider": provider}
+
+
+def result_item_class(result: dict[str, Any]) -> ItemClass:
+    """Class of a finished batch result, as recorded in its payload."""
+    return (
+        str(result.get("target", "unknown")),
+        str(result.get("mode", "gameplay")),
+        "verify_output_ok" in result,
+        "verify_build_ok" in result,
+        str(result["provider"]) if result.get("provider") else "template",
+    )
+
+
+def split_result_cost(result: dict[str, Any]) -> Optional[tuple[float, float]]:
+    """(in-interpreter ms, off-GIL ms) spent on one result, or None without timings."""
+    stages = result.get("stage_timings_ms")
+    target = str(result.get("target", ""))
+    if isinstance(stages, dict) and stages:
+        serial = parallel = 0.0
+        for stage, value in stages.items():
+            # verify_output waits on node workers or clang++ for every target except python.
+            if stage in OFF_GIL_STAGES or (stage == "verify" and target != "python"):
+                parallel += float(value)
+            else:
+                serial += float(value)
+        return serial, parallel
+    if result.get("elapsed_ms") is None:
+        return None
+    elapsed = float(result["elapsed_ms"])
+    return (0.0, elapsed) if result.get("provider") else (elapsed, 0.0)
+
+
+@dataclass
+class ClassCost:
+    serial_ms: list[float] = field(default_factory=list)
+    parallel_ms: list[float] = field(default_factory=list)
+
+    def add(self, serial: float, parallel: float) -> None:
+        self.serial_ms.append(serial)
+        self.parallel_ms.append(parallel)
+
+    def median(self) -> tuple[float, float]:
+        return statistics.median(self.serial_ms), statistics.median(self.parallel_ms)
+
+
+class BatchCostModel:
+    """Per-class item costs learned from previous results.
+
+    Each cost is split into time that holds the GIL (planning, rendering,
+    in-process verification) and time that does not (provider calls,
+    subprocess builds), because only the latter overlaps across threads.
+    """
+
+    def __init__(self) -> None:
+        self.classes: dict[ItemClass, ClassCost] = {}
+
+    def add_results(self, results: Iterable[dict[str, Any]]) -> int:
+        added = 0
+        for result in results:
+            if not result.get("ok") or result.get("reused"):
+                continue
+            cost = split_result_cost(result)
+            if cost is None:
+                continue
+            self.classes.setdefault(result_item_class(result), ClassCost()).add(*cost)
+            added += 1
+        return added
+
+    def cost(self, item_class: ItemClass) -> tuple[Optional[tuple[float, float]], str]:
+        """Median (serial, parallel) ms for a class, falling back to similar classes."""
+        if item_class in self.classes:
+            return self.classes[item_class].median(), "exact"
+        target, _mode, verify_output, verify_build, provider = item_class
+        fallbacks = (
+            ("target+flags+provider", lambda key: (key[0], key[2], key[3], key[4]) == (target, verify_output, verify_build, provider)),
+            ("flags+provider", lambda key: (key[2], key[3], key[4]) == (verify_output, verify_build, provider)),
+            ("provider", lambda key: key[4] == provider),
+        )
+        for source, matches in fallbacks:
+            pooled = ClassCost()
+            for key, costs in self.classes.items():
+                if matches(key):
+                    pooled.serial_ms.extend(costs.serial_ms)
+                    pooled.parallel_ms.extend(costs.parallel_ms)
+            if pooled.serial_ms:
+                return pooled.median(), source
+        return None, "unknown"
+
+
+def predict_wall_ms(
+    serial_ms: float,
+    parallel_ms: float,
+    longest_item_ms: float,
+    workers: int,
+    backend: str,
+    provider_ms: Optional[dict[str, float]] = None,
+    provider_concurrency: Optional[dict[str, int]] = None,
+) -> float:
+    """Wall time for a batch whose items sum to the given serial/parallel ms.
+
+    Threads share one GIL, so serial time never overlaps; processes overlap
+    everything. Each provider's time also cannot overlap beyond its
+    concurrency limit. No batch finishes before its longest item.
+    """
+    workers = max(1, workers)
+    total = serial_ms + parallel_ms
+    bounds = [longest_item_ms, total / workers]
+    if backend == "threads":
+        bounds.append(serial_ms)
+    for name, busy_ms in (provider_ms or {}).items():
+        limit = (provider_concurrency or {}).get(name, workers)
+        bounds.append(busy_ms / max(1, min(workers, limit)))
+    return max(bounds)
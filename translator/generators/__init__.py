@@ -0,0 +1 @@
+"""Code generators backed by LLM providers, packaging and export helpers."""
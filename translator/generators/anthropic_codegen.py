@@ -3,6 +3,10 @@ from __future__ import annotations
 import os
 
 
+class ProviderSetupError(RuntimeError):
+    """A provider's API key or SDK is missing; retrying cannot succeed."""
+
+
 SYSTEM_PROMPT = (
     "You are a code generation assistant. "
     "The user will describe a game mechanic or app feature in plain English. "
@@ -21,12 +25,12 @@ EXPLAIN_SYSTEM_PROMPT = (
 def _anthropic_client() -> "object":
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
-        raise RuntimeError("ANTHROPIC_API_KEY is not set")
+        raise ProviderSetupError("ANTHROPIC_API_KEY is not set")
 
     try:
         from anthropic import Anthropic  # type: ignore
     except Exception as exc:  # pragma: no cover - dependency/runtime dependent
-        raise RuntimeError("anthropic package is required for Claude generation") from exc
+        raise ProviderSetupError("anthropic package is required for Claude generation") from exc
 
     return Anthropic(api_key=api_key)
 
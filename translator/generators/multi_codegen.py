@@ -4,7 +4,7 @@ import os
 from typing import Optional
 
 
-from .anthropic_codegen import SYSTEM_PROMPT
+from .anthropic_codegen import SYSTEM_PROMPT, ProviderSetupError
 
 
 def _build_user_prompt(prompt: str, target: str, mode: str, source_language: str) -> str:
@@ -27,12 +27,12 @@ def generate_code_with_openai(
 ) -> str:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
-        raise RuntimeError("OPENAI_API_KEY is not set")
+        raise ProviderSetupError("OPENAI_API_KEY is not set")
 
     try:
         from openai import OpenAI  # type: ignore
     except Exception as exc:  # pragma: no cover
-        raise RuntimeError("openai package is required for OpenAI code generation") from exc
+        raise ProviderSetupError("openai package is required for OpenAI code generation") from exc
 
     client = OpenAI(api_key=api_key)
     response = client.responses.create(
@@ -59,12 +59,12 @@ def generate_code_with_grok(
 ) -> str:
     api_key = os.getenv("XAI_API_KEY")
     if not api_key:
-        raise RuntimeError("XAI_API_KEY is not set")
+        raise ProviderSetupError("XAI_API_KEY is not set")
 
     try:
         from openai import OpenAI  # type: ignore
     except Exception as exc:  # pragma: no cover
-        raise RuntimeError("openai package is required for Grok code generation") from exc
+        raise ProviderSetupError("openai package is required for Grok code generation") from exc
 
     client = OpenAI(api_key=api_key, base_url="https://api.x.ai/v1")
     response = client.responses.create(
@@ -90,12 +90,12 @@ def generate_code_with_gemini(
 ) -> str:
     api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
     if not api_key:
-        raise RuntimeError("GEMINI_API_KEY (or GOOGLE_API_KEY) is not set")
+        raise ProviderSetupError("GEMINI_API_KEY (or GOOGLE_API_KEY) is not set")
 
     try:
         import google.generativeai as genai  # type: ignore
     except Exception as exc:  # pragma: no cover
-        raise RuntimeError("google-generativeai package is required for Gemini code generation") from exc
+        raise ProviderSetupError("google-generativeai package is required for Gemini code generation") from exc
 
     genai.configure(api_key=api_key)
     gm = genai.GenerativeModel(model_name=model, system_instruction=SYSTEM_PROMPT)
@@ -118,7 +118,7 @@ def generate_code_with_ollama(
     try:
         import requests  # type: ignore
     except Exception as exc:  # pragma: no cover
-        raise RuntimeError("requests package is required for Ollama generation") from exc
+        raise ProviderSetupError("requests package is required for Ollama generation") from exc
     payload = {
         "model": model,
         "prompt": f"{SYSTEM_PROMPT}\n\n{_build_user_prompt(prompt, target, mode, source_language)}",
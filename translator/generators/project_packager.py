@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import io
 import zipfile
-from typing import Dict
+from typing import Dict, Iterable, Union
+
+from translator.artifacts import write_zip_chunks
 
 
 TARGET_FILENAMES = {
@@ -57,7 +59,7 @@ def build_run_scripts(code_file: str) -> Dict[str, str]:
 
 
 def package_single_file_project(
-    code: str,
+    code: Union[str, Iterable[str]],
     prompt: str,
     target: str = "python",
     project_title: str = "Nevora Generated Project",
@@ -69,7 +71,11 @@ def package_single_file_project(
 
     buf = io.BytesIO()
     with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr(code_file, code)
+        if isinstance(code, str):
+            zf.writestr(code_file, code)
+        else:
+            # Chunks from `translate_iter()` stream into the member as they are rendered.
+            write_zip_chunks(zf, code_file, code)
         zf.writestr("README.txt", readme)
         zf.writestr("requirements.txt", build_requirements_text(include_pygame=include_pygame))
         zf.writestr("run.bat", scripts["run.bat"])
@@ -78,7 +84,7 @@ def package_single_file_project(
 
 
 def package_world_builder_project(
-    files: Dict[str, str],
+    files: Dict[str, Union[str, Iterable[str]]],
     project_title: str,
     app_summary: str,
 ) -> bytes:
@@ -88,7 +94,10 @@ def package_world_builder_project(
     buf = io.BytesIO()
     with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
         for name, content in files.items():
-            zf.writestr(name, content)
+            if isinstance(content, str):
+                zf.writestr(name, content)
+            else:
+                write_zip_chunks(zf, name, content)
         zf.writestr("README.txt", readme)
         zf.writestr("requirements.txt", build_requirements_text(include_pygame=True))
         zf.writestr("run.bat", scripts["run.bat"])
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from .anthropic_codegen import ProviderSetupError
+from .multi_codegen import generate_code
+
+PROVIDERS = ("claude", "openai", "grok", "gemini", "ollama")
+
+
+@dataclass
+class ProviderLimits:
+    concurrency: int = 4
+    timeout_s: float = 120.0
+    retries: int = 2
+    backoff_s: float = 1.0
+
+
+DEFAULT_PROVIDER_LIMITS = {
+    "claude": ProviderLimits(concurrency=4),
+    "openai": ProviderLimits(concurrency=4),
+    "grok": ProviderLimits(concurrency=2),
+    "gemini": ProviderLimits(concurrency=2),
+    "ollama": ProviderLimits(concurrency=1, timeout_s=300.0),
+}
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    # Unknown providers, bad arguments, missing API keys and missing SDKs fail the same way every time.
+    return not isinstance(exc, (ValueError, TypeError, ProviderSetupError))
+
+
+class ProviderPool:
+    """Run `generate_code` calls with per-provider concurrency limits, timeouts and retries.
+
+    Each call runs on its own daemon thread so a hung SDK call can be abandoned
+    after `timeout_s`; its concurrency slot is only released once the call
+    actually returns, so abandoned calls still count against the limit.
+    `timeout_s` covers waiting for a slot as well as the call itself.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[dict[str, ProviderLimits]] = None,
+        generate: Callable[..., str] = generate_code,
+    ) -> None:
+        self.limits = {**DEFAULT_PROVIDER_LIMITS, **(limits or {})}
+        self._generate = generate
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _limits_for(self, provider: str) -> ProviderLimits:
+        return self.limits.get(provider, ProviderLimits())
+
+    def _semaphore(self, provider: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if provider not in self._semaphores:
+                self._semaphores[provider] = threading.BoundedSemaphore(max(1, self._limits_for(provider).concurrency))
+            return self._semaphores[provider]
+
+    def _call_once(self, provider: str, timeout_s: float, kwargs: dict[str, Any]) -> str:
+        deadline = time.monotonic() + timeout_s
+        semaphore = self._semaphore(provider)
+        if not semaphore.acquire(timeout=timeout_s):
+            raise TimeoutError(f"{provider} generation timed out after {timeout_s}s waiting for a free slot")
+        future: Future[str] = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(self._generate(provider, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+            finally:
+                semaphore.release()
+
+        threading.Thread(target=run, name=f"nevora-provider-{provider}", daemon=True).start()
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError as exc:
+            raise TimeoutError(f"{provider} generation timed out after {timeout_s}s") from exc
+
+    def generate(
+        self,
+        provider: str,
+        prompt: str,
+        target: str,
+        mode: str = "gameplay",
+        source_language: str = "english",
+        model: Optional[str] = None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Return generated code plus provider stats (latency, attempts)."""
+        normalized = provider.lower().strip()
+        limits = self._limits_for(normalized)
+        kwargs = {"prompt": prompt, "target": target, "mode": mode, "source_language": source_language, "model": model}
+        started = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                output = self._call_once(normalized, limits.timeout_s, kwargs)
+                break
+            except Exception as exc:
+                if attempts > limits.retries or not _is_retryable(exc):
+                    raise
+                time.sleep(limits.backoff_s * (2 ** (attempts - 1)))
+        return output, {
+            "provider": normalized,
+            "model": model,
+            "provider_latency_ms": round((time.perf_counter() - started) * 1000, 3),
+            "provider_attempts": attempts,
+        }
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Estimate the bytes reachable from `obj`, counting shared objects once.
+
+    Follows containers, instance `__dict__`s and `__slots__`; interned
+    builtins such as small ints still count, so this is an upper-bound
+    estimate rather than what freeing `obj` would return to the OS.
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, bytearray, int, float, bool, type(None))):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        else:
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for name in getattr(type(current), "__slots__", ()):
+                if hasattr(current, name):
+                    stack.append(getattr(current, name))
+    return total
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None when it cannot be read.
+
+    Uses /proc on Linux; elsewhere falls back to the peak RSS from
+    `getrusage`, which can only overestimate the current value.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB on Linux/BSD.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
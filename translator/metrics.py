@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import math
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEFAULT_LATENCY_BUCKETS_S = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_HELP = {
+    "nevora_translate_calls": ("counter", "Translations by target, mode and resolved provider."),
+    "nevora_planner_fallbacks": ("counter", "Planner failures answered by the heuristic fallback."),
+    "nevora_plan_cache_requests": ("counter", "Generation plan cache lookups by result."),
+    "nevora_rag_lookups": ("counter", "RAG lattice lookups by result."),
+    "nevora_safety_blocks": ("counter", "Prompts or outputs blocked by the safety policy."),
+    "nevora_verify_results": ("counter", "verify_output results by target and outcome."),
+    "nevora_build_results": ("counter", "Scaffold build verification results by target and outcome."),
+    "nevora_verifier_restarts": ("counter", "Persistent verifier worker processes restarted after exiting."),
+    "nevora_cache_evictions": ("counter", "Cache entries shed to stay under --max-memory-mb."),
+    "nevora_stage_seconds": ("histogram", "Latency of translator stages."),
+}
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = ",".join(
+        '{}="{}"'.format(name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')) for name, value in pairs
+    )
+    return "{" + escaped + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class MetricsRegistry:
+    """Thread-safe counters and histograms rendered as OpenMetrics text.
+
+    Metrics are created on first use; names listed in METRIC_HELP get their
+    type and help text, anything else is treated as a counter.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_S) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._histograms: dict[str, dict[LabelKey, list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, amount: float = 1.0, **labels: object) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            # Per-bucket (non-cumulative) counts followed by count and sum.
+            state = series.get(key)
+            if state is None:
+                state = series[key] = [0.0] * (len(self.buckets) + 3)
+            position = len(self.buckets)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    position = i
+                    break
+            state[position] += 1
+            state[-2] += 1
+            state[-1] += value
+
+    def counter_value(self, name: str, **labels: object) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+
+    def render(self) -> str:
+        """OpenMetrics text exposition, terminated by `# EOF`."""
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: {key: list(state) for key, state in series.items()} for name, series in self._histograms.items()}
+
+        lines: list[str] = []
+        for name in sorted(counters):
+            help_text = METRIC_HELP.get(name, ("counter", name))[1]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(counters[name].items()):
+                lines.append(f"{name}_total{_format_labels(key)} {_format_value(value)}")
+        for name in sorted(histograms):
+            help_text = METRIC_HELP.get(name, ("histogram", name))[1]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, state in sorted(histograms[name].items()):
+                cumulative = 0.0
+                for bound, count in zip(self.buckets + (math.inf,), state[: len(self.buckets) + 1]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {_format_value(cumulative)}")
+                lines.append(f"{name}_count{_format_labels(key)} {_format_value(state[-2])}")
+                lines.append(f"{name}_sum{_format_labels(key)} {_format_value(state[-1])}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def enable_metrics(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    global _registry
+    _registry = registry or MetricsRegistry()
+    return _registry
+
+
+def disable_metrics() -> None:
+    global _registry
+    _registry = None
+
+
+def active_registry() -> Optional[MetricsRegistry]:
+    return _registry
+
+
+def inc(name: str, amount: float = 1.0, **labels: object) -> None:
+    """Increment a counter on the active registry; a no-op while metrics are disabled."""
+    registry = _registry
+    if registry is not None:
+        registry.inc(name, amount, **labels)
+
+
+def observe(name: str, value: float, **labels: object) -> None:
+    """Record a histogram sample on the active registry; a no-op while metrics are disabled."""
+    registry = _registry
+    if registry is not None:
+        registry.observe(name, value, **labels)
+
+
+class MetricsFileWriter:
+    """Rewrite a metrics file every `interval_s` seconds until closed.
+
+    Each write goes to a temp file that is renamed over the target, so
+    node_exporter-style textfile collectors never read a partial file.
+    """
+
+    def __init__(self, registry: MetricsRegistry, path: str, interval_s: float = 5.0) -> None:
+        self.registry = registry
+        self.path = Path(path)
+        self.interval_s = max(0.1, interval_s)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="nevora-metrics-file", daemon=True)
+        self._thread.start()
+
+    def write(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(self.registry.render(), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.write()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.write()
+
+
+def serve_metrics(registry: MetricsRegistry, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve `GET /metrics` from a daemon thread; call `shutdown()` on the result to stop."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            return None
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="nevora-metrics-http", daemon=True).start()
+    return server
+
+
+@contextmanager
+def exporting(
+    metrics_file: Optional[str] = None,
+    port: Optional[int] = None,
+    interval_s: float = 5.0,
+    host: str = "127.0.0.1",
+) -> Iterator[Optional[MetricsRegistry]]:
+    """Enable metrics and run the requested exporters for the duration of the block.
+
+    Yields None (and leaves metrics disabled) when neither exporter is requested.
+    """
+    if not metrics_file and port is None:
+        yield None
+        return
+    registry = enable_metrics()
+    writer = MetricsFileWriter(registry, metrics_file, interval_s) if metrics_file else None
+    server = serve_metrics(registry, port, host) if port is not None else None
+    try:
+        yield registry
+    finally:
+        if writer is not None:
+            writer.close()
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        disable_metrics()
@@ -1,5 +1,17 @@
+from importlib import import_module
+from typing import Any
+
 from .heuristic import HeuristicPlanner
-from .huggingface_planner import HuggingFaceSemanticPlanner
-from .openai_planner import OpenAISemanticPlanner
 
 __all__ = ["HeuristicPlanner", "HuggingFaceSemanticPlanner", "OpenAISemanticPlanner"]
+
+_LAZY = {
+    "HuggingFaceSemanticPlanner": ".huggingface_planner",
+    "OpenAISemanticPlanner": ".openai_planner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        return getattr(import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any
+
+from translator.plugins import discover_entry_points, load_object
+
+PLANNER_ENTRY_POINT_GROUP = "nevora_translator.planners"
+# Semantic planners pull in optional SDKs, so they are imported only when selected.
+BUILTIN_PLANNERS = {
+    "heuristic": "translator.planners.heuristic:HeuristicPlanner",
+    "openai": "translator.planners.openai_planner:OpenAISemanticPlanner",
+    "huggingface": "translator.planners.huggingface_planner:HuggingFaceSemanticPlanner",
+}
+
+
+def available_planners() -> list[str]:
+    """Built-in planner names followed by those registered as entry points."""
+    plugins = [name for name in discover_entry_points(PLANNER_ENTRY_POINT_GROUP) if name not in BUILTIN_PLANNERS]
+    return [*BUILTIN_PLANNERS, *sorted(plugins)]
+
+
+def create_planner(name: str) -> Any:
+    """Import and instantiate a planner by name; plugins come from `nevora_translator.planners` entry points."""
+    spec = BUILTIN_PLANNERS.get(name)
+    if spec is not None:
+        return load_object(spec)()
+    plugins = discover_entry_points(PLANNER_ENTRY_POINT_GROUP)
+    if name not in plugins:
+        raise ValueError(f"Unknown planner '{name}'. Available: {', '.join(available_planners())}")
+    return plugins[name].load()()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+
+def load_object(spec: str) -> Any:
+    """Import `module:attribute` and return the attribute."""
+    module_name, _, attribute = spec.partition(":")
+    return getattr(import_module(module_name), attribute)
+
+
+def discover_entry_points(group: str) -> dict[str, EntryPoint]:
+    """Installed plugins for an entry point group, by name, without loading them."""
+    # importlib.metadata is slow to import, so it is only paid for when plugins are looked up.
+    from importlib import metadata
+
+    return {entry_point.name: entry_point for entry_point in metadata.entry_points(group=group)}
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Iterator, Optional
+
+PROFILE_MODES = ("cpu", "alloc", "sample")
+
+
+class StackSampler:
+    """Background thread that samples every thread's stack via `sys._current_frames()`.
+
+    Unlike cProfile, which only sees the thread it was enabled on, the
+    sampler covers swarm worker threads too, at a cost of one stack walk per
+    thread every `interval_s`. Samples aggregate into collapsed stacks
+    (`thread;outer;...;inner count`) for flamegraph.pl / speedscope.
+    """
+
+    def __init__(self, interval_s: float = 0.005, max_depth: int = 128) -> None:
+        self.interval_s = max(0.0005, interval_s)
+        self.max_depth = max_depth
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="nevora-stack-sampler", daemon=True)
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _frame_stack(self, frame: Optional[FrameType]) -> list[str]:
+        names: list[str] = []
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+            frame = frame.f_back
+        names.reverse()
+        return names
+
+    def sample(self) -> None:
+        own = threading.get_ident()
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = [thread_names.get(ident, f"thread-{ident}")] + self._frame_stack(frame)
+            self.stacks[";".join(part.replace(";", ":") for part in stack)] += 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.sample()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _write(path: Path, text: str) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@contextmanager
+def profiling(
+    mode: Optional[str],
+    output_prefix: str = "nevora-profile",
+    top: int = 40,
+    sample_interval_s: float = 0.005,
+) -> Iterator[list[str]]:
+    """Profile the enclosed block and write results next to `output_prefix`.
+
+    - `cpu`: cProfile of the calling thread -> `<prefix>.pstats` and a
+      cumulative-time summary in `<prefix>.txt`.
+    - `alloc`: tracemalloc snapshots before/after -> top allocating lines in
+      `<prefix>.alloc.txt`.
+    - `sample`: all-thread stack sampling -> `<prefix>.collapsed`.
+
+    Yields the list that receives the written paths once the block exits;
+    `mode=None` profiles nothing.
+    """
+    written: list[str] = []
+    if mode is None:
+        yield written
+        return
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unsupported profile mode '{mode}'. Supported: {', '.join(PROFILE_MODES)}")
+
+    prefix = Path(output_prefix)
+    if mode == "cpu":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield written
+        finally:
+            profiler.disable()
+            stats_path = prefix.with_name(prefix.name + ".pstats")
+            stats_path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(stats_path))
+            written.append(str(stats_path))
+            summary = io.StringIO()
+            pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(top)
+            written.append(_write(prefix.with_name(prefix.name + ".txt"), summary.getvalue()))
+        return
+
+    if mode == "alloc":
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        try:
+            yield written
+        finally:
+            after = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if not was_tracing:
+                tracemalloc.stop()
+            lines = [f"traced current={current / 1024:.1f} KiB peak={peak / 1024:.1f} KiB", f"top {top} allocating lines:"]
+            own = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+            deltas = after.filter_traces(own).compare_to(before.filter_traces(own), "lineno")
+            lines.extend(str(stat) for stat in deltas[:top])
+            written.append(_write(prefix.with_name(prefix.name + ".alloc.txt"), "\n".join(lines) + "\n"))
+        return
+
+    sampler = StackSampler(interval_s=sample_interval_s).start()
+    try:
+        yield written
+    finally:
+        sampler.stop()
+        written.append(_write(prefix.with_name(prefix.name + ".collapsed"), sampler.collapsed()))
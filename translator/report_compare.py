@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from translator.services import percentile
+
+RATE_KEYS = ("success_rate", "verify_output_rate", "verify_build_rate")
+LATENCY_KEYS = ("avg_elapsed_ms", "p50_elapsed_ms", "p90_elapsed_ms", "p95_elapsed_ms", "p99_elapsed_ms")
+
+
+def _pct_change(baseline: float, candidate: float) -> Optional[float]:
+    if baseline <= 0:
+        return None
+    return round((candidate - baseline) / baseline * 100, 3)
+
+
+def _delta(baseline: Any, candidate: Any) -> dict[str, Any]:
+    base = float(baseline or 0.0)
+    cand = float(candidate or 0.0)
+    return {"baseline": base, "candidate": cand, "delta": round(cand - base, 4), "pct_change": _pct_change(base, cand)}
+
+
+def mann_whitney_u(baseline: list[float], candidate: list[float]) -> Optional[dict[str, float]]:
+    """Two-sided Mann-Whitney U test (normal approximation with tie correction).
+
+    Returns None when either sample has fewer than two values.
+    """
+    n1, n2 = len(baseline), len(candidate)
+    if n1 < 2 or n2 < 2:
+        return None
+    combined = sorted([(value, 0) for value in baseline] + [(value, 1) for value in candidate])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = average_rank
+        ties = j - i + 1
+        tie_term += ties**3 - ties
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u1 = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    mean_u = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return {"u": u1, "z": 0.0, "p_value": 1.0}
+    z = (u1 - mean_u) / math.sqrt(variance)
+    p_value = math.erfc(abs(z) / math.sqrt(2))
+    return {"u": u1, "z": round(z, 4), "p_value": round(p_value, 6)}
+
+
+def _ok_elapsed(results: list[dict[str, Any]], target: Optional[str] = None) -> list[float]:
+    return sorted(
+        float(item["elapsed_ms"])
+        for item in results
+        if item.get("ok") and item.get("elapsed_ms") is not None and (target is None or item.get("target") == target)
+    )
+
+
+def _latency_comparison(baseline: list[float], candidate: list[float], alpha: float) -> dict[str, Any]:
+    comparison = {
+        "baseline_count": len(baseline),
+        "candidate_count": len(candidate),
+        "p50_elapsed_ms": _delta(percentile(baseline, 0.50), percentile(candidate, 0.50)),
+        "p95_elapsed_ms": _delta(percentile(baseline, 0.95), percentile(candidate, 0.95)),
+    }
+    test = mann_whitney_u(baseline, candidate)
+    if test is not None:
+        comparison["mann_whitney"] = {**test, "alpha": alpha, "significant": test["p_value"] < alpha}
+    return comparison
+
+
+@dataclass
+class ReportGates:
+    """Regression limits; latency limits are percentages, rate limits are absolute drops (0.0-1.0)."""
+
+    max_p95_regression_pct: Optional[float] = None
+    max_p50_regression_pct: Optional[float] = None
+    # Applied to each stage's p90 and p99 (plan, render, verify, ...).
+    max_stage_regression_pct: Optional[float] = None
+    max_throughput_drop_pct: Optional[float] = None
+    max_success_rate_drop: Optional[float] = None
+    max_verify_rate_drop: Optional[float] = None
+    require_significance: bool = False
+
+
+def compare_batch_reports(
+    baseline: dict[str, Any],
+    candidate: dict[str, Any],
+    baseline_results: Optional[list[dict[str, Any]]] = None,
+    candidate_results: Optional[list[dict[str, Any]]] = None,
+    alpha: float = 0.05,
+) -> dict[str, Any]:
+    """Compare two batch report summaries, plus per-item results when available.
+
+    Per-item results enable per-target latency deltas and a Mann-Whitney U
+    test on `elapsed_ms`; without them only the aggregate fields are compared.
+    """
+    comparison: dict[str, Any] = {
+        "total": _delta(baseline.get("total"), candidate.get("total")),
+        "latency": {key: _delta(baseline.get(key), candidate.get(key)) for key in LATENCY_KEYS},
+        "rates": {key: _delta(baseline.get(key), candidate.get(key)) for key in RATE_KEYS},
+        "throughput_items_per_s": None,
+        "stages": {},
+        "targets": {},
+        "significance": None,
+    }
+    if baseline.get("throughput_items_per_s") and candidate.get("throughput_items_per_s"):
+        comparison["throughput_items_per_s"] = _delta(baseline["throughput_items_per_s"], candidate["throughput_items_per_s"])
+
+    base_stages = baseline.get("stage_latency_ms") or {}
+    cand_stages = candidate.get("stage_latency_ms") or {}
+    for stage in sorted(set(base_stages) & set(cand_stages)):
+        comparison["stages"][stage] = {
+            quantile: _delta(base_stages[stage].get(quantile), cand_stages[stage].get(quantile)) for quantile in ("p50", "p90", "p99")
+        }
+
+    if baseline_results is not None and candidate_results is not None:
+        overall = _latency_comparison(_ok_elapsed(baseline_results), _ok_elapsed(candidate_results), alpha)
+        comparison["significance"] = overall.get("mann_whitney")
+        targets = {str(item.get("target")) for item in baseline_results} & {str(item.get("target")) for item in candidate_results}
+        for target in sorted(targets):
+            comparison["targets"][target] = _latency_comparison(
+                _ok_elapsed(baseline_results, target), _ok_elapsed(candidate_results, target), alpha
+            )
+    return comparison
+
+
+def evaluate_report_gates(comparison: dict[str, Any], gates: ReportGates) -> list[str]:
+    """Return one message per violated gate (empty when everything passes)."""
+    failures: list[str] = []
+
+    def check_latency(label: str, delta: dict[str, Any], limit: Optional[float], test: Optional[dict[str, Any]]) -> None:
+        pct = delta.get("pct_change")
+        if limit is None or pct is None or pct <= limit:
+            return
+        # Without per-item timings there is no test, so the raw delta decides.
+        if gates.require_significance and test is not None and not test["significant"]:
+            return
+        failures.append(f"{label} regressed {pct:.2f}% > {limit:.2f}% ({delta['baseline']} -> {delta['candidate']} ms)")
+
+    overall_test = comparison.get("significance")
+    check_latency("p95_elapsed_ms", comparison["latency"]["p95_elapsed_ms"], gates.max_p95_regression_pct, overall_test)
+    check_latency("p50_elapsed_ms", comparison["latency"]["p50_elapsed_ms"], gates.max_p50_regression_pct, overall_test)
+    for target, entry in comparison["targets"].items():
+        check_latency(f"target {target} p95_elapsed_ms", entry["p95_elapsed_ms"], gates.max_p95_regression_pct, entry.get("mann_whitney"))
+    for stage, entry in comparison["stages"].items():
+        # Stage timings are aggregate-only, so there is no per-stage significance test.
+        for quantile in ("p90", "p99"):
+            check_latency(f"stage {stage} {quantile}", entry[quantile], gates.max_stage_regression_pct, None)
+
+    throughput = comparison.get("throughput_items_per_s")
+    if gates.max_throughput_drop_pct is not None and throughput and throughput["pct_change"] is not None:
+        if -throughput["pct_change"] > gates.max_throughput_drop_pct:
+            failures.append(f"throughput dropped {-throughput['pct_change']:.2f}% > {gates.max_throughput_drop_pct:.2f}%")
+
+    rate_limits = {
+        "success_rate": gates.max_success_rate_drop,
+        "verify_output_rate": gates.max_verify_rate_drop,
+        "verify_build_rate": gates.max_verify_rate_drop,
+    }
+    for key, limit in rate_limits.items():
+        drop = -comparison["rates"][key]["delta"]
+        if limit is not None and drop > limit:
+            failures.append(f"{key} dropped {drop:.4f} > {limit:.4f}")
+    return failures
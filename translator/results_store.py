@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+ITEM_COLUMNS = (
+    "run_id",
+    "idx",
+    "target",
+    "mode",
+    "provider",
+    "source_language",
+    "ok",
+    "elapsed_ms",
+    "verify_output_ok",
+    "verify_build_ok",
+    "reused",
+    "input_hash",
+    "created_ts",
+)
+FILTER_COLUMNS = ("target", "mode", "provider", "source_language")
+
+
+def _flag(value: Any) -> Optional[int]:
+    return None if value is None else int(bool(value))
+
+
+class SQLiteResultsStore:
+    """Append-only SQLite history of batch runs and their items.
+
+    Each run stores its summary and metadata once in `runs`; items keep only
+    the columns analytics filter or aggregate on, indexed by target, mode,
+    provider and timestamp, so trend queries never load report JSON.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT NOT NULL,
+                created_ts REAL NOT NULL,
+                label TEXT,
+                generator_version TEXT,
+                total INTEGER NOT NULL,
+                ok INTEGER NOT NULL,
+                wall_time_ms REAL,
+                metadata TEXT,
+                summary TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS items (
+                run_id INTEGER NOT NULL REFERENCES runs(run_id),
+                idx INTEGER NOT NULL,
+                target TEXT,
+                mode TEXT,
+                provider TEXT,
+                source_language TEXT,
+                ok INTEGER NOT NULL,
+                elapsed_ms REAL,
+                verify_output_ok INTEGER,
+                verify_build_ok INTEGER,
+                reused INTEGER,
+                input_hash TEXT,
+                created_ts REAL NOT NULL,
+                stage_timings TEXT,
+                error TEXT,
+                PRIMARY KEY (run_id, idx)
+            );
+            CREATE INDEX IF NOT EXISTS runs_created ON runs(created_ts);
+            CREATE INDEX IF NOT EXISTS items_target ON items(target, created_ts);
+            CREATE INDEX IF NOT EXISTS items_mode ON items(mode, created_ts);
+            CREATE INDEX IF NOT EXISTS items_provider ON items(provider, created_ts);
+            CREATE INDEX IF NOT EXISTS items_created ON items(created_ts);
+            """
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SQLiteResultsStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def record_run(
+        self,
+        results: Iterable[dict[str, Any]],
+        summary: dict[str, Any],
+        label: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Append one batch run (summary plus items) and return its run id."""
+        created_ts = time.time()
+        created_at = datetime.fromtimestamp(created_ts, timezone.utc).isoformat()
+        stored_summary = {key: value for key, value in summary.items() if key != "results"}
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO runs(created_at, created_ts, label, generator_version, total, ok, wall_time_ms, metadata, summary)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    created_at,
+                    created_ts,
+                    label,
+                    (metadata or {}).get("generator_version"),
+                    int(summary.get("total", 0)),
+                    int(summary.get("ok", 0)),
+                    summary.get("wall_time_ms"),
+                    json.dumps(metadata or {}),
+                    json.dumps(stored_summary),
+                ),
+            )
+            run_id = int(cursor.lastrowid)
+            rows = (
+                (
+                    run_id,
+                    int(item.get("index", position)),
+                    item.get("target"),
+                    item.get("mode"),
+                    item.get("resolved_provider"),
+                    item.get("source_language"),
+                    int(bool(item.get("ok"))),
+                    item.get("elapsed_ms"),
+                    _flag(item.get("verify_output_ok")),
+                    _flag(item.get("verify_build_ok")),
+                    _flag(item.get("reused")),
+                    item.get("input_hash"),
+                    created_ts,
+                    json.dumps(item["stage_timings_ms"]) if "stage_timings_ms" in item else None,
+                    item.get("error"),
+                )
+                for position, item in enumerate(results)
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO items(run_id, idx, target, mode, provider, source_language, ok, elapsed_ms, verify_output_ok,
+                                  verify_build_ok, reused, input_hash, created_ts, stage_timings, error)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return run_id
+
+    def runs(self, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """Run metadata, newest first."""
+        query = "SELECT run_id, created_at, label, generator_version, total, ok, wall_time_ms FROM runs ORDER BY run_id DESC"
+        params: tuple[Any, ...] = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (int(limit),)
+        keys = ("run_id", "created_at", "label", "generator_version", "total", "ok", "wall_time_ms")
+        return [dict(zip(keys, row)) for row in self._conn.execute(query, params)]
+
+    def fetch_columns(
+        self,
+        columns: Iterable[str] = ("run_id", "target", "mode", "ok", "elapsed_ms"),
+        last_runs: Optional[int] = None,
+        since_ts: Optional[float] = None,
+        **filters: Optional[str],
+    ) -> dict[str, list[Any]]:
+        """Selected item columns as parallel lists, filtered by FILTER_COLUMNS values.
+
+        `last_runs` keeps only the most recent N runs; `since_ts` keeps items
+        created at or after that UNIX timestamp.
+        """
+        selected = list(columns)
+        unknown = set(selected) - set(ITEM_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown item column(s): {', '.join(sorted(unknown))}. Supported: {', '.join(ITEM_COLUMNS)}")
+        clauses: list[str] = []
+        params: list[Any] = []
+        for name, value in filters.items():
+            if name not in FILTER_COLUMNS:
+                raise ValueError(f"Unsupported filter '{name}'. Supported: {', '.join(FILTER_COLUMNS)}")
+            if value is not None:
+                clauses.append(f"{name} = ?")
+                params.append(value)
+        if since_ts is not None:
+            clauses.append("created_ts >= ?")
+            params.append(since_ts)
+        if last_runs is not None:
+            clauses.append("run_id IN (SELECT run_id FROM runs ORDER BY run_id DESC LIMIT ?)")
+            params.append(int(last_runs))
+        query = f"SELECT {', '.join(selected)} FROM items"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY run_id, idx"
+        rows = self._conn.execute(query, params).fetchall()
+        return {name: [row[position] for row in rows] for position, name in enumerate(selected)}
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+from translator import metrics
+
+
+class SafetyScanner:
+    """Case-insensitive blocked-pattern scan over text that arrives in chunks.
+
+    Keeps the last `len(longest pattern) - 1` lowered characters between
+    `feed()` calls, so a pattern split across chunk boundaries is still
+    caught, while memory stays bounded regardless of the total length.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = [pattern.lower() for pattern in patterns]
+        self._keep = max((len(pattern) for pattern in self.patterns), default=1) - 1
+        self._tail = ""
+
+    def feed(self, chunk: str) -> None:
+        """Scan one more chunk; raises ValueError on the first blocked pattern."""
+        window = self._tail + chunk.lower()
+        for pattern in self.patterns:
+            if pattern in window:
+                metrics.inc("nevora_safety_blocks", pattern=pattern)
+                raise ValueError(f"Safety policy blocked content containing pattern: {pattern}")
+        self._tail = window[-self._keep :] if self._keep else ""
+
+    def scan(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Yield each chunk after it has been scanned."""
+        for chunk in chunks:
+            self.feed(chunk)
+            yield chunk
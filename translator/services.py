@@ -1,62 +1,313 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import math
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import IO, Any, Iterable, Optional
+
+
+class QuantileSketch:
+    """Mergeable DDSketch-style quantile sketch for non-negative latencies.
+
+    Values fall into logarithmic buckets, so every quantile is reported within
+    `relative_accuracy` of the exact value while memory stays bounded by the
+    value range rather than the number of samples.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        value = max(0.0, float(value))
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value < 1e-9:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.bins[key] = self.bins.get(key, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        cumulative = self.zero_count
+        if rank < cumulative:
+            return self.min
+        for key in sorted(self.bins):
+            cumulative += self.bins[key]
+            if cumulative > rank:
+                estimate = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentiles(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "p50": round(self.quantile(0.50), 3),
+            "p90": round(self.quantile(0.90), 3),
+            "p99": round(self.quantile(0.99), 3),
+        }
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "bins": {str(key): count for key, count in self.bins.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(float(state.get("relative_accuracy", 0.01)))
+        sketch.bins = {int(key): int(count) for key, count in state.get("bins", {}).items()}
+        sketch.zero_count = int(state.get("zero_count", 0))
+        sketch.count = int(state.get("count", 0))
+        sketch.total = float(state.get("total", 0.0))
+        if sketch.count:
+            sketch.min = float(state["min"])
+            sketch.max = float(state["max"])
+        return sketch
+
+
+def _add_count(counts: dict[str, int], key: str, amount: int = 1) -> None:
+    counts[key] = counts.get(key, 0) + amount
 
 
 @dataclass
-class BatchReportService:
+class BatchReportAggregator:
+    """Incremental, constant-memory batch report builder.
+
+    Feed results one at a time with `add`; combine shard or worker
+    aggregators with `merge`; `summary` renders the report fields.
+    """
+
     lattice_shape: tuple[int, int, int, int]
+    total: int = 0
+    ok: int = 0
+    verify_output_ok: int = 0
+    verify_build_ok: int = 0
+    target_counts: dict[str, int] = field(default_factory=dict)
+    provider_counts: dict[str, int] = field(default_factory=dict)
+    source_language_counts: dict[str, int] = field(default_factory=dict)
+    lattice_bucket_counts: dict[str, int] = field(default_factory=dict)
+    elapsed: QuantileSketch = field(default_factory=QuantileSketch)
+    stage_elapsed: dict[str, QuantileSketch] = field(default_factory=dict)
+    priority_elapsed: dict[str, QuantileSketch] = field(default_factory=dict)
+    stage_memory: dict[str, dict[str, float]] = field(default_factory=dict)
+    deadline_counts: dict[str, int] = field(default_factory=lambda: {"with_deadline": 0, "missed": 0, "downgraded": 0, "skipped": 0})
+    incremental_items: int = 0
+    reused: int = 0
 
-    def build_summary(self, batch_results: list[dict[str, Any]]) -> dict[str, Any]:
-        ok_count = sum(1 for r in batch_results if r.get("ok"))
-        failed_count = sum(1 for r in batch_results if not r.get("ok"))
-        verify_output_ok_count = sum(1 for r in batch_results if r.get("verify_output_ok") is True)
-        verify_build_ok_count = sum(1 for r in batch_results if r.get("verify_build_ok") is True)
+    def add(self, item: dict[str, Any]) -> None:
+        self.total += 1
+        if item.get("ok"):
+            self.ok += 1
+        if item.get("verify_output_ok") is True:
+            self.verify_output_ok += 1
+        if item.get("verify_build_ok") is True:
+            self.verify_build_ok += 1
+        _add_count(self.target_counts, str(item.get("target", "unknown")))
+        _add_count(self.provider_counts, str(item.get("resolved_provider", "unknown")))
+        _add_count(self.source_language_counts, str(item.get("source_language", "unknown")))
+        bucket = item.get("lattice_bucket")
+        if isinstance(bucket, list) and len(bucket) == 4:
+            _add_count(self.lattice_bucket_counts, "x".join(str(v) for v in bucket))
 
-        target_counts: dict[str, int] = {}
-        provider_counts: dict[str, int] = {}
-        source_language_counts: dict[str, int] = {}
-        lattice_bucket_counts: dict[str, int] = {}
-        for item in batch_results:
-            target = str(item.get("target", "unknown"))
-            provider = str(item.get("resolved_provider", "unknown"))
-            source_language = str(item.get("source_language", "unknown"))
-            target_counts[target] = target_counts.get(target, 0) + 1
-            provider_counts[provider] = provider_counts.get(provider, 0) + 1
-            source_language_counts[source_language] = source_language_counts.get(source_language, 0) + 1
-            bucket = item.get("lattice_bucket")
-            if isinstance(bucket, list) and len(bucket) == 4:
-                key = "x".join(str(v) for v in bucket)
-                lattice_bucket_counts[key] = lattice_bucket_counts.get(key, 0) + 1
-
-        total = len(batch_results)
-        elapsed_values = sorted(float(item.get("elapsed_ms", 0.0)) for item in batch_results if item.get("ok") and item.get("elapsed_ms") is not None)
-        success_rate = (ok_count / total) if total else 0.0
-        verify_output_rate = (verify_output_ok_count / total) if total else 0.0
-        verify_build_rate = (verify_build_ok_count / total) if total else 0.0
+        if item.get("ok") and item.get("elapsed_ms") is not None:
+            elapsed_ms = float(item["elapsed_ms"])
+            self.elapsed.add(elapsed_ms)
+            self.priority_elapsed.setdefault(str(item.get("priority", 0)), QuantileSketch()).add(elapsed_ms)
+
+        timings = item.get("stage_timings_ms")
+        if isinstance(timings, dict):
+            for stage, value in timings.items():
+                self.stage_elapsed.setdefault(str(stage), QuantileSketch()).add(float(value))
 
+        memory = item.get("stage_memory_kb")
+        if isinstance(memory, dict):
+            for stage, entry in memory.items():
+                self._add_stage_memory(str(stage), 1, float(entry.get("delta", 0.0)), float(entry.get("peak", 0.0)))
+
+        if item.get("deadline_ms") is not None:
+            self.deadline_counts["with_deadline"] += 1
+            if item.get("deadline_missed"):
+                self.deadline_counts["missed"] += 1
+            action = item.get("deadline_action")
+            if action in {"downgraded", "skipped"}:
+                self.deadline_counts[str(action)] += 1
+
+        if "reused" in item:
+            self.incremental_items += 1
+            if item.get("reused") is True:
+                self.reused += 1
+
+    def _add_stage_memory(self, stage: str, count: int, delta_kb: float, peak_kb: float) -> None:
+        entry = self.stage_memory.setdefault(stage, {"count": 0, "delta_total_kb": 0.0, "peak_max_kb": 0.0})
+        entry["count"] += count
+        entry["delta_total_kb"] += delta_kb
+        entry["peak_max_kb"] = max(entry["peak_max_kb"], peak_kb)
+
+    def merge(self, other: "BatchReportAggregator") -> "BatchReportAggregator":
+        self.total += other.total
+        self.ok += other.ok
+        self.verify_output_ok += other.verify_output_ok
+        self.verify_build_ok += other.verify_build_ok
+        for mine, theirs in (
+            (self.target_counts, other.target_counts),
+            (self.provider_counts, other.provider_counts),
+            (self.source_language_counts, other.source_language_counts),
+            (self.lattice_bucket_counts, other.lattice_bucket_counts),
+            (self.deadline_counts, other.deadline_counts),
+        ):
+            for key, count in theirs.items():
+                _add_count(mine, key, count)
+        self.elapsed.merge(other.elapsed)
+        for mine_sketches, their_sketches in ((self.stage_elapsed, other.stage_elapsed), (self.priority_elapsed, other.priority_elapsed)):
+            for key, sketch in their_sketches.items():
+                mine_sketches.setdefault(key, QuantileSketch(sketch.relative_accuracy)).merge(sketch)
+        for stage, entry in other.stage_memory.items():
+            self._add_stage_memory(stage, int(entry["count"]), entry["delta_total_kb"], entry["peak_max_kb"])
+        self.incremental_items += other.incremental_items
+        self.reused += other.reused
+        return self
+
+    def summary(self) -> dict[str, Any]:
+        total = self.total
+        incremental = None
+        if self.incremental_items:
+            incremental = {"reused": self.reused, "recomputed": total - self.reused}
         return {
             "generated_at": datetime.now(timezone.utc).isoformat(),
             "total": total,
-            "ok": ok_count,
-            "failed": failed_count,
-            "success_rate": round(success_rate, 4),
-            "verify_output_ok": verify_output_ok_count,
-            "verify_build_ok": verify_build_ok_count,
-            "verify_output_rate": round(verify_output_rate, 4),
-            "verify_build_rate": round(verify_build_rate, 4),
-            "target_counts": target_counts,
-            "resolved_provider_counts": provider_counts,
-            "source_language_counts": source_language_counts,
+            "ok": self.ok,
+            "failed": total - self.ok,
+            "success_rate": round(self.ok / total, 4) if total else 0.0,
+            "verify_output_ok": self.verify_output_ok,
+            "verify_build_ok": self.verify_build_ok,
+            "verify_output_rate": round(self.verify_output_ok / total, 4) if total else 0.0,
+            "verify_build_rate": round(self.verify_build_ok / total, 4) if total else 0.0,
+            "target_counts": dict(self.target_counts),
+            "resolved_provider_counts": dict(self.provider_counts),
+            "source_language_counts": dict(self.source_language_counts),
             "lattice_shape": list(self.lattice_shape),
-            "lattice_bucket_counts": lattice_bucket_counts,
-            "avg_elapsed_ms": round(sum(elapsed_values) / len(elapsed_values), 3) if elapsed_values else 0.0,
-            "p95_elapsed_ms": round(elapsed_values[min(len(elapsed_values) - 1, int(0.95 * (len(elapsed_values) - 1)))], 3) if elapsed_values else 0.0,
-            "results": batch_results,
+            "lattice_bucket_counts": dict(self.lattice_bucket_counts),
+            "avg_elapsed_ms": round(self.elapsed.total / self.elapsed.count, 3) if self.elapsed.count else 0.0,
+            "p50_elapsed_ms": round(self.elapsed.quantile(0.50), 3),
+            "p90_elapsed_ms": round(self.elapsed.quantile(0.90), 3),
+            "p95_elapsed_ms": round(self.elapsed.quantile(0.95), 3),
+            "p99_elapsed_ms": round(self.elapsed.quantile(0.99), 3),
+            "stage_latency_ms": {stage: sketch.percentiles() for stage, sketch in sorted(self.stage_elapsed.items())},
+            "priority_latency_ms": {priority: sketch.percentiles() for priority, sketch in sorted(self.priority_elapsed.items())},
+            "stage_memory_kb": {
+                stage: {key: round(value, 3) for key, value in entry.items()} for stage, entry in sorted(self.stage_memory.items())
+            },
+            "deadline_counts": dict(self.deadline_counts),
+            "incremental": incremental,
+            "aggregate_state": self.to_state(),
         }
 
+    def to_state(self) -> dict[str, Any]:
+        """Serializable state so reports from shards can be merged later."""
+        return {
+            "total": self.total,
+            "ok": self.ok,
+            "verify_output_ok": self.verify_output_ok,
+            "verify_build_ok": self.verify_build_ok,
+            "target_counts": self.target_counts,
+            "provider_counts": self.provider_counts,
+            "source_language_counts": self.source_language_counts,
+            "lattice_bucket_counts": self.lattice_bucket_counts,
+            "elapsed": self.elapsed.to_state(),
+            "stage_elapsed": {key: sketch.to_state() for key, sketch in self.stage_elapsed.items()},
+            "priority_elapsed": {key: sketch.to_state() for key, sketch in self.priority_elapsed.items()},
+            "stage_memory": self.stage_memory,
+            "deadline_counts": self.deadline_counts,
+            "incremental_items": self.incremental_items,
+            "reused": self.reused,
+        }
+
+    @classmethod
+    def from_state(cls, lattice_shape: tuple[int, int, int, int], state: dict[str, Any]) -> "BatchReportAggregator":
+        aggregator = cls(lattice_shape)
+        for name in ("total", "ok", "verify_output_ok", "verify_build_ok", "incremental_items", "reused"):
+            setattr(aggregator, name, int(state.get(name, 0)))
+        for name in ("target_counts", "provider_counts", "source_language_counts", "lattice_bucket_counts"):
+            setattr(aggregator, name, {str(k): int(v) for k, v in state.get(name, {}).items()})
+        aggregator.deadline_counts.update({str(k): int(v) for k, v in state.get("deadline_counts", {}).items()})
+        for stage, entry in state.get("stage_memory", {}).items():
+            aggregator._add_stage_memory(str(stage), int(entry["count"]), float(entry["delta_total_kb"]), float(entry["peak_max_kb"]))
+        aggregator.elapsed = QuantileSketch.from_state(state.get("elapsed", {}))
+        aggregator.stage_elapsed = {k: QuantileSketch.from_state(v) for k, v in state.get("stage_elapsed", {}).items()}
+        aggregator.priority_elapsed = {k: QuantileSketch.from_state(v) for k, v in state.get("priority_elapsed", {}).items()}
+        return aggregator
+
+
+@dataclass
+class BatchReportService:
+    lattice_shape: tuple[int, int, int, int]
+
+    def aggregator(self) -> BatchReportAggregator:
+        return BatchReportAggregator(self.lattice_shape)
+
+    def build_summary(
+        self,
+        batch_results: Iterable[dict[str, Any]],
+        include_results: bool = True,
+        results_sink: Optional[IO[str]] = None,
+    ) -> dict[str, Any]:
+        """Aggregate results in one pass.
+
+        Results are embedded under `results` unless `include_results` is off;
+        a `results_sink` receives each result as a JSONL line instead.
+        """
+        aggregator = self.aggregator()
+        embedded: list[dict[str, Any]] = []
+        for item in batch_results:
+            aggregator.add(item)
+            if include_results:
+                embedded.append(item)
+            if results_sink is not None:
+                results_sink.write(json.dumps(item) + "\n")
+        summary = aggregator.summary()
+        if include_results:
+            summary["results"] = embedded
+        return summary
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
 
 def validate_ordered_results(results: list[dict[str, Any]]) -> None:
     expected = list(range(len(results)))
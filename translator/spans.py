@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator, Optional
+
+from translator import metrics
+
+_local = threading.local()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+NULL_SPAN = _NullSpan()
+
+
+class SpanRecorder:
+    """Collects stage timings for the spans opened on one thread.
+
+    `timings_ms` only accumulates outermost spans, so stages never overlap and
+    their sum stays within the item's wall time; nested spans (for example the
+    plan lookup inside `explain`) are still kept in `events`.
+
+    With `track_memory` and tracemalloc running, outermost spans also record
+    the traced-memory delta and the peak above their starting point in
+    `memory_kb`. tracemalloc is process-wide, so with several threads the
+    numbers include allocations made concurrently by other items.
+    """
+
+    def __init__(self, track_memory: bool = False) -> None:
+        self.timings_ms: dict[str, float] = {}
+        self.events: list[tuple[str, float, float, int]] = []
+        self.depth = 0
+        self.track_memory = track_memory
+        self.memory_kb: dict[str, dict[str, float]] = {}
+        self.args: dict[str, object] = {}
+
+    def record_memory(self, name: str, start_bytes: int, end_bytes: int, peak_bytes: int) -> None:
+        entry = self.memory_kb.setdefault(name, {"delta": 0.0, "peak": 0.0})
+        entry["delta"] += (end_bytes - start_bytes) / 1024
+        entry["peak"] = max(entry["peak"], max(0, peak_bytes - start_bytes) / 1024)
+
+    def record(self, name: str, started: float, ended: float, depth: int) -> None:
+        self.events.append((name, started, ended, depth))
+        if depth == 0:
+            self.timings_ms[name] = self.timings_ms.get(name, 0.0) + (ended - started) * 1000
+
+    def rounded_timings(self) -> dict[str, float]:
+        return {name: round(value, 3) for name, value in self.timings_ms.items()}
+
+    def rounded_memory(self) -> dict[str, dict[str, float]]:
+        return {name: {key: round(value, 3) for key, value in entry.items()} for name, entry in self.memory_kb.items()}
+
+
+class _Span:
+    __slots__ = ("recorder", "name", "started", "depth", "memory_start")
+
+    def __init__(self, recorder: Optional[SpanRecorder], name: str) -> None:
+        self.recorder = recorder
+        self.name = name
+        self.memory_start: Optional[int] = None
+
+    def __enter__(self) -> None:
+        if self.recorder is not None:
+            self.depth = self.recorder.depth
+            self.recorder.depth += 1
+            if self.recorder.track_memory and self.depth == 0 and tracemalloc.is_tracing():
+                self.memory_start = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+        self.started = perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        ended = perf_counter()
+        if self.recorder is not None:
+            self.recorder.depth -= 1
+            self.recorder.record(self.name, self.started, ended, self.depth)
+            if self.memory_start is not None and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                self.recorder.record_memory(self.name, self.memory_start, current, peak)
+        metrics.observe("nevora_stage_seconds", ended - self.started, stage=self.name)
+
+
+def current_recorder() -> Optional[SpanRecorder]:
+    return getattr(_local, "recorder", None)
+
+
+def annotate(**args: object) -> None:
+    """Attach key/value facts (cache hits, ...) to the item being collected on this thread."""
+    recorder = getattr(_local, "recorder", None)
+    if recorder is not None:
+        recorder.args.update(args)
+
+
+def span(name: str) -> _Span | _NullSpan:
+    """Time a stage on the current thread.
+
+    Returns a shared no-op when no recorder is collecting and metrics are disabled.
+    """
+    recorder = getattr(_local, "recorder", None)
+    if recorder is None and metrics.active_registry() is None:
+        return NULL_SPAN
+    return _Span(recorder, name)
+
+
+@contextmanager
+def collect_spans(track_memory: bool = False) -> Iterator[SpanRecorder]:
+    """Collect spans opened on this thread until the block exits."""
+    previous = getattr(_local, "recorder", None)
+    recorder = SpanRecorder(track_memory=track_memory)
+    _local.recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _local.recorder = previous
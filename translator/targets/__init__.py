@@ -1,3 +1,4 @@
 from .registry import build_registry
+from .templating import CompiledTemplate, TemplateLoader
 
-__all__ = ["build_registry"]
+__all__ = ["build_registry", "CompiledTemplate", "TemplateLoader"]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Protocol
+import re
+from typing import Any, Iterator, Protocol
 
 from translator.models import GenerationPlan, ParsedIntent
+from translator.targets.templating import TemplateLoader
+
+RENDER_PROFILES = ("default", "performance")
 
 
 class TargetRenderer(Protocol):
@@ -16,3 +20,90 @@ class TargetRenderer(Protocol):
         plan: GenerationPlan | None = None,
     ) -> str:
         ...
+
+
+def intent_flags(prompt: str, intent: ParsedIntent) -> dict[str, bool]:
+    """`has_<token>` flags for every intent token and prompt word (plurals also set the singular)."""
+    tokens = [*intent.entities, *intent.actions, *intent.conditions, *intent.outputs]
+    tokens.extend(re.findall(r"[a-z0-9]+", prompt.lower()))
+    flags: dict[str, bool] = {}
+    for token in tokens:
+        slug = re.sub(r"[^a-z0-9]+", "_", token.lower()).strip("_")
+        if slug:
+            flags[f"has_{slug}"] = True
+            if slug.endswith("s") and len(slug) > 3:
+                flags[f"has_{slug[:-1]}"] = True
+    return flags
+
+
+class TemplatedRenderer:
+    """Renders the `<name>.tmpl` template with values built by `template_values`.
+
+    With a non-default render profile, `<profile>/<mode>/<name>.tmpl` is used
+    when it exists, and its sections can test `intent_flags` such as
+    `has_spawn`; modes without a profile template render the default one.
+    """
+
+    name = ""
+
+    def __init__(self, templates: TemplateLoader | None = None) -> None:
+        self.templates = templates or TemplateLoader()
+
+    def template_name(self, mode: str, render_profile: str = "default") -> str:
+        if render_profile != "default":
+            candidate = f"{render_profile}/{mode}/{self.name}"
+            if self.templates.has(candidate):
+                return candidate
+        return self.name
+
+    def template_values(self, prompt: str, intent: ParsedIntent, mode: str, plan: GenerationPlan | None) -> dict[str, Any]:
+        return {"prompt": prompt, "mode": mode, "actions": ", ".join(intent.actions)}
+
+    def _values(self, template: str, prompt: str, intent: ParsedIntent, mode: str, plan: GenerationPlan | None) -> dict[str, Any]:
+        values = self.template_values(prompt, intent, mode, plan)
+        if template != self.name:
+            values.update(intent_flags(prompt, intent))
+        return values
+
+    def render(
+        self,
+        prompt: str,
+        intent: ParsedIntent,
+        mode: str = "gameplay",
+        plan: GenerationPlan | None = None,
+        render_profile: str = "default",
+    ) -> str:
+        template = self.template_name(mode, render_profile)
+        return self.templates.get(template).render(self._values(template, prompt, intent, mode, plan))
+
+    def render_iter(
+        self,
+        prompt: str,
+        intent: ParsedIntent,
+        mode: str = "gameplay",
+        plan: GenerationPlan | None = None,
+        render_profile: str = "default",
+    ) -> Iterator[str]:
+        template = self.template_name(mode, render_profile)
+        return self.templates.get(template).render_iter(self._values(template, prompt, intent, mode, plan))
+
+
+def render_chunks(
+    renderer: Any,
+    prompt: str,
+    intent: ParsedIntent,
+    mode: str = "gameplay",
+    plan: GenerationPlan | None = None,
+    render_profile: str = "default",
+) -> Iterator[str]:
+    """Stream a renderer's output; renderers without `render_iter` yield their `render()` result whole.
+
+    `render_profile` is only passed on when it is not the default, so plugin
+    renderers without profile support keep working for default renders.
+    """
+    extra = {"render_profile": render_profile} if render_profile != "default" else {}
+    render_iter = getattr(renderer, "render_iter", None)
+    if render_iter is not None:
+        yield from render_iter(prompt, intent, mode=mode, plan=plan, **extra)
+    else:
+        yield renderer.render(prompt, intent, mode=mode, plan=plan, **extra)
@@ -1,22 +1,16 @@
 from __future__ import annotations
 
+from typing import Any
+
 from translator.models import GenerationPlan, ParsedIntent
+from translator.targets.base import TemplatedRenderer
 
 
-class BlueprintRenderer:
+class BlueprintRenderer(TemplatedRenderer):
     name = "blueprint"
 
-    def render(self, prompt: str, intent: ParsedIntent, mode: str = "gameplay", plan: GenerationPlan | None = None) -> str:
-        return f'''# Unreal Engine Blueprint-style pseudograph (beginner-friendly)
-# Prompt: {prompt}
-# Mode: {mode}
-# Read top-to-bottom as execution flow.
-
-[Event BeginPlay]
-  -> [Comment: Initialize core entities extracted from prompt]
-  -> [Set Entities = "{', '.join(intent.entities)}"]
-  -> [Comment: Check conditions before doing actions]
-  -> [Branch: {', '.join(intent.conditions)}]
-      True -> [Execute Actions: {', '.join(intent.actions)}]
-      False -> [No-op]
-'''
+    def template_values(self, prompt: str, intent: ParsedIntent, mode: str, plan: GenerationPlan | None) -> dict[str, Any]:
+        values = super().template_values(prompt, intent, mode, plan)
+        values["entities"] = ", ".join(intent.entities)
+        values["conditions"] = ", ".join(intent.conditions)
+        return values
@@ -1,35 +1,13 @@
 from __future__ import annotations
 
+from typing import Any
+
 from translator.models import GenerationPlan, ParsedIntent
+from translator.targets.base import TemplatedRenderer
 
 
-class CppRenderer:
+class CppRenderer(TemplatedRenderer):
     name = "cpp"
 
-    def render(self, prompt: str, intent: ParsedIntent, mode: str = "gameplay", plan: GenerationPlan | None = None) -> str:
-        return f'''// Beginner-friendly C++ starter generated by Nevora.
-// Prompt: {prompt}
-// Mode: {mode}
-// Tip: Rename `GeneratedFeature` to match your gameplay/system feature name.
-
-#include <iostream>
-#include <string>
-
-class GeneratedFeature {{
-public:
-  // Call this from your game loop or event bridge.
-  void Run(const std::string& eventType) {{
-    if (eventType != "input" && eventType != "tick" && eventType != "request") {{
-      return; // Ignore unsupported events.
-    }}
-
-    std::cout << "Actions: {', '.join(intent.actions)}" << std::endl;
-  }}
-}};
-
-int main() {{
-  GeneratedFeature feature;
-  feature.Run("input");
-  return 0;
-}}
-'''
+    def template_values(self, prompt: str, intent: ParsedIntent, mode: str, plan: GenerationPlan | None) -> dict[str, Any]:
+        return {**super().template_values(prompt, intent, mode, plan), "language": "C++"}
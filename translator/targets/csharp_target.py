@@ -1,34 +1,13 @@
 from __future__ import annotations
 
+from typing import Any
+
 from translator.models import GenerationPlan, ParsedIntent
+from translator.targets.base import TemplatedRenderer
 
 
-class CSharpRenderer:
+class CSharpRenderer(TemplatedRenderer):
     name = "csharp"
 
-    def render(self, prompt: str, intent: ParsedIntent, mode: str = "gameplay", plan: GenerationPlan | None = None) -> str:
-        return f'''// Beginner-friendly C# starter generated by Nevora.
-// Prompt: {prompt}
-// Mode: {mode}
-using System;
-
-public class GeneratedFeature
-{{
-  // Call Run(...) from your Unity/engine event hook.
-  public void Run(string eventType)
-  {{
-    if (eventType != "input" && eventType != "tick" && eventType != "request")
-    {{
-      return; // Ignore unsupported event types.
-    }}
-
-    Console.WriteLine("Actions: {', '.join(intent.actions)}");
-  }}
-
-  public static void Main()
-  {{
-    var feature = new GeneratedFeature();
-    feature.Run("input");
-  }}
-}}
-'''
+    def template_values(self, prompt: str, intent: ParsedIntent, mode: str, plan: GenerationPlan | None) -> dict[str, Any]:
+        return {**super().template_values(prompt, intent, mode, plan), "language": "C#"}
@@ -1,24 +1,7 @@
 from __future__ import annotations
 
-from translator.models import GenerationPlan, ParsedIntent
+from translator.targets.base import TemplatedRenderer
 
 
-class GDScriptRenderer:
+class GDScriptRenderer(TemplatedRenderer):
     name = "gdscript"
-
-    def render(self, prompt: str, intent: ParsedIntent, mode: str = "gameplay", plan: GenerationPlan | None = None) -> str:
-        return f'''# Beginner-friendly GDScript starter generated by Nevora.
-# Prompt: {prompt}
-# Mode: {mode}
-extends Node
-
-# Called when this node enters the scene tree.
-func _ready() -> void:
-    var event_type := "input"
-
-    # Guard clause so only expected event categories are processed.
-    if event_type not in ["input", "tick", "request"]:
-        return
-
-    print("Actions: {', '.join(intent.actions)}")
-'''
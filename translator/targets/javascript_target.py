@@ -1,28 +1,13 @@
 from __future__ import annotations
 
+from typing import Any
+
 from translator.models import GenerationPlan, ParsedIntent
+from translator.targets.base import TemplatedRenderer
 
 
-class JavaScriptRenderer:
+class JavaScriptRenderer(TemplatedRenderer):
     name = "javascript"
 
-    def render(self, prompt: str, intent: ParsedIntent, mode: str = "gameplay", plan: GenerationPlan | None = None) -> str:
-        return f'''// Beginner-friendly JavaScript starter generated by Nevora.
-// Prompt: {prompt}
-// Mode: {mode}
-
-class GeneratedFeature {{
-  // Call run(...) from your app/game event router.
-  run(event) {{
-    const eventType = event?.type;
-    if (!["input", "tick", "request"].includes(eventType)) {{
-      return; // Skip unsupported event categories.
-    }}
-
-    console.log("Actions: {', '.join(intent.actions)}");
-  }}
-}}
-
-const feature = new GeneratedFeature();
-feature.run({{ type: "input" }});
-'''
+    def template_values(self, prompt: str, intent: ParsedIntent, mode: str, plan: GenerationPlan | None) -> dict[str, Any]:
+        return {**super().template_values(prompt, intent, mode, plan), "language": "JavaScript"}
@@ -1,20 +1,81 @@
 from __future__ import annotations
 
-from translator.targets.blueprint_target import BlueprintRenderer
-from translator.targets.cpp_target import CppRenderer
-from translator.targets.csharp_target import CSharpRenderer
-from translator.targets.gdscript_target import GDScriptRenderer
-from translator.targets.javascript_target import JavaScriptRenderer
-from translator.targets.python_target import PythonRenderer
-
-
-def build_registry() -> dict[str, object]:
-    renderers = [
-        PythonRenderer(),
-        BlueprintRenderer(),
-        CppRenderer(),
-        CSharpRenderer(),
-        JavaScriptRenderer(),
-        GDScriptRenderer(),
-    ]
-    return {renderer.name: renderer for renderer in renderers}
+import threading
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any, Optional
+
+from translator.plugins import discover_entry_points, load_object
+from translator.targets.base import TemplatedRenderer
+from translator.targets.templating import TemplateLoader
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+RENDERER_ENTRY_POINT_GROUP = "nevora_translator.renderers"
+# Built-in renderers as "module:attribute"; nothing is imported until a target is requested.
+BUILTIN_RENDERERS = {
+    "python": "translator.targets.python_target:PythonRenderer",
+    "blueprint": "translator.targets.blueprint_target:BlueprintRenderer",
+    "cpp": "translator.targets.cpp_target:CppRenderer",
+    "csharp": "translator.targets.csharp_target:CSharpRenderer",
+    "javascript": "translator.targets.javascript_target:JavaScriptRenderer",
+    "gdscript": "translator.targets.gdscript_target:GDScriptRenderer",
+}
+
+
+class RendererRegistry(Mapping[str, Any]):
+    """Target name -> renderer, imported and instantiated on first lookup.
+
+    Third-party renderers register under the `nevora_translator.renderers`
+    entry point group, pointing at a renderer class (or zero-argument
+    factory). Entry points are only listed when a target is not built in or
+    the full target list is needed, and only the requested one is loaded.
+    Classes deriving from `TemplatedRenderer` receive the shared loader.
+    """
+
+    def __init__(self, templates: Optional[TemplateLoader] = None, builtins: Optional[dict[str, str]] = None) -> None:
+        self.templates = templates or TemplateLoader()
+        self._builtins = dict(BUILTIN_RENDERERS if builtins is None else builtins)
+        self._plugins: Optional[dict[str, EntryPoint]] = None
+        self._renderers: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _plugin_entry_points(self) -> dict[str, EntryPoint]:
+        if self._plugins is None:
+            self._plugins = {name: ep for name, ep in discover_entry_points(RENDERER_ENTRY_POINT_GROUP).items() if name not in self._builtins}
+        return self._plugins
+
+    def _instantiate(self, factory: Any) -> Any:
+        if isinstance(factory, type) and issubclass(factory, TemplatedRenderer):
+            return factory(self.templates)
+        return factory()
+
+    def __getitem__(self, name: str) -> Any:
+        renderer = self._renderers.get(name)
+        if renderer is None:
+            if name not in self:
+                raise KeyError(name)
+            with self._lock:
+                renderer = self._renderers.get(name)
+                if renderer is None:
+                    spec = self._builtins.get(name)
+                    factory = load_object(spec) if spec is not None else self._plugin_entry_points()[name].load()
+                    renderer = self._renderers[name] = self._instantiate(factory)
+        return renderer
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._renderers or name in self._builtins or name in self._plugin_entry_points()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([*self._builtins, *self._plugin_entry_points()])
+
+    def __len__(self) -> int:
+        return len(self._builtins) + len(self._plugin_entry_points())
+
+    def loaded(self) -> list[str]:
+        """Targets whose renderer has been imported so far."""
+        return list(self._renderers)
+
+
+def build_registry(templates: Optional[TemplateLoader] = None) -> RendererRegistry:
+    return RendererRegistry(templates)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional
+
+BUILTIN_TEMPLATE_DIR = Path(__file__).with_name("templates")
+TEMPLATE_SUFFIX = ".tmpl"
+# `{{ name }}` substitutes a variable; `{{> name }}` inlines another template at compile time;
+# `{{# flag }}...{{/ flag }}` keeps its body only when `flag` is truthy (`{{^ flag }}` when falsy).
+_TOKEN = re.compile(r"\{\{\s*([>#^/]?)\s*([A-Za-z_][A-Za-z0-9_/]*)\s*\}\}")
+
+# Parsed segments: ("text", str), ("var", name) or ("section", name, inverted, children).
+Segment = tuple[Any, ...]
+
+
+class CompiledTemplate:
+    """A template parsed once into constant fragments and variable slots.
+
+    Rendering copies the prefilled fragment list, drops each variable (or
+    rendered section) into its slot and joins once, so constant text is
+    never rebuilt per call.
+    """
+
+    __slots__ = ("name", "variables", "_parts", "_slots")
+
+    def __init__(self, name: str, segments: list[Segment], fragments: Optional[dict[str, str]] = None) -> None:
+        self.name = name
+        self._parts: list[str] = []
+        self._slots: list[tuple[int, str, Optional[CompiledTemplate], bool]] = []
+        previous_constant = False
+        for segment in segments:
+            kind = segment[0]
+            if kind == "text":
+                if previous_constant:
+                    # Inlined partials leave adjacent constants; merge them into one fragment.
+                    self._parts[-1] += segment[1]
+                else:
+                    self._parts.append(segment[1])
+            elif kind == "var":
+                self._slots.append((len(self._parts), segment[1], None, False))
+                self._parts.append("")
+            else:
+                _, flag, inverted, children = segment
+                section = CompiledTemplate(f"{name}#{flag}", children, fragments)
+                self._slots.append((len(self._parts), flag, section, inverted))
+                self._parts.append("")
+            previous_constant = kind == "text"
+        if fragments is not None:
+            # Identical constant fragments (shared headers, guards) are stored once.
+            self._parts = [fragments.setdefault(part, part) for part in self._parts]
+        names: list[str] = []
+        for _, variable, section, _ in self._slots:
+            names.extend(section.variables if section is not None else (variable,))
+        self.variables = tuple(dict.fromkeys(names))
+
+    def _value(self, values: Mapping[str, Any], variable: str) -> str:
+        try:
+            return str(values[variable])
+        except KeyError:
+            raise KeyError(f"Template '{self.name}' needs variable '{variable}'") from None
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        parts = self._parts.copy()
+        for position, variable, section, inverted in self._slots:
+            if section is None:
+                parts[position] = self._value(values, variable)
+            elif bool(values.get(variable)) != inverted:
+                parts[position] = section.render(values)
+        return "".join(parts)
+
+    def render_iter(self, values: Mapping[str, Any]) -> Iterator[str]:
+        """Yield constant fragments and substituted values in order, without joining them."""
+        slots = iter(self._slots)
+        next_slot = next(slots, None)
+        for position, part in enumerate(self._parts):
+            if next_slot is not None and next_slot[0] == position:
+                _, variable, section, inverted = next_slot
+                if section is None:
+                    yield self._value(values, variable)
+                elif bool(values.get(variable)) != inverted:
+                    yield from section.render_iter(values)
+                next_slot = next(slots, None)
+            else:
+                yield part
+
+
+class TemplateLoader:
+    """Find, compile and cache per-target templates.
+
+    Templates are looked up by name (`<name>.tmpl`, names may contain `/`)
+    in the override directory first (`override_dir` or
+    `NEVORA_TEMPLATE_DIR`), then in the built-in `translator/targets/templates`.
+    `content_hash()` covers every template that would be used, so cache keys
+    change when a user edits one.
+    """
+
+    def __init__(self, override_dir: Optional[str] = None) -> None:
+        override = override_dir or os.getenv("NEVORA_TEMPLATE_DIR")
+        self.search_path = ([Path(override)] if override else []) + [BUILTIN_TEMPLATE_DIR]
+        self._compiled: dict[str, CompiledTemplate] = {}
+        self._exists: dict[str, bool] = {}
+        self._fragments: dict[str, str] = {}
+        self._content_hash: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _find(self, name: str) -> Optional[Path]:
+        for directory in self.search_path:
+            candidate = directory / f"{name}{TEMPLATE_SUFFIX}"
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def source_path(self, name: str) -> Path:
+        path = self._find(name)
+        if path is None:
+            raise FileNotFoundError(f"No template '{name}{TEMPLATE_SUFFIX}' in {', '.join(str(d) for d in self.search_path)}")
+        return path
+
+    def has(self, name: str) -> bool:
+        exists = self._exists.get(name)
+        if exists is None:
+            exists = self._exists[name] = self._find(name) is not None
+        return exists
+
+    def get(self, name: str) -> CompiledTemplate:
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            with self._lock:
+                compiled = self._compiled.get(name)
+                if compiled is None:
+                    compiled = self._compiled[name] = CompiledTemplate(name, self._parse(name, ()), self._fragments)
+        return compiled
+
+    def _parse(self, name: str, including: tuple[str, ...]) -> list[Segment]:
+        if name in including:
+            raise ValueError(f"Template include cycle: {' -> '.join((*including, name))}")
+        source = self.source_path(name).read_text(encoding="utf-8")
+        if including and source.endswith("\n"):
+            # A partial's final newline belongs to the include line in its parent.
+            source = source[:-1]
+        root: list[Segment] = []
+        stack: list[tuple[str, bool, list[Segment]]] = []
+        current = root
+        cursor = 0
+        for match in _TOKEN.finditer(source):
+            sigil, token = match.group(1), match.group(2)
+            start, end = match.start(), match.end()
+            if sigil in ("#", "^", "/"):
+                # Section tags alone on a line drop the whole line, so they add no blank lines.
+                line_start = source.rfind("\n", 0, start) + 1
+                line_end = source.find("\n", end)
+                line_end = len(source) if line_end == -1 else line_end + 1
+                if line_start >= cursor and not source[line_start:start].strip() and not source[end:line_end].strip():
+                    start, end = line_start, line_end
+            if start > cursor:
+                current.append(("text", source[cursor:start]))
+            cursor = end
+            if sigil == ">":
+                current.extend(self._parse(token, (*including, name)))
+            elif sigil in ("#", "^"):
+                stack.append((token, sigil == "^", current))
+                current = []
+            elif sigil == "/":
+                if not stack or stack[-1][0] != token:
+                    raise ValueError(f"Template '{name}' closes section '{token}' that is not open")
+                flag, inverted, parent = stack.pop()
+                parent.append(("section", flag, inverted, current))
+                current = parent
+            else:
+                current.append(("var", token))
+        if stack:
+            raise ValueError(f"Template '{name}' leaves section '{stack[-1][0]}' open")
+        if cursor < len(source):
+            current.append(("text", source[cursor:]))
+        return root
+
+    def template_names(self) -> list[str]:
+        names = {
+            path.relative_to(directory).with_suffix("").as_posix()
+            for directory in self.search_path
+            if directory.is_dir()
+            for path in directory.rglob(f"*{TEMPLATE_SUFFIX}")
+        }
+        return sorted(names)
+
+    def content_hash(self) -> str:
+        """SHA-256 over the name and source of every template this loader resolves."""
+        if self._content_hash is None:
+            digest = sha256()
+            for name in self.template_names():
+                digest.update(name.encode("utf-8") + b"\0")
+                digest.update(self.source_path(name).read_bytes() + b"\0")
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+
+class TraceCollector:
+    """Collect duration events and write them as Chrome Trace Event Format JSON.
+
+    Timestamps come from `perf_counter` (as recorded by spans) shifted onto
+    the wall clock, so traces written by separate queue worker processes line
+    up when their events are concatenated. Each thread gets its own lane,
+    named after the thread, inside a lane per process.
+    """
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self._epoch_offset_s = time.time() - time.perf_counter()
+        self._events: list[dict[str, Any]] = []
+        self._threads: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def _us(self, perf_seconds: float) -> float:
+        return round((perf_seconds + self._epoch_offset_s) * 1_000_000, 3)
+
+    def complete(
+        self,
+        name: str,
+        started: float,
+        ended: float,
+        category: str = "stage",
+        args: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Record a complete ("X") event on the calling thread's lane."""
+        thread = threading.current_thread()
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._us(started),
+            "dur": round(max(0.0, ended - started) * 1_000_000, 3),
+            "pid": self.pid,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._threads.setdefault(int(thread.ident or 0), thread.name)
+            self._events.append(event)
+
+    def add_item(
+        self,
+        name: str,
+        started: float,
+        ended: float,
+        args: dict[str, Any],
+        stages: Iterable[tuple[str, float, float, int]] = (),
+    ) -> None:
+        """Record a batch item plus the span events (name, start, end, depth) recorded inside it."""
+        self.complete(name, started, ended, category="item", args=args)
+        for stage, stage_started, stage_ended, _depth in stages:
+            self.complete(stage, stage_started, stage_ended, category="stage")
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+        metadata: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": f"nevora-translator ({self.pid})"}}
+        ]
+        metadata.extend(
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}} for tid, name in sorted(threads.items())
+        )
+        return {"traceEvents": metadata + sorted(events, key=lambda event: event["ts"]), "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> str:
+        destination = Path(path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        return str(destination)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import atexit
+import json
+import queue
+import shutil
+import subprocess
+import threading
+from typing import Optional
+
+from translator import metrics
+
+# Compiles each snippet as a CommonJS module body with vm.compileFunction, as Node's
+# CJS loader does; nothing is executed. One JSON request/reply per line.
+NODE_WORKER_SOURCE = r"""
+"use strict";
+const readline = require("readline");
+const vm = require("vm");
+
+// Compiling the body as a function (not a string-wrapped script) means a snippet cannot close the wrapper.
+const MODULE_PARAMS = ["exports", "require", "module", "__filename", "__dirname"];
+
+readline.createInterface({ input: process.stdin, terminal: false }).on("line", (line) => {
+  let reply;
+  try {
+    const { code, filename } = JSON.parse(line);
+    // A hashbang is only legal at the very start, so comment it out (keeping line numbers).
+    const body = code.startsWith("#!") ? "//" + code : code;
+    vm.compileFunction(body, MODULE_PARAMS, { filename });
+    reply = { ok: true, message: "node check ok" };
+  } catch (error) {
+    reply = { ok: false, message: String((error && error.stack) || error).split("\n    at ")[0].trim() };
+  }
+  process.stdout.write(JSON.stringify(reply) + "\n");
+});
+"""
+
+# `node --check` on newer Node versions detects ES modules; vm.Script never does.
+_ESM_ERRORS = ("Cannot use import statement outside a module", "Unexpected token 'export'")
+
+
+class NodeCheckWorker:
+    """One long-lived `node` process that syntax-checks many snippets.
+
+    The process starts on the first `check()`. If it has exited or the pipe
+    breaks, it is restarted and the check retried once.
+    """
+
+    def __init__(self, executable: str = "node") -> None:
+        self.executable = executable
+        self.checks = 0
+        self.restarts = 0
+        self._process: Optional[subprocess.Popen[str]] = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen[str]:
+        return subprocess.Popen(
+            [self.executable, "-e", NODE_WORKER_SOURCE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+
+    def _request(self, payload: str) -> str:
+        if self._process is None or self._process.poll() is not None:
+            if self._process is not None:
+                self.restarts += 1
+                metrics.inc("nevora_verifier_restarts", verifier="node")
+            self._process = self._start()
+        assert self._process.stdin is not None and self._process.stdout is not None
+        try:
+            self._process.stdin.write(payload)
+            self._process.stdin.flush()
+            return self._process.stdout.readline()
+        except (BrokenPipeError, OSError, ValueError):
+            return ""
+
+    def check(self, code: str, filename: str = "[stdin]") -> tuple[bool, str]:
+        payload = json.dumps({"code": code, "filename": filename}) + "\n"
+        with self._lock:
+            for _ in range(2):
+                line = self._request(payload)
+                if line:
+                    self.checks += 1
+                    reply = json.loads(line)
+                    return bool(reply["ok"]), str(reply["message"])
+                self._stop()
+        raise RuntimeError("node verifier worker exited while checking")
+
+    def _stop(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.stdin is not None:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if process.stdout is not None:
+            process.stdout.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop()
+
+
+class VerifierPool:
+    """Persistent syntax checkers shared by `verify_output` and `verify_scaffold_build`.
+
+    JavaScript goes to up to `node_workers` long-lived Node processes, each
+    started on first demand; concurrent checks wait for an idle one. Python
+    compiles in process. Targets without a resident compiler (clang++) keep
+    one subprocess per check in the translator.
+    """
+
+    def __init__(self, node_workers: int = 2, node_executable: str = "node") -> None:
+        self.node_workers = max(1, node_workers)
+        self.node_executable = node_executable
+        self._idle: queue.LifoQueue[NodeCheckWorker] = queue.LifoQueue()
+        self._workers: list[NodeCheckWorker] = []
+        self._lock = threading.Lock()
+
+    def _acquire_node(self) -> NodeCheckWorker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._workers) < self.node_workers:
+                worker = NodeCheckWorker(self.node_executable)
+                self._workers.append(worker)
+                return worker
+        return self._idle.get()
+
+    def check_javascript(self, code: str, filename: str = "[stdin]") -> tuple[bool, str]:
+        worker = self._acquire_node()
+        try:
+            ok, message = worker.check(code, filename)
+        except RuntimeError:
+            return self._node_check_once(code)
+        finally:
+            self._idle.put(worker)
+        if not ok and any(marker in message for marker in _ESM_ERRORS):
+            return self._node_check_once(code)
+        return ok, message
+
+    def _node_check_once(self, code: str) -> tuple[bool, str]:
+        proc = subprocess.run([self.node_executable, "--check", "-"], input=code, text=True, capture_output=True)
+        return proc.returncode == 0, proc.stderr.strip() or "node check ok"
+
+    def check_python(self, code: str, filename: str = "<generated>") -> tuple[bool, str]:
+        try:
+            compile(code, filename, "exec")
+            return True, "python compile ok"
+        except Exception as exc:
+            return False, f"python compile failed: {exc}"
+
+    def node_available(self) -> bool:
+        return shutil.which(self.node_executable) is not None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "node_workers": len(self._workers),
+            "node_checks": sum(worker.checks for worker in self._workers),
+            "node_restarts": sum(worker.restarts for worker in self._workers),
+        }
+
+    def close(self) -> None:
+        """Stop every worker; the next check starts fresh ones."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            self._idle = queue.LifoQueue()
+        for worker in workers:
+            worker.close()
+
+
+_default_pool: Optional[VerifierPool] = None
+_default_lock = threading.Lock()
+
+
+def default_verifier_pool() -> VerifierPool:
+    """Process-wide pool shared by every translator; its workers are stopped at exit."""
+    global _default_pool
+    if _default_pool is None:
+        with _default_lock:
+            if _default_pool is None:
+                _default_pool = VerifierPool()
+                atexit.register(_default_pool.close)
+    return _default_pool
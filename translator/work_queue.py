@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from translator.artifacts import ArtifactWriter
+
+
+class SQLiteWorkQueue:
+    """Local SQLite-backed batch queue shared by any number of worker processes.
+
+    Items are leased with a visibility timeout: a worker that crashes or stalls
+    simply lets its lease expire and another worker picks the item up again.
+    Results are acked back into the same database so `queue report` can build
+    the usual batch report in input order.
+    """
+
+    PENDING = "pending"
+    LEASED = "leased"
+    DONE = "done"
+
+    def __init__(self, path: str, visibility_timeout_s: float = 300.0) -> None:
+        self.path = Path(path)
+        self.visibility_timeout_s = visibility_timeout_s
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                idx INTEGER PRIMARY KEY,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                lease_owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                result TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS items_status ON items(status, lease_expires)")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SQLiteWorkQueue":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def push(self, items: Iterable[dict[str, Any]]) -> int:
+        """Append items after any already queued; returns the number pushed."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute("SELECT COALESCE(MAX(idx), -1) FROM items").fetchone()
+            next_idx = int(row[0]) + 1
+            rows = [(next_idx + offset, json.dumps(item)) for offset, item in enumerate(items)]
+            self._conn.executemany("INSERT INTO items(idx, payload) VALUES (?, ?)", rows)
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def lease(self, worker_id: str, limit: int = 1) -> list[tuple[int, dict[str, Any]]]:
+        """Lease up to `limit` pending (or lease-expired) items for `worker_id`."""
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self._conn.execute(
+                """
+                SELECT idx, payload FROM items
+                WHERE status = ? OR (status = ? AND lease_expires < ?)
+                ORDER BY idx
+                LIMIT ?
+                """,
+                (self.PENDING, self.LEASED, now, max(1, limit)),
+            ).fetchall()
+            expires = now + self.visibility_timeout_s
+            self._conn.executemany(
+                "UPDATE items SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1 WHERE idx = ?",
+                [(self.LEASED, worker_id, expires, idx) for idx, _ in rows],
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return [(int(idx), json.loads(payload)) for idx, payload in rows]
+
+    def ack(self, idx: int, worker_id: str, result: dict[str, Any]) -> bool:
+        """Store the result for a leased item. Returns False if the lease was lost."""
+        cursor = self._conn.execute(
+            "UPDATE items SET status = ?, result = ?, lease_expires = NULL WHERE idx = ? AND status = ? AND lease_owner = ?",
+            (self.DONE, json.dumps(result), idx, self.LEASED, worker_id),
+        )
+        return cursor.rowcount == 1
+
+    def release(self, idx: int, worker_id: str) -> None:
+        """Return a leased item to the queue without a result."""
+        self._conn.execute(
+            "UPDATE items SET status = ?, lease_owner = NULL, lease_expires = NULL WHERE idx = ? AND status = ? AND lease_owner = ?",
+            (self.PENDING, idx, self.LEASED, worker_id),
+        )
+
+    def stats(self) -> dict[str, int]:
+        counts = {self.PENDING: 0, self.LEASED: 0, self.DONE: 0}
+        for status, count in self._conn.execute("SELECT status, COUNT(*) FROM items GROUP BY status"):
+            counts[str(status)] = int(count)
+        counts["total"] = sum(counts[key] for key in (self.PENDING, self.LEASED, self.DONE))
+        return counts
+
+    def results(self) -> list[dict[str, Any]]:
+        """Completed results ordered by item index."""
+        rows = self._conn.execute("SELECT result FROM items WHERE status = ? ORDER BY idx", (self.DONE,))
+        return [json.loads(result) for (result,) in rows]
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def drain_work_queue(
+    translator: Any,
+    queue: SQLiteWorkQueue,
+    default_target: str,
+    default_mode: str = "gameplay",
+    strict_safety: bool = False,
+    verify_generated: bool = False,
+    verify_build: bool = False,
+    default_source_language: str = "english",
+    include_explain: bool = False,
+    artifact_dir: str | None = None,
+    worker_id: Optional[str] = None,
+    max_items: Optional[int] = None,
+    poll_interval_s: float = 1.0,
+) -> dict[str, Any]:
+    """Lease, translate and ack items until the queue is drained.
+
+    Workers keep polling while other workers still hold leases, so items whose
+    lease expires (crashed or stalled workers) are picked up again.
+    """
+    owner = worker_id or default_worker_id()
+    artifacts = ArtifactWriter(root=artifact_dir) if artifact_dir else None
+
+    processed = 0
+    lost_leases = 0
+    try:
+        while max_items is None or processed < max_items:
+            leased = queue.lease(owner)
+            if not leased:
+                stats = queue.stats()
+                if stats[SQLiteWorkQueue.PENDING] == 0 and stats[SQLiteWorkQueue.LEASED] == 0:
+                    break
+                time.sleep(poll_interval_s)
+                continue
+
+            for idx, item in leased:
+                payload = translator._safe_translate_batch_item(
+                    idx,
+                    item,
+                    default_target,
+                    default_mode,
+                    strict_safety,
+                    verify_generated,
+                    verify_build,
+                    default_source_language,
+                    include_explain,
+                    artifacts,
+                )
+                payload["queue_worker"] = owner
+                if not queue.ack(idx, owner, payload):
+                    lost_leases += 1
+                processed += 1
+    finally:
+        if artifacts is not None:
+            artifacts.close()
+
+    return {"worker_id": owner, "processed": processed, "lost_leases": lost_leases, "queue": queue.stats()}